@@ -1,71 +1,408 @@
 import numpy as np
 import scipy.sparse as sp
-import sys
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-
-# Parameter setup
-a=0.0
-b=1.0
-n=41
-h=(b-a)/(n-1)
-de=1/(h*h)
-
-# Generate the centered difference differentiation matrix for the Laplacian
-nn=n-2
-cen=np.ones(nn*nn)*(4*de)
-hor=np.ones(nn*nn-1)*(-de)
-ver=np.ones(nn*(nn-1))*(-de)
-for i in range(nn-1):
-    hor[(i+1)*nn-1]=0
-A=sp.diags([cen,hor,hor,ver,ver],[0,1,-1,nn,-nn])
-
-# Right hand side: a vector of ones
-rhs=np.ones((nn*nn,1))
-
-# Solve for U using the conjugate gradient method
-TOL=1.e-4
-x_k=np.zeros((nn*nn,1))
-r_k=rhs
-p_k=r_k
-
-count=1
-while True:
-    alpha_k=np.dot(r_k.T,r_k)/np.dot(p_k.T,A*p_k)
-    x_k=x_k+alpha_k[0,0]*p_k
-    r_k_old=r_k
-    r_k=r_k-alpha_k[0,0]*(A*p_k)
-
-    rel_residual=np.linalg.norm(r_k)/np.linalg.norm(rhs)
-    print("iteration=%d, relative residual=%g" % (count, rel_residual))
-
-    if rel_residual < TOL:
-        break
-
-    beta_k=np.dot(r_k.T,r_k)/np.dot(r_k_old.T,r_k_old)
-
-    p_k=r_k+beta_k[0,0]*p_k
-
-    count+=1
-
-# Print grid spacing and condition number. This may get very expensive for a
-# big grid, since it uses a dense linear algebra routine to compute the
-# condition number.
-print("h=%g, condition number=%g\n" % (h,np.linalg.cond(A.todense())))
-
-# Assemble solution in a grid
-uu=np.zeros((n,n))
-for i in range(nn):
-    for j in range(nn):
-        uu[i+1,j+1]=x_k[i+nn*j,0]
-
-# Plot the solution
-xa=np.linspace(a,b,n)
-mgx,mgy=np.meshgrid(xa,xa);
-fig=plt.figure()
-ax = fig.add_subplot(111, projection='3d')  # 3D ekseni manuel oluşturma
-surf=ax.plot_surface(mgx,mgy,uu,rstride=1,cstride=1,linewidth=0)
-ax.set_xlabel('x')
-ax.set_ylabel('y')
-ax.set_zlabel('z')
-plt.show()
\ No newline at end of file
+import scipy.sparse.linalg as spla
+from scipy.linalg import eigvalsh_tridiagonal, get_blas_funcs
+
+
+def laplacian_matrix(n, a=0.0, b=1.0):
+    """
+    Laplace operatörü için merkezi fark matrisini oluşturur.
+
+    Parametreler:
+    n: Sınırlar dahil bir kenardaki grid noktası sayısı.
+    a, b: Bölgenin sınırları.
+
+    Döndürür:
+    (nn*nn, nn*nn) boyutunda seyrek matris (nn = n-2) ve grid aralığı h.
+    """
+    h = (b - a) / (n - 1)
+    de = 1 / (h * h)
+
+    nn = n - 2
+    cen = np.ones(nn * nn) * (4 * de)
+    hor = np.ones(nn * nn - 1) * (-de)
+    ver = np.ones(nn * (nn - 1)) * (-de)
+    hor[nn - 1::nn] = 0
+    A = sp.diags([cen, hor, hor, ver, ver], [0, 1, -1, nn, -nn], format="csr")
+    return A, h
+
+
+class LaplaceOperator:
+    """
+    5 noktalı Laplace şablonunu matrisi oluşturmadan uygulayan operatör.
+
+    Vektörün sıralaması laplacian_matrix ile aynıdır: k = i + nn*j.
+    """
+
+    def __init__(self, n, a=0.0, b=1.0):
+        self.n = n
+        self.a = a
+        self.b = b
+        self.nn = n - 2
+        self.h = (b - a) / (n - 1)
+        self.de = 1 / (self.h * self.h)
+        self.shape = (self.nn * self.nn, self.nn * self.nn)
+        self.dtype = np.dtype(float)
+
+    def matvec(self, x, out=None):
+        """
+        out = A x işlemini ara dizi ayırmadan hesaplar.
+        """
+        nn = self.nn
+        if out is None:
+            out = np.empty(self.shape[0])
+        u = x.reshape(nn, nn)
+        o = out.reshape(nn, nn)
+
+        np.multiply(u, 4.0, out=o)
+        np.subtract(o[:, 1:], u[:, :-1], out=o[:, 1:])
+        np.subtract(o[:, :-1], u[:, 1:], out=o[:, :-1])
+        np.subtract(o[1:, :], u[:-1, :], out=o[1:, :])
+        np.subtract(o[:-1, :], u[1:, :], out=o[:-1, :])
+        o *= self.de
+        return out
+
+    def diagonal(self):
+        return np.full(self.shape[0], 4 * self.de)
+
+    def tocsr(self):
+        A, _ = laplacian_matrix(self.n, self.a, self.b)
+        return A
+
+
+def _matvec_function(A):
+    """
+    Matris, seyrek matris, LinearOperator veya LaplaceOperator için
+    matvec(x, out) biçiminde bir fonksiyon döndürür. Yoğun matrislerde sonuç
+    doğrudan out'a yazılır; seyrek matris ve LinearOperator her çağrıda ara
+    dizi ayırır (scipy'nin genel A @ x arayüzü).
+    """
+    if isinstance(A, LaplaceOperator):
+        return A.matvec
+    if sp.issparse(A):
+        A = sp.csr_matrix(A, dtype=float)
+
+        def matvec(x, out):
+            out[:] = A @ x
+            return out
+        return matvec
+    if isinstance(A, np.ndarray):
+        def matvec(x, out):
+            return np.dot(A, x, out=out)
+        return matvec
+    if isinstance(A, spla.LinearOperator):
+        def matvec(x, out):
+            out[:] = A @ x
+            return out
+        return matvec
+    raise TypeError("A bir matris, seyrek matris veya lineer operatör olmalıdır.")
+
+
+def jacobi_preconditioner(A):
+    """
+    Jacobi (köşegen) ön koşullayıcısı: M = diag(A).
+    """
+    inv_diag = 1.0 / A.diagonal()
+
+    def apply(r, out):
+        return np.multiply(r, inv_diag, out=out)
+    return apply
+
+
+def _factored_preconditioner(A, diag, scale=1.0):
+    """
+    M = scale * (E + L) E^-1 (E + U) biçimindeki ön koşullayıcıları uygular.
+    E köşegen, L ve U ise A'nın kesin alt ve üst üçgen parçalarıdır.
+
+    Üçgen çarpanlar bir kez, sıralama ve pivotlama olmadan SuperLU ile
+    ayrıştırılır; üçgen bir matrisin LU ayrışımı dolgu üretmez ve her
+    uygulama iki derlenmiş üçgen çözüme indirgenir.
+    """
+    A = sp.csr_matrix(A)
+    options = {"permc_spec": "NATURAL", "diag_pivot_thresh": 0.0, "options": {"SymmetricMode": True}}
+    lower = spla.splu((sp.tril(A, k=-1) + sp.diags(diag)).tocsc(), **options)
+    upper = spla.splu((sp.triu(A, k=1) + sp.diags(diag)).tocsc(), **options)
+    factor = diag / scale
+
+    def apply(r, out):
+        y = lower.solve(r)
+        y *= factor
+        out[:] = upper.solve(y)
+        return out
+    return apply
+
+
+def incomplete_cholesky_preconditioner(A):
+    """
+    Sıfır dolgulu eksik Cholesky ön koşullayıcısı, M = (D + L) D^-1 (D + U).
+
+    D köşegeni d_i = a_ii - sum(a_ij^2 / d_j) (j < i) ile hesaplanır. Alt üçgen
+    satırları kesişmeyen matrislerde (5 noktalı şablon gibi) bu, IC(0) ile aynıdır.
+
+    Satırlar bağımlılık seviyelerine (wavefront) göre işlenir: bir seviyedeki
+    tüm d_j birlikte kesinleşir ve katkıları bağımlı satırlardan vektörel olarak
+    düşülür. 5 noktalı şablonda seviye sayısı yaklaşık 2·nn'dir.
+    """
+    A = sp.csr_matrix(A)
+    L = sp.tril(A, k=-1, format="csr")
+    # dependents[j]: d_j'ye bağlı satırlar i ve a_ij^2 değerleri
+    dependents = L.multiply(L).T.tocsr()
+    pending = np.diff(L.indptr)
+    d = A.diagonal().astype(float)
+
+    ready = np.flatnonzero(pending == 0)
+    while ready.size:
+        if np.any(d[ready] <= 0):
+            raise ValueError("Eksik Cholesky ayrışımı başarısız oldu, matris pozitif tanımlı olmayabilir.")
+        rows = dependents[ready]
+        targets = rows.indices
+        np.subtract.at(d, targets, rows.data / np.repeat(d[ready], np.diff(rows.indptr)))
+        np.subtract.at(pending, targets, 1)
+        ready = np.unique(targets[pending[targets] == 0])
+
+    return _factored_preconditioner(A, d)
+
+
+def ssor_preconditioner(A, omega=1.5):
+    """
+    SSOR ön koşullayıcısı, M = 1/(2-w) (D/w + L) (D/w)^-1 (D/w + U).
+    """
+    if not 0 < omega < 2:
+        raise ValueError("SSOR için omega (0, 2) aralığında olmalıdır.")
+    A = sp.csr_matrix(A)
+    return _factored_preconditioner(A, A.diagonal() / omega, scale=1 / (2 - omega))
+
+
+def cg_solve(A, b, M=None, tol=1e-4, maxiter=None, callback=None, x0=None, lanczos=False, return_ax=False):
+    """
+    Ön koşullu eşlenik gradyan yöntemi ile A x = b sistemini çözer.
+
+    Her iterasyonda tek bir matris-vektör çarpımı yapılır ve vektörler
+    yerinde güncellenir.
+
+    Parametreler:
+    A: Simetrik pozitif tanımlı matris, seyrek matris, LinearOperator veya LaplaceOperator.
+    b: Sağ taraf vektörü.
+    M: Ön koşullayıcı, apply(r, out) biçiminde (örn. jacobi_preconditioner(A)).
+    tol: Göreli artık ||r|| / ||b|| için yakınsama toleransı.
+    maxiter: Maksimum iterasyon sayısı (varsayılan: bilinmeyen sayısı).
+    callback: Her iterasyonda callback(iterasyon, x, göreli_artık) çağrılır.
+    x0: Başlangıç tahmini.
+    lanczos: True ise alpha ve beta katsayıları sözlükte saklanır
+        (bkz. cg_eigenvalue_estimate).
+    return_ax: True ise A x, ek matris-vektör çarpımı yapılmadan iterasyonlar
+        boyunca güncellenir ve sözlükte "Ax" alanında döndürülür.
+
+    Döndürür:
+    Çözüm vektörü ve iterasyon bilgilerini içeren sözlük. A bir arama
+    yönünde pozitif tanımlı değilse (p.Ap <= 0) iterasyon o noktada durur ve
+    sözlükte negative_curvature=True olur (kesik Newton için).
+    """
+    b = np.asarray(b, dtype=float).ravel()
+    n = b.shape[0]
+    if maxiter is None:
+        maxiter = n
+    matvec = _matvec_function(A)
+    axpy, dot, nrm2 = get_blas_funcs(("axpy", "dot", "nrm2"), (b,))
+
+    q = np.empty(n)
+    if x0 is None:
+        x = np.zeros(n)
+        r = b.copy()
+    else:
+        x = np.array(x0, dtype=float).ravel()
+        r = b - matvec(x, q)
+
+    b_norm = nrm2(b)
+    if b_norm == 0:
+        info = {"iterations": 0, "residual": 0.0, "converged": True, "negative_curvature": False}
+        if return_ax:
+            info["Ax"] = np.zeros(n)
+        return np.zeros(n), info
+
+    z = r if M is None else M(r, np.empty(n))
+    p = z.copy()
+    rz = dot(r, z)
+
+    alphas, betas = [], []
+    if return_ax:
+        # x0 verilmişse q, r hesaplanırken A x0 değerini tutar
+        ax = np.zeros(n) if x0 is None else q.copy()
+    negative_curvature = False
+    rel_residual = nrm2(r) / b_norm
+    converged = rel_residual < tol
+    count = 0
+    while not converged and count < maxiter:
+        count += 1
+        matvec(p, q)
+        curvature = dot(p, q)
+        if curvature <= 0:
+            negative_curvature = True
+            break
+        alpha = rz / curvature
+        if lanczos:
+            alphas.append(alpha)
+        axpy(p, x, a=alpha)
+        axpy(q, r, a=-alpha)
+        if return_ax:
+            axpy(q, ax, a=alpha)
+
+        rel_residual = nrm2(r) / b_norm
+        if callback is not None:
+            callback(count, x, rel_residual)
+        if rel_residual < tol:
+            converged = True
+            break
+
+        if M is not None:
+            M(r, z)
+        rz_new = dot(r, z)
+        beta = rz_new / rz
+        rz = rz_new
+        if lanczos:
+            betas.append(beta)
+
+        p *= beta
+        p += z
+
+    info = {"iterations": count, "residual": rel_residual, "converged": converged,
+            "negative_curvature": negative_curvature}
+    if lanczos:
+        info["alphas"] = np.array(alphas)
+        info["betas"] = np.array(betas)
+    if return_ax:
+        info["Ax"] = ax
+    return x, info
+
+
+def cg_eigenvalue_estimate(info):
+    """
+    CG katsayılarından Lanczos üç köşegenli matrisini kurarak (ön koşullu)
+    matrisin uç özdeğerlerini ve koşul sayısını tahmin eder.
+
+    Parametreler:
+    info: cg_solve(..., lanczos=True) tarafından döndürülen sözlük.
+
+    Döndürür:
+    En küçük özdeğer, en büyük özdeğer ve koşul sayısı tahmini.
+    """
+    alphas = info["alphas"]
+    betas = info["betas"][:len(alphas) - 1]
+    if len(alphas) == 0:
+        raise ValueError("Özdeğer tahmini için en az bir CG iterasyonu gereklidir.")
+
+    diag = 1.0 / alphas
+    diag[1:] += betas / alphas[:-1]
+    off = np.sqrt(betas) / alphas[:-1]
+    eigs = eigvalsh_tridiagonal(diag, off)
+    return eigs[0], eigs[-1], eigs[-1] / eigs[0]
+
+
+def lanczos_eigenvalue_estimate(A, k=50, seed=0):
+    """
+    Bağımsız Lanczos iterasyonu ile simetrik A matrisinin uç özdeğerlerini tahmin eder.
+
+    Parametreler:
+    A: Simetrik matris, seyrek matris, LinearOperator veya LaplaceOperator.
+    k: Lanczos adım sayısı.
+    seed: Başlangıç vektörü için rastgele tohum.
+
+    Döndürür:
+    En küçük özdeğer, en büyük özdeğer ve koşul sayısı tahmini.
+    """
+    matvec = _matvec_function(A)
+    n = A.shape[0]
+    k = min(k, n)
+
+    v = np.random.default_rng(seed).standard_normal(n)
+    v /= np.linalg.norm(v)
+    v_old = np.zeros(n)
+    w = np.empty(n)
+    diag, off = [], []
+    beta = 0.0
+
+    for _ in range(k):
+        matvec(v, w)
+        alpha = np.dot(w, v)
+        w -= alpha * v
+        w -= beta * v_old
+        diag.append(alpha)
+        beta = np.linalg.norm(w)
+        if beta < 1e-12:
+            break
+        off.append(beta)
+        v_old, v = v, w / beta
+
+    eigs = eigvalsh_tridiagonal(np.array(diag), np.array(off[:len(diag) - 1]))
+    return eigs[0], eigs[-1], eigs[-1] / eigs[0]
+
+
+def assemble_solution(x, n):
+    """
+    Çözüm vektörünü sınır değerleri sıfır olan (n, n) grid üzerine yerleştirir.
+    """
+    nn = n - 2
+    uu = np.zeros((n, n))
+    # x[i + nn*j] -> uu[i+1, j+1]: yeniden şekillendirme ve devrik birer görünümdür
+    uu[1:-1, 1:-1] = np.reshape(x, (nn, nn)).T
+    return uu
+
+
+def plot_solution(uu, a=0.0, b=1.0):
+    import matplotlib.pyplot as plt
+
+    n = uu.shape[0]
+    xa = np.linspace(a, b, n)
+    mgx, mgy = np.meshgrid(xa, xa)
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')  # 3D ekseni manuel oluşturma
+    ax.plot_surface(mgx, mgy, uu, rstride=1, cstride=1, linewidth=0)
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+    ax.set_zlabel('z')
+    plt.show()
+
+
+def main(exact_cond=False):
+    # Parameter setup
+    a = 0.0
+    b = 1.0
+    n = 41
+
+    # Generate the centered difference differentiation matrix for the Laplacian
+    A, h = laplacian_matrix(n, a, b)
+    nn = n - 2
+
+    # Right hand side: a vector of ones
+    rhs = np.ones(nn * nn)
+
+    # Solve for U using the conjugate gradient method
+    TOL = 1.e-4
+
+    def report(count, _x, rel_residual):
+        print("iteration=%d, relative residual=%g" % (count, rel_residual))
+
+    x_k, info = cg_solve(A, rhs, tol=TOL, callback=report, lanczos=True)
+
+    # Print grid spacing and condition number estimates side by side. The first
+    # comes from the Lanczos matrix built out of the CG coefficients, so it costs
+    # nothing extra; the second runs a standalone Lanczos iteration on A.
+    print("h=%g" % h)
+    print("%-22s %14s %14s %14s" % ("estimate", "lambda_min", "lambda_max", "condition"))
+    estimates = [("CG Lanczos", cg_eigenvalue_estimate(info)), ("Lanczos (k=50)", lanczos_eigenvalue_estimate(A))]
+    if exact_cond:
+        # This may get very expensive for a big grid, since it uses a dense
+        # linear algebra routine to compute the eigenvalues.
+        eigs = np.linalg.eigvalsh(A.toarray())
+        estimates.append(("exact (dense)", (eigs[0], eigs[-1], eigs[-1] / eigs[0])))
+    for name, (lam_min, lam_max, cond) in estimates:
+        print("%-22s %14g %14g %14g" % (name, lam_min, lam_max, cond))
+    print()
+
+    # Assemble solution in a grid and plot it
+    uu = assemble_solution(x_k, n)
+    plot_solution(uu, a, b)
+
+
+if __name__ == "__main__":
+    main()
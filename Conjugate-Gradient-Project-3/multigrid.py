@@ -0,0 +1,184 @@
+import time
+import numpy as np
+from scipy.sparse.linalg import splu
+from conjugate_gradient_laplace import LaplaceOperator, cg_solve, laplacian_matrix
+
+
+class PoissonMultigrid:
+    """
+    Birim kare üzerinde, sıfır Dirichlet sınır koşullu 5 noktalı Laplace
+    problemi için geometrik multigrid V-döngüsü.
+
+    Grid, (n-1) çift kaldığı sürece yarıya indirilir; en kaba gridde sistem
+    seyrek LU ayrışımıyla doğrudan çözülür. Bunun verimli olması için n - 1 = c·2^k
+    biçiminde olmalı ve en kaba grid max_coarse noktayı aşmamalıdır (ör. 41, 65,
+    129, 1025); aksi halde ValueError verilir. Yumuşatıcı olarak kırmızı-siyah Gauss-Seidel kullanılır;
+    ön yumuşatma kırmızı-siyah, son yumuşatma siyah-kırmızı sırayla yapıldığından
+    V-döngüsü simetriktir ve CG için ön koşullayıcı olarak kullanılabilir.
+    """
+
+    def __init__(self, n, a=0.0, b=1.0, pre_smooth=2, post_smooth=2, coarsest=9, max_coarse=65):
+        self.n = n
+        self.nn = n - 2
+        self.pre_smooth = pre_smooth
+        self.post_smooth = post_smooth
+
+        # Grid hiyerarşisi: her seviyede sınırlar dahil (n, n) boyutlu çalışma dizileri
+        self.levels = []
+        m = n
+        h = (b - a) / (n - 1)
+        while True:
+            self.levels.append({
+                "n": m,
+                "h2": h * h,
+                "u": np.zeros((m, m)),
+                "f": np.zeros((m, m)),
+                "r": np.zeros((m, m)),
+            })
+            if (m - 1) % 2 != 0 or m <= coarsest:
+                break
+            m = (m - 1) // 2 + 1
+            h *= 2
+
+        coarse = self.levels[-1]
+        if coarse["n"] > max_coarse:
+            raise ValueError(f"n={n} için en kaba grid {coarse['n']} noktada kalıyor (sınır {max_coarse}); "
+                             f"n - 1 = c·2^k olacak şekilde bir n seçin.")
+        # En kaba grid için bir kez ayrıştırılmış seyrek LU
+        A_c, _ = laplacian_matrix(coarse["n"], 0.0, np.sqrt(coarse["h2"]) * (coarse["n"] - 1))
+        self._coarse_lu = splu(A_c.tocsc())
+
+    def _smooth(self, level, order):
+        u, f, h2, m = level["u"], level["f"], level["h2"], level["n"]
+        for si, sj in order:
+            for ti, tj in ((si, sj), (3 - si, 3 - sj)):
+                rows, cols = slice(ti, m - 1, 2), slice(tj, m - 1, 2)
+                u[rows, cols] = 0.25 * (
+                    h2 * f[rows, cols]
+                    + u[ti - 1:m - 2:2, cols] + u[ti + 1:m:2, cols]
+                    + u[rows, tj - 1:m - 2:2] + u[rows, tj + 1:m:2]
+                )
+
+    def _residual(self, level):
+        u, f, r = level["u"], level["f"], level["r"]
+        r[1:-1, 1:-1] = f[1:-1, 1:-1] - (
+            4 * u[1:-1, 1:-1] - u[:-2, 1:-1] - u[2:, 1:-1] - u[1:-1, :-2] - u[1:-1, 2:]
+        ) / level["h2"]
+
+    @staticmethod
+    def _restrict(r, f_coarse):
+        # Tam ağırlıklı (full weighting) kısıtlama
+        f_coarse[1:-1, 1:-1] = (
+            4 * r[2:-1:2, 2:-1:2]
+            + 2 * (r[1:-2:2, 2:-1:2] + r[3::2, 2:-1:2] + r[2:-1:2, 1:-2:2] + r[2:-1:2, 3::2])
+            + r[1:-2:2, 1:-2:2] + r[3::2, 1:-2:2] + r[1:-2:2, 3::2] + r[3::2, 3::2]
+        ) / 16
+
+    @staticmethod
+    def _prolong_add(c, u):
+        # İki doğrusal (bilinear) uzatma ile kaba düzeltmeyi ince gride ekler
+        u[::2, ::2] += c
+        u[1::2, ::2] += 0.5 * (c[:-1, :] + c[1:, :])
+        u[::2, 1::2] += 0.5 * (c[:, :-1] + c[:, 1:])
+        u[1::2, 1::2] += 0.25 * (c[:-1, :-1] + c[1:, :-1] + c[:-1, 1:] + c[1:, 1:])
+
+    def vcycle(self, k=0):
+        """
+        k. seviyede, o seviyenin u ve f dizileri üzerinde bir V-döngüsü uygular.
+        """
+        level = self.levels[k]
+        if k == len(self.levels) - 1:
+            m = level["n"] - 2
+            level["u"][1:-1, 1:-1] = self._coarse_lu.solve(level["f"][1:-1, 1:-1].ravel()).reshape(m, m)
+            return
+
+        for _ in range(self.pre_smooth):
+            self._smooth(level, ((1, 1), (1, 2)))
+        self._residual(level)
+
+        coarse = self.levels[k + 1]
+        self._restrict(level["r"], coarse["f"])
+        coarse["u"].fill(0.0)
+        self.vcycle(k + 1)
+        self._prolong_add(coarse["u"], level["u"])
+
+        for _ in range(self.post_smooth):
+            self._smooth(level, ((1, 2), (1, 1)))
+
+    def preconditioner(self):
+        """
+        cg_solve için apply(r, out) biçiminde V-döngüsü ön koşullayıcısı döndürür.
+        """
+        nn = self.nn
+        top = self.levels[0]
+
+        def apply(r, out):
+            top["f"][1:-1, 1:-1] = r.reshape(nn, nn)
+            top["u"].fill(0.0)
+            self.vcycle()
+            out.reshape(nn, nn)[:] = top["u"][1:-1, 1:-1]
+            return out
+        return apply
+
+    def solve(self, rhs, tol=1e-8, maxiter=100, callback=None):
+        """
+        Yalnızca V-döngüleri ile A x = rhs sistemini çözer.
+
+        Döndürür:
+        Çözüm vektörü ve iterasyon bilgilerini içeren sözlük (cg_solve ile aynı biçimde).
+        """
+        nn = self.nn
+        top = self.levels[0]
+        top["f"][1:-1, 1:-1] = np.asarray(rhs, dtype=float).reshape(nn, nn)
+        top["u"].fill(0.0)
+        b_norm = np.linalg.norm(top["f"])
+
+        count = 0
+        converged = False
+        rel_residual = 1.0
+        while count < maxiter:
+            count += 1
+            self.vcycle()
+            self._residual(top)
+            rel_residual = np.linalg.norm(top["r"]) / b_norm
+            if callback is not None:
+                callback(count, top["u"], rel_residual)
+            if rel_residual < tol:
+                converged = True
+                break
+
+        x = top["u"][1:-1, 1:-1].ravel()
+        return x, {"iterations": count, "residual": rel_residual, "converged": converged}
+
+
+def benchmark(sizes=(41, 81, 161, 321, 641), tol=1e-8):
+    """
+    CG, multigrid ön koşullu CG ve tek başına multigrid için süre ve
+    iterasyon sayılarını grid boyutuna göre raporlar.
+    """
+    print("%6s %10s | %14s | %14s | %14s" % ("n", "unknowns", "CG", "MG-PCG", "MG"))
+    for n in sizes:
+        nn = n - 2
+        rhs = np.ones(nn * nn)
+        row = []
+
+        A, _ = laplacian_matrix(n)
+        start = time.perf_counter()
+        _, info = cg_solve(A, rhs, tol=tol)
+        row.append((info["iterations"], time.perf_counter() - start))
+
+        start = time.perf_counter()
+        mg = PoissonMultigrid(n)
+        _, info = cg_solve(LaplaceOperator(n), rhs, M=mg.preconditioner(), tol=tol)
+        row.append((info["iterations"], time.perf_counter() - start))
+
+        start = time.perf_counter()
+        mg = PoissonMultigrid(n)
+        _, info = mg.solve(rhs, tol=tol)
+        row.append((info["iterations"], time.perf_counter() - start))
+
+        print("%6d %10d | " % (n, nn * nn) + " | ".join("%4d / %7.3fs" % cell for cell in row))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -5,12 +5,12 @@ GOLDEN_RATIO = (1 + np.sqrt(5)) / 2
 EPSILON = 1e-8  
 
 def f(x):
-    if abs(x) < EPSILON:
-        x = np.sign(x) * EPSILON  # x'in işaretine göre küçük bir epsilon ekle
+    # x'in işaretine göre küçük bir epsilon ekle (dizilerde eleman bazında)
+    x = np.where(np.abs(x) < EPSILON, np.sign(x) * EPSILON, x)
     return 0.65 - (0.75 / (1 + x**2)) - 0.65 * np.arctan(1 / x)
 
 # Altın Oran Arama Yöntemi (Bracketing Method)
-def bracketing_method(f, a, b, tol=1e-6, max_iter=100, verbose=True):
+def bracketing_method(f, a, b, tol=1e-6, max_iter=100, verbose=True, trace=None):
     """
     Altın Oran Arama Yöntemi kullanarak f fonksiyonunun minimumunu bulur.
     
@@ -21,6 +21,7 @@ def bracketing_method(f, a, b, tol=1e-6, max_iter=100, verbose=True):
     tol: Yakınsama toleransı
     max_iter: Maksimum iterasyon sayısı
     verbose: İterasyon detaylarını yazdırmak için
+    trace: İterasyonları kaydetmek için isteğe bağlı kayıtçı (örn. IterationTrace)
     
     Döndürür:
     Minimum nokta tahmini ve bu noktadaki fonksiyon değeri
@@ -61,6 +62,10 @@ def bracketing_method(f, a, b, tol=1e-6, max_iter=100, verbose=True):
             x1 = b - (b - a) / GOLDEN_RATIO  
             f1 = f(x1)  
 
+        if trace is not None:
+            best_x, best_f = (x1, f1) if f1 <= f2 else (x2, f2)
+            trace.record(iteration, best_x, best_f, step=b - a)
+
     # Yakınsama kontrolü
     if verbose:
         if abs(b - a) <= tol:
@@ -68,9 +73,12 @@ def bracketing_method(f, a, b, tol=1e-6, max_iter=100, verbose=True):
         else:
             print("Maksimum iterasyon sayısına ulaşıldı, yakınsama sağlanamadı.")
 
-    # Yakınsama sağlandıktan sonra aralığın ortası minimum nokta olarak döndürülür
-    min_point = (a + b) / 2
-    min_value = f(min_point)  # Bu noktadaki fonksiyon değeri hesaplanır
+    # Yakınsama sağlandıktan sonra aralıkta zaten değerlendirilmiş en iyi nokta
+    # döndürülür; böylece sonda ek bir f çağrısı yapılmaz
+    if f1 <= f2:
+        min_point, min_value = x1, f1
+    else:
+        min_point, min_value = x2, f2
 
     if verbose:
         print(f"Tahmin edilen minimum nokta: x = {min_point:.12f}, f(x) = {min_value:.12f}")
@@ -83,13 +91,93 @@ def bracketing_method(f, a, b, tol=1e-6, max_iter=100, verbose=True):
 
     return min_point, min_value
 
+def bracketing_method_batch(f, a, b, tol=1e-6, max_iter=100):
+    """
+    Altın Oran Arama Yöntemini birçok bağımsız aralık için aynı anda uygular.
+
+    f, NumPy ile vektörleştirilmiş olmalıdır; her iterasyonda yalnızca henüz
+    yakınsamamış aralıkların yeni noktaları için tek bir f çağrısı yapılır.
+
+    Parametreler:
+    f: Minimum bulunacak (vektörleştirilmiş) amaç fonksiyonu
+    a: Aralık başlangıçları dizisi
+    b: Aralık sonları dizisi
+    tol: Yakınsama toleransı
+    max_iter: Maksimum iterasyon sayısı
+
+    Döndürür:
+    Minimum nokta tahminleri, bu noktalardaki fonksiyon değerleri ve
+    her aralık için iterasyon sayıları (diziler)
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    a, b = a.ravel().copy(), b.ravel().copy()
+
+    # Hatalı parametre kontrolleri
+    if np.any(a >= b):
+        raise ValueError("Geçersiz aralık: 'a' değerleri 'b' değerlerinden küçük olmalıdır.")
+    if tol <= 0:
+        raise ValueError("Tolerans pozitif olmalıdır.")
+    if max_iter <= 0:
+        raise ValueError("Maksimum iterasyon sayısı pozitif olmalıdır.")
+
+    x1 = b - (b - a) / GOLDEN_RATIO
+    x2 = a + (b - a) / GOLDEN_RATIO
+    values = f(np.concatenate([x1, x2]))
+    f1, f2 = values[:a.size].astype(float), values[a.size:].astype(float)
+
+    iterations = np.zeros(a.size, dtype=int)
+    active = np.flatnonzero(np.abs(b - a) > tol)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        iterations[active] += 1
+
+        # f1 > f2 ise minimum sağdadır (a güncellenir), değilse soldadır (b güncellenir)
+        right = f1[active] > f2[active]
+        r, l = active[right], active[~right]
+
+        a[r] = x1[r]
+        x1[r] = x2[r]
+        f1[r] = f2[r]
+        x2[r] = a[r] + (b[r] - a[r]) / GOLDEN_RATIO
+
+        b[l] = x2[l]
+        x2[l] = x1[l]
+        f2[l] = f1[l]
+        x1[l] = b[l] - (b[l] - a[l]) / GOLDEN_RATIO
+
+        # Her aktif aralık için tek yeni nokta, tek bir vektörleştirilmiş çağrı
+        new_points = np.concatenate([x2[r], x1[l]])
+        new_values = f(new_points)
+        f2[r] = new_values[:r.size]
+        f1[l] = new_values[r.size:]
+
+        active = active[np.abs(b[active] - a[active]) > tol]
+
+    # Skaler sürümdeki gibi her aralıkta zaten değerlendirilmiş en iyi nokta
+    # döndürülür; sonda ek bir f çağrısı yapılmaz
+    left_best = f1 <= f2
+    min_points = np.where(left_best, x1, x2)
+    min_values = np.where(left_best, f1, f2)
+    return min_points, min_values, iterations
+
 # Altın Oran Arama yönteminin örnek kullanımı
 def main():
+    # optimization paketi (Projects-Code) yoksa önbelleksiz f kullanılır
+    try:
+        from optimization import EvaluationCache
+    except ImportError:
+        EvaluationCache = None
+
     try:
         # Başlangıç aralığı [a, b]
         a, b = -2.0, 2.0
-        min_point, min_value = bracketing_method(f, a, b, tol=1e-12, max_iter=100, verbose=True)
+        cached_f = f if EvaluationCache is None else EvaluationCache(f)
+        min_point, min_value = bracketing_method(cached_f, a, b, tol=1e-12, max_iter=100, verbose=True)
         print(f"\nSonuç: Tahmin edilen minimum nokta: x = {min_point:.12f}, f(x) = {min_value:.12f}")
+        if EvaluationCache is not None:
+            print(f"Fonksiyon değerlendirmeleri: {cached_f.stats()}")
     except ValueError as e:
         print(f"Hata: {e}")
 
@@ -0,0 +1,38 @@
+import time
+import numpy as np
+from optimization import function, gradient
+from optimization.fletcher_reeves import fletcher_reeves_method, fletcher_reeves_batch, REASON_NAMES
+from optimization.line_search import backtracking_armijo
+
+
+def benchmark_batch(n_points=2000, tol=1e-5, max_iter=100, seed=0):
+    """
+    Toplu ve tek tek Fletcher-Reeves çalıştırmalarının verimini karşılaştırır.
+
+    İki sürüm de Armijo doğrusal aramasını kullanır: birim Hessian adımı
+    (fixed_step) bu fonksiyonda ıraksar ve her satır max_iter'e kadar çalışır,
+    bu durumda yakınsayan satırların maskelenmesi hiç ölçülmez.
+    """
+    rng = np.random.default_rng(seed)
+    X0 = rng.uniform(-10, 10, size=(n_points, 2))
+
+    start = time.perf_counter()
+    for x0 in X0:
+        fletcher_reeves_method(function, gradient, x0, tol, max_iter, line_search=backtracking_armijo)
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    X, iterations, reasons = fletcher_reeves_batch(function, gradient, X0, tol, max_iter, line_search="armijo")
+    batch_time = time.perf_counter() - start
+
+    print(f"Nokta sayısı: {n_points}")
+    print(f"Tek tek: {single_time:.3f} s ({n_points / single_time:.0f} nokta/s)")
+    print(f"Toplu:   {batch_time:.3f} s ({n_points / batch_time:.0f} nokta/s)")
+    print(f"Hızlanma: {single_time / batch_time:.1f}x")
+    print(f"Ortalama iterasyon: {iterations.mean():.2f} (en fazla {iterations.max()})")
+    for code, name in enumerate(REASON_NAMES):
+        print(f"    {name}: {np.count_nonzero(reasons == code)}")
+
+
+if __name__ == "__main__":
+    benchmark_batch()
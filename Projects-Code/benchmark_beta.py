@@ -0,0 +1,49 @@
+import time
+from functools import partial
+import numpy as np
+from optimization import IterationTrace, fletcher_reeves_method, problems
+from optimization.fletcher_reeves import BETA_METHODS
+from optimization.line_search import strong_wolfe
+
+# (ad, restart_interval, powell_threshold)
+RESTART_POLICIES = (("her 10", 10, None), ("boyut", None, None), ("Powell", None, 0.2))
+
+
+def _rosenbrock_problems():
+    for name, d, func, grad in (("rosenbrock", 2, problems.rosenbrock, problems.rosenbrock_gradient),
+                                ("rosenbrock", 32, problems.rosenbrock, problems.rosenbrock_gradient),
+                                ("extended_rosenbrock", 1000, problems.extended_rosenbrock,
+                                 problems.extended_rosenbrock_gradient)):
+        x0 = np.ones(d)
+        x0[0::2] = -1.2
+        yield f"{name}/{d}", func, grad, x0
+
+
+def benchmark_beta(gtol=1e-5, max_iter=5000):
+    """
+    Beta formüllerini ve yeniden başlatma politikalarını Rosenbrock tipi
+    problemlerde ||g|| < gtol olana kadarki iterasyon sayısı, fonksiyon
+    değerlendirmesi ve süre açısından karşılaştırır. gtol'e ulaşılamayan
+    çalışmalar "-" ile gösterilir.
+    """
+    line_search = partial(strong_wolfe, c2=0.1)
+    cases = list(_rosenbrock_problems())
+    print("%-16s | " % "beta / yeniden" + " | ".join("%24s" % name for name, *_ in cases))
+    for beta in BETA_METHODS:
+        for policy, restart_interval, powell_threshold in RESTART_POLICIES:
+            row = []
+            for _, func, grad, x0 in cases:
+                trace = IterationTrace(store_x=False)
+                start = time.perf_counter()
+                fletcher_reeves_method(func, grad, x0, tol=1e-12, max_iter=max_iter, line_search=line_search,
+                                       trace=trace, beta=beta, restart_interval=restart_interval,
+                                       powell_threshold=powell_threshold)
+                elapsed = time.perf_counter() - start
+                reached = np.flatnonzero(trace.column("grad_norm") < gtol)
+                iterations = "%d" % trace.column("iteration")[reached[0]] if len(reached) else "-"
+                row.append("%5s %6d %8.3fs" % (iterations, trace.nfev, elapsed))
+            print("%-16s | " % f"{beta} / {policy}" + " | ".join("%24s" % cell for cell in row))
+
+
+if __name__ == "__main__":
+    benchmark_beta()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+from optimization import IterationTrace, MemmapHistory, RingHistory, open_history
+
+
+def _record(trace, d, iterations):
+    trace.start()
+    x = np.zeros(d)
+    for i in range(iterations):
+        # Çözücüler gibi her iterasyonda yeni bir x dizisi üretilir
+        x = x + 1.0
+        trace.record(i, x, float(i))
+    trace.flush()
+    return trace.positions
+
+
+def benchmark_history(d=100_000, counts=(100, 400, 1600), max_in_memory=400):
+    """
+    x deposu seçeneklerinin tepe bellek kullanımını ve kayıt süresini
+    iterasyon sayısına göre karşılaştırır. Bellek içi depo max_in_memory
+    iterasyondan sonra atlanır.
+    """
+    path = os.path.join(tempfile.mkdtemp(), "trajectory.npy")
+    modes = (("bellek", lambda: IterationTrace()),
+             ("her 100.", lambda: IterationTrace(sample_every=100)),
+             ("halka m=16", lambda: IterationTrace(history=RingHistory(16))),
+             ("memmap", lambda: IterationTrace(history=MemmapHistory(path, chunk=16))))
+
+    print(f"d = {d}, tepe bellek (MiB) / süre")
+    print("%8s | " % "iter" + " | ".join("%18s" % name for name, _ in modes))
+    for count in counts:
+        row = []
+        for name, make_trace in modes:
+            if name == "bellek" and count > max_in_memory:
+                row.append("-")
+                continue
+            trace = make_trace()
+            tracemalloc.start()
+            start = time.perf_counter()
+            positions = _record(trace, d, count)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            trace.close()
+            del positions, trace
+            row.append("%8.1f %8.3fs" % (peak / 2**20, elapsed))
+        print("%8d | " % count + " | ".join("%18s" % cell for cell in row))
+
+    trajectory = open_history(path)
+    print(f"\nDiskteki yörünge yeniden açıldı: {trajectory.shape}, {type(trajectory).__name__}, "
+          f"{os.path.getsize(path) / 2**20:.1f} MiB")
+    del trajectory
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    benchmark_history()
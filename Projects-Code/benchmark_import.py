@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+# Her ölçüm yeni bir yorumlayıcıda yapılır; NumPy'nin kendi yükleme süresi ayrıca ölçülür
+_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import numpy
+numpy_done = time.perf_counter()
+import {module}
+done = time.perf_counter()
+heavy = [name for name in ("matplotlib", "tkinter", "scipy") if name in sys.modules]
+print(numpy_done - start, done - numpy_done, ",".join(heavy))
+"""
+
+
+def measure_import(module, repeat=5):
+    """
+    module'ün içe aktarma süresini (NumPy hariç) en iyi repeat ölçümle döndürür.
+
+    Döndürür:
+    (NumPy süresi, modül süresi, yüklenen ağır modüller) demeti.
+    """
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", _SCRIPT.format(module=module)],
+                                capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.split()
+        numpy_time, module_time = float(output[0]), float(output[1])
+        heavy = output[2] if len(output) > 2 else ""
+        if best is None or module_time < best[1]:
+            best = (numpy_time, module_time, heavy)
+    return best
+
+
+def benchmark_import(modules=("optimization", "optimization.viz", "optimization.gui", "matplotlib.pyplot"),
+                     limit=0.1):
+    """
+    Paket katmanlarının içe aktarma sürelerini raporlar ve çözücü çekirdeğinin
+    limit saniyenin altında yüklendiğini ve ağır bağımlılık yüklemediğini doğrular.
+    """
+    print(f"{'modül':<22}{'numpy (ms)':>12}{'modül (ms)':>12}  yüklenen ağır modüller")
+    results = {}
+    for module in modules:
+        numpy_time, module_time, heavy = measure_import(module)
+        results[module] = (module_time, heavy)
+        print(f"{module:<22}{numpy_time * 1e3:>12.1f}{module_time * 1e3:>12.1f}  {heavy or '-'}")
+
+    core_time, core_heavy = results[modules[0]]
+    if core_time >= limit or core_heavy:
+        raise SystemExit(f"Çözücü çekirdeği beklenenden yavaş veya ağır modül yüklüyor: "
+                         f"{core_time * 1e3:.1f} ms, {core_heavy or '-'}")
+    print(f"Çözücü çekirdeği {core_time * 1e3:.1f} ms içinde yüklendi (sınır {limit * 1e3:.0f} ms).")
+
+
+if __name__ == "__main__":
+    benchmark_import()
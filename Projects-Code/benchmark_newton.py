@@ -0,0 +1,91 @@
+import time
+import numpy as np
+from optimization import IterationTrace, backtracking_armijo, newtons_method
+from optimization.problems import rosenbrock, rosenbrock_gradient, rosenbrock_hessian, rosenbrock_hessian_sparse
+
+
+def _test_problem(d, mu=0.1, seed=0):
+    """
+    f(x) = 0.5 x'Ax - b'x + mu/4 sum(x^4): Hessian'ı A + 3 mu diag(x^2)
+    olan, yavaş değişen Hessian'lı bir test fonksiyonu.
+    """
+    rng = np.random.default_rng(seed)
+    Q = rng.standard_normal((d, d)) / np.sqrt(d)
+    A = Q @ Q.T + np.eye(d)
+    b = rng.standard_normal(d)
+
+    def func(x):
+        return 0.5 * x @ A @ x - b @ x + 0.25 * mu * np.sum(x ** 4)
+
+    def grad(x):
+        return A @ x - b + mu * x ** 3
+
+    def hessian(x):
+        h = A.copy()
+        h[np.diag_indices(d)] += 3 * mu * x ** 2
+        return h
+
+    return func, grad, hessian
+
+
+def benchmark_factorization(sizes=(100, 1000, 3000), tol=1e-8, max_iter=100):
+    """
+    Her iterasyonda np.linalg.solve ile saklanan Cholesky çarpanının yeniden
+    kullanımını (refactor_every) süre ve iterasyon sayısı açısından karşılaştırır.
+    """
+    modes = (("solve", None), ("cho k=1", 1), ("cho k=5", 5), ("cho k=max", max_iter))
+    # SciPy'nin ilk içe aktarma süresi ölçüme karışmasın
+    func, grad, hessian = _test_problem(2)
+    newtons_method(func, grad, hessian, np.ones(2), max_iter=1, refactor_every=1)
+
+    print("%6s | " % "d" + " | ".join("%22s" % name for name, _ in modes))
+    for d in sizes:
+        func, grad, hessian = _test_problem(d)
+        x0 = np.full(d, 2.0)
+        row = []
+        for _, k in modes:
+            trace = IterationTrace(store_x=False)
+            start = time.perf_counter()
+            x, _ = newtons_method(func, grad, hessian, x0, tol, max_iter, trace=trace, refactor_every=k)
+            elapsed = time.perf_counter() - start
+            row.append((int(trace.column("iteration")[-1]), np.linalg.norm(grad(x)), elapsed))
+        print("%6d | " % d + " | ".join("%3d %.0e %8.3fs" % cell for cell in row))
+
+
+def benchmark_sparse(sizes=(1000, 3000, 10000, 100000), tol=1e-8, max_iter=100, max_dense=3000):
+    """
+    Üç köşegenli Hessian'lı Rosenbrock fonksiyonunda yoğun Hessian'ı, seyrek
+    analitik Hessian'ı ve sütun renklendirmeli sonlu fark Hessian'ını
+    (hessian_sparsity) iterasyon, gradyan değerlendirmesi ve süre açısından
+    karşılaştırır. max_dense'den büyük boyutlarda yoğun çözüm atlanır.
+    """
+    import scipy.sparse as sp
+
+    modes = ("yoğun", "seyrek", "renkli FD")
+    # SciPy'nin ilk içe aktarma süresi ölçüme karışmasın
+    for hessian in (rosenbrock_hessian, rosenbrock_hessian_sparse):
+        newtons_method(rosenbrock, rosenbrock_gradient, hessian, np.full(3, 0.5), max_iter=1, refactor_every=1)
+    print("%7s | " % "d" + " | ".join("%22s" % name for name in modes))
+    for d in sizes:
+        x0 = np.full(d, 0.5)
+        pattern = sp.diags([np.ones(d - 1), np.ones(d), np.ones(d - 1)], [-1, 0, 1])
+        options = ({"hessian": rosenbrock_hessian}, {"hessian": rosenbrock_hessian_sparse},
+                   {"hessian": None, "hessian_sparsity": pattern})
+        row = []
+        for mode, extra in zip(modes, options):
+            if mode == "yoğun" and d > max_dense:
+                row.append("-")
+                continue
+            trace = IterationTrace(store_x=False)
+            start = time.perf_counter()
+            newtons_method(rosenbrock, rosenbrock_gradient, x0=x0, tol=tol, max_iter=max_iter,
+                           line_search=backtracking_armijo, trace=trace, refactor_every=1, **extra)
+            elapsed = time.perf_counter() - start
+            row.append("%3d %6d %8.3fs" % (trace.column("iteration")[-1], trace.ngev, elapsed))
+        print("%7d | " % d + " | ".join("%22s" % cell for cell in row))
+
+
+if __name__ == "__main__":
+    benchmark_factorization()
+    print()
+    benchmark_sparse()
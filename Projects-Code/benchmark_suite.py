@@ -0,0 +1,258 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from functools import partial
+import numpy as np
+from optimization import IterationTrace, problems
+from optimization.line_search import strong_wolfe
+from optimization.sweep import _CountingFunction, _load_module, resolve_method
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+# Bu alanlar deterministiktir; temel çizgiye göre her artış gerileme sayılır
+COUNT_FIELDS = ("iterations", "nfev", "ngev")
+
+MULTIDIMENSIONAL_METHODS = ("fletcher_reeves", "newton", "newton_cg", "trust_region", "lbfgs")
+ONE_DIMENSIONAL_METHODS = {
+    "bracketing": ("tol", {"a": -0.4, "b": 0.45}),
+    "quadratic": ("tolerance", {"x0": -0.4, "x1": 0.1, "x2": 0.45}),
+    "cubic": ("tolerance", {"x0": -0.4, "x1": -0.1, "x2": 0.2, "x3": 0.45}),
+}
+
+
+def _alternating(d, first=-1.2, second=1.0):
+    x0 = np.full(d, second)
+    x0[0::2] = first
+    return x0
+
+
+def _problems(quick=False):
+    """
+    (ad, boyut, func, grad, hessian, x0) demetlerini artan boyutla üretir.
+    """
+    def sizes(values):
+        return values[:2] if quick else values
+
+    for d in sizes((2, 8, 32)):
+        yield ("rosenbrock", d, problems.rosenbrock, problems.rosenbrock_gradient, problems.rosenbrock_hessian,
+               _alternating(d))
+    for d in sizes((10, 100, 1000)):
+        yield ("extended_rosenbrock", d, problems.extended_rosenbrock, problems.extended_rosenbrock_gradient,
+               problems.extended_rosenbrock_hessian, _alternating(d))
+    for d in sizes((2, 10, 100)):
+        yield ("rastrigin", d, problems.rastrigin, problems.rastrigin_gradient, problems.rastrigin_hessian,
+               np.full(d, 0.3))
+    for d in sizes((10, 100, 1000)):
+        yield ("ill_quadratic", d, *problems.ill_conditioned_quadratic(d, condition=1e4), np.zeros(d))
+    yield ("beale", 2, problems.beale, problems.beale_gradient, problems.beale_hessian, np.array([1.0, 1.0]))
+
+
+def _multidimensional_case(method, func, grad, hessian, x0, tol, max_iter):
+    solver, _ = resolve_method(method)
+    options = {"hessian": hessian} if method in ("newton", "trust_region") else {}
+    if method == "fletcher_reeves":
+        options["line_search"] = partial(strong_wolfe, c2=0.1)
+
+    def run():
+        trace = IterationTrace(store_x=False)
+        x, _ = solver(func, grad, x0=x0, tol=tol, max_iter=max_iter, trace=trace, **options)
+        return {"iterations": int(trace.column("iteration")[-1]), "nfev": trace.nfev, "ngev": trace.ngev,
+                "f": float(func(x)), "grad_norm": float(np.linalg.norm(grad(x)))}
+    return run
+
+
+def _one_dimensional_case(method, tol):
+    solver, _ = resolve_method(method)
+    tol_name, bracket = ONE_DIMENSIONAL_METHODS[method]
+
+    def func(t):
+        return problems.rastrigin(np.atleast_1d(t))
+
+    def run():
+        trace = IterationTrace(store_x=False)
+        counted = _CountingFunction(func)
+        output = solver(counted, verbose=False, trace=trace, **bracket, **{tol_name: tol})
+        x = output[0] if isinstance(output, tuple) else output
+        iterations = trace.column("iteration")
+        return {"iterations": int(iterations[-1]) if len(iterations) else 0, "nfev": counted.calls, "ngev": 0,
+                "f": float(func(x)) if x is not None else None, "grad_norm": None}
+    return run
+
+
+def _laplace_case(n, tol):
+    laplace = _load_module("Conjugate-Gradient-Project-3", "conjugate_gradient_laplace.py",
+                           "conjugate_gradient_laplace")
+    A = laplace.LaplaceOperator(n)
+    b = np.ones(A.shape[0])
+
+    def run():
+        x, info = laplace.cg_solve(A, b, tol=tol)
+        # x0 verilmediğinde her CG iterasyonu tek bir matris-vektör çarpımı yapar
+        return {"iterations": info["iterations"], "nfev": info["iterations"], "ngev": 0,
+                "f": float(0.5 * x @ A.matvec(x) - b @ x), "grad_norm": float(info["residual"] * np.linalg.norm(b))}
+    return run
+
+
+def benchmark_cases(quick=False, tol=1e-6, max_iter=1000):
+    """
+    Kıyaslama durumlarını (ad, çalıştırıcı) çiftleri olarak üretir. Adlar
+    "yöntem/problem/boyut" biçimindedir ve temel çizgi dosyasında anahtar
+    olarak kullanılır.
+    """
+    for name, d, func, grad, hessian, x0 in _problems(quick):
+        for method in MULTIDIMENSIONAL_METHODS:
+            yield f"{method}/{name}/{d}", _multidimensional_case(method, func, grad, hessian, x0, tol, max_iter)
+    for n in ((33, 65) if quick else (33, 65, 129)):
+        yield f"cg/laplace/{(n - 2) ** 2}", _laplace_case(n, tol)
+    for method in ONE_DIMENSIONAL_METHODS:
+        for tol_1d in ((1e-3, 1e-4) if quick else (1e-3, 1e-4, 1e-5)):
+            yield f"{method}/rastrigin_1d/tol={tol_1d:g}", _one_dimensional_case(method, tol_1d)
+
+
+def measure(run, repeat=5):
+    """
+    Bir durumu repeat kez çalıştırıp en iyi duvar saati süresini, ardından
+    tracemalloc altında ayrı bir çalıştırmayla tepe bellek kullanımını ölçer.
+
+    Döndürür:
+    Sayaçları, süreyi (s), tepe belleği (bayt) ve status alanını içeren sözlük.
+    """
+    try:
+        best = np.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            result = run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except (ValueError, ArithmeticError, np.linalg.LinAlgError) as e:
+        return {"status": "error", "message": f"{type(e).__name__}: {e}"}
+    result.update({"status": "ok", "time": best, "peak_memory": peak})
+    return result
+
+
+def run_suite(quick=False, repeat=5, pattern=None):
+    """
+    Tüm durumları çalıştırır ve {ad: ölçüm} sözlüğü döndürür.
+    """
+    results = {}
+    for name, run in benchmark_cases(quick):
+        if pattern is None or pattern in name:
+            results[name] = measure(run, repeat)
+    return results
+
+
+def save_baseline(path, results):
+    """
+    Sonuçları ortam bilgisiyle birlikte JSON temel çizgi dosyasına yazar.
+    """
+    data = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=1, ensure_ascii=False)
+
+
+def load_baseline(path):
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare(results, baseline, time_tolerance=0.5, memory_tolerance=0.10, min_time=5e-3):
+    """
+    Sonuçları temel çizgiyle karşılaştırır.
+
+    Parametreler:
+    results: run_suite çıktısı.
+    baseline: load_baseline ile okunan sözlük.
+    time_tolerance: Süre için izin verilen göreli artış; min_time'dan kısa
+        süreli farklar gürültü sayılır.
+    memory_tolerance: Tepe bellek için izin verilen göreli artış.
+
+    Döndürür:
+    {ad: [gerileyen alan açıklamaları]} sözlüğü; yalnızca gerileyen durumları içerir.
+    """
+    regressions = {}
+    for name, new in results.items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        if new["status"] != "ok" or old["status"] != "ok":
+            if new["status"] != "ok" and old["status"] == "ok":
+                regressions[name] = ["status ok -> error"]
+            continue
+        found = []
+        for field in COUNT_FIELDS:
+            if new[field] > old[field]:
+                found.append(f"{field} {old[field]} -> {new[field]}")
+        if new["time"] > old["time"] * (1 + time_tolerance) and new["time"] - old["time"] > min_time:
+            found.append(f"time x{new['time'] / old['time']:.2f}")
+        if new["peak_memory"] > old["peak_memory"] * (1 + memory_tolerance):
+            found.append(f"peak_memory x{new['peak_memory'] / old['peak_memory']:.2f}")
+        if found:
+            regressions[name] = found
+    return regressions
+
+
+def print_results(results, baseline=None, regressions=None, file=sys.stdout):
+    header = "%-42s %10s %6s %7s %7s %10s" % ("durum", "süre (ms)", "iter", "nfev", "ngev", "bellek KiB")
+    if baseline is not None:
+        header += " %8s  %s" % ("süre x", "gerileme")
+    print(header, file=file)
+    for name, result in results.items():
+        if result["status"] != "ok":
+            print("%-42s %s" % (name, result["message"]), file=file)
+            continue
+        row = "%-42s %10.3f %6d %7d %7d %10.1f" % (name, 1e3 * result["time"], result["iterations"], result["nfev"],
+                                                   result["ngev"], result["peak_memory"] / 1024)
+        if baseline is not None:
+            old = baseline["results"].get(name)
+            if old is None or old["status"] != "ok":
+                row += " %8s  %s" % ("-", "(temel çizgide yok)")
+            else:
+                row += " %8.2f  %s" % (result["time"] / old["time"], ", ".join(regressions.get(name, [])))
+        print(row, file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çözücüleri standart test fonksiyonları üzerinde kıyaslar.")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, help="sonuçları temel çizgi dosyasına yaz")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE,
+                        help="sonuçları temel çizgiyle karşılaştır; gerileme varsa çıkış kodu 1 olur")
+    parser.add_argument("--repeat", type=int, default=5, help="süre ölçümü için tekrar sayısı")
+    parser.add_argument("--quick", action="store_true", help="yalnızca küçük boyutları çalıştır")
+    parser.add_argument("--filter", help="yalnızca adında bu metin geçen durumları çalıştır")
+    parser.add_argument("--time-tolerance", type=float, default=0.5)
+    parser.add_argument("--memory-tolerance", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.quick, args.repeat, args.filter)
+    baseline = regressions = None
+    if args.compare is not None:
+        baseline = load_baseline(args.compare)
+        regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    print_results(results, baseline, regressions)
+    if args.save is not None:
+        save_baseline(args.save, results)
+        print(f"\nTemel çizgi yazıldı: {args.save}")
+    if regressions:
+        print(f"\n{len(regressions)} durumda gerileme var.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# Bu modül optimization paketine taşındı; eski içe aktarmalar için korunur.
+from optimization.iteration_trace import *  # noqa: F401,F403
@@ -0,0 +1,2 @@
+# Bu modül optimization paketine taşındı; eski içe aktarmalar için korunur.
+from optimization.line_search import *  # noqa: F401,F403
@@ -0,0 +1,53 @@
+"""
+Optimizasyon yöntemleri paketi.
+
+Çözücü çekirdeği yalnızca NumPy'ye bağlıdır; bu modül içe aktarıldığında
+matplotlib, tkinter ve SciPy yüklenmez. Çizim için optimization.viz, arayüz
+için optimization.gui, paralel tarama için optimization.sweep kullanılır.
+SciPy gerektiren yollar (Cholesky önbelleği, Newton-CG) ilk kullanımda yüklenir.
+"""
+from .derivatives import Var, make_gradient, make_hessian, make_hessp, make_sparse_hessian
+from .evaluation_cache import EvaluationCache
+from .fletcher_reeves import conjugate_beta, fletcher_reeves_batch, fletcher_reeves_method
+from .history import MemmapHistory, MemoryHistory, RingHistory, open_history
+from .iteration_trace import IterationTrace, OptimizationCancelled
+from .lbfgs import lbfgs_method
+from .line_search import backtracking_armijo, exact_quadratic, fixed_step, strong_wolfe
+from .newtons_method import (modified_cholesky, newton_cg_method, newtons_method, sparse_modified_cholesky,
+                             trust_region_newton_method)
+from .objective import Objective, fuse, split
+from .problems import function, gradient, hessian
+
+__all__ = [
+    "EvaluationCache",
+    "IterationTrace",
+    "MemmapHistory",
+    "MemoryHistory",
+    "Objective",
+    "OptimizationCancelled",
+    "RingHistory",
+    "Var",
+    "backtracking_armijo",
+    "conjugate_beta",
+    "exact_quadratic",
+    "fixed_step",
+    "fletcher_reeves_batch",
+    "fletcher_reeves_method",
+    "function",
+    "fuse",
+    "gradient",
+    "hessian",
+    "lbfgs_method",
+    "make_gradient",
+    "make_hessian",
+    "make_hessp",
+    "make_sparse_hessian",
+    "modified_cholesky",
+    "newton_cg_method",
+    "newtons_method",
+    "open_history",
+    "sparse_modified_cholesky",
+    "split",
+    "strong_wolfe",
+    "trust_region_newton_method",
+]
@@ -0,0 +1,199 @@
+"""
+Görüntü arka ucu gerektirmeyen komut satırı arayüzü.
+
+    python -m optimization spec.json [spec.toml ...] [--jobs N] [--profile] [--output sonuç.jsonl]
+
+Her spesifikasyon bir çalışmayı tanımlar:
+
+    {"id": "r1", "method": "lbfgs", "problem": "rosenbrock", "x0": [-1.2, 1.0],
+     "options": {"tol": 1e-8, "max_iter": 500, "line_search": "strong_wolfe"}}
+
+Tek boyutlu yöntemlerde (bracketing, quadratic, cubic) x0 yerine yöntemin
+kendi argümanları options içinde verilir (örn. {"a": -2, "b": 2}). Girdi bir
+JSON nesnesi, JSON listesi, JSON satırları (.jsonl veya "-" ile standart
+girdi) ya da TOML dosyası ([[run]] tabloları) olabilir. Her çalışmanın
+sonucu bir JSON satırı olarak yazılır.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+
+
+def _parse_text(text, source):
+    text = text.strip()
+    if not text:
+        return []
+    if source.endswith(".toml"):
+        try:
+            import tomllib
+        except ModuleNotFoundError:
+            raise ValueError("TOML dosyaları için Python 3.11 veya üzeri gereklidir.") from None
+        data = tomllib.loads(text)
+        return data.get("run", [data])
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        # JSON satırları: her satır ayrı bir spesifikasyon
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return data if isinstance(data, list) else [data]
+
+
+def load_specs(sources):
+    """
+    Dosya yollarından (veya standart girdi için "-") spesifikasyon listesi okur.
+    """
+    specs = []
+    for source in sources:
+        if source == "-":
+            specs.extend(_parse_text(sys.stdin.read(), source))
+        else:
+            with open(source, encoding="utf-8") as handle:
+                specs.extend(_parse_text(handle.read(), source))
+    return specs
+
+
+def _solver_options(options):
+    options = dict(options)
+    name = options.pop("line_search", None)
+    line_search_options = options.pop("line_search_options", {})
+    if name is not None:
+        from . import line_search
+        if name.startswith("_") or not hasattr(line_search, name):
+            raise ValueError(f"Bilinmeyen doğrusal arama: {name}")
+        options["line_search"] = partial(getattr(line_search, name), **line_search_options)
+    return options
+
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def run_spec(spec, profile=False):
+    """
+    Tek bir spesifikasyonu çalıştırır ve JSON'a yazılabilir sonuç sözlüğü döndürür.
+    Hatalı spesifikasyon ve çözücü hataları sonuç içinde status="error" olarak
+    bildirilir. Beklenmeyen bir hata (ör. bir programlama hatası) toplu çalışmayı
+    durdurmaz ama gizlenmez: yığın izi sonuca ("traceback") ve standart hataya yazılır.
+    """
+    from .iteration_trace import IterationTrace
+    from .problems import PROBLEMS
+    from .sweep import _CountingFunction, _init_worker, default_objective, resolve_method
+
+    timings = {}
+    start = time.perf_counter()
+    result = {"id": spec.get("id"), "method": spec.get("method"), "problem": spec.get("problem")}
+    try:
+        method = spec["method"]
+        solver, one_dimensional = resolve_method(method)
+        options = _solver_options(spec.get("options", {}))
+        if spec.get("problem") is not None:
+            if spec["problem"] not in PROBLEMS:
+                raise ValueError(f"Bilinmeyen problem: {spec['problem']}")
+            func, grad, hessian = PROBLEMS[spec["problem"]]
+        else:
+            _init_worker()
+            func, grad, hessian = default_objective(method)
+        trace = IterationTrace(store_x=False)
+        timings["setup"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if one_dimensional:
+            counted = _CountingFunction(func)
+            output = solver(counted, verbose=False, trace=trace, **options)
+            x = output[0] if isinstance(output, tuple) else output
+            if x is None:
+                raise ArithmeticError("Yöntem bir minimum tahmini döndürmedi.")
+            trace.nfev = counted.calls
+        else:
+            x0 = np.asarray(spec["x0"], dtype=float)
+            if method in ("newton", "trust_region"):
+                options.setdefault("hessian", hessian)
+            x, _ = solver(func, grad, x0=x0, trace=trace, **options)
+        timings["solve"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        iterations = trace.column("iteration")
+        result.update({
+            "status": "ok",
+            "x": _to_json(np.asarray(x)),
+            "f": _to_json(func(x)),
+            "iterations": int(iterations[-1]) if len(iterations) else 0,
+            "nfev": trace.nfev,
+            "ngev": trace.ngev,
+            "events": [message for _, message in trace.events],
+        })
+        timings["result"] = time.perf_counter() - start
+    except (KeyError, TypeError, ValueError, ArithmeticError, np.linalg.LinAlgError) as e:
+        result.update({"status": "error", "message": f"{type(e).__name__}: {e}"})
+    except Exception as e:
+        details = traceback.format_exc()
+        print(f"Beklenmeyen hata (id={result['id']}):\n{details}", file=sys.stderr)
+        result.update({"status": "error", "message": f"{type(e).__name__}: {e}", "traceback": details})
+    result["time"] = sum(timings.values())
+    if profile:
+        result["profile"] = timings
+    return result
+
+
+def run_specs(specs, jobs=1, profile=False):
+    """
+    Spesifikasyonları sırayla veya süreç havuzunda çalıştırır; sonuçları girdi sırasıyla üretir.
+    """
+    if jobs == 1:
+        for spec in specs:
+            yield run_spec(spec, profile)
+        return
+    from .sweep import _init_worker
+    chunksize = max(1, len(specs) // (4 * jobs))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+        yield from executor.map(partial(run_spec, profile=profile), specs, chunksize=chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m optimization",
+                                     description="Optimizasyon yöntemlerini spesifikasyon dosyalarından çalıştırır.")
+    parser.add_argument("specs", nargs="+", help="JSON, JSON satırları veya TOML dosyaları ('-' standart girdi)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="paralel işçi süreç sayısı (0: tüm çekirdekler)")
+    parser.add_argument("--profile", action="store_true", help="aşama sürelerini sonuçlara ve özete ekle")
+    parser.add_argument("--output", "-o", help="sonuç dosyası (varsayılan: standart çıktı)")
+    args = parser.parse_args(argv)
+
+    total_start = time.perf_counter()
+    specs = load_specs(args.specs)
+    load_time = time.perf_counter() - total_start
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+
+    output = sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8")
+    phases = {}
+    failures = 0
+    write_time = 0.0
+    try:
+        for result in run_specs(specs, jobs, args.profile):
+            failures += result["status"] != "ok"
+            for phase, seconds in result.get("profile", {}).items():
+                phases[phase] = phases.get(phase, 0.0) + seconds
+            start = time.perf_counter()
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            write_time += time.perf_counter() - start
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if args.profile:
+        elapsed = time.perf_counter() - total_start
+        print(f"çalışma: {len(specs)}, hata: {failures}, işçi: {jobs}, toplam: {elapsed:.3f} s "
+              f"({len(specs) / elapsed:.0f} çalışma/s)", file=sys.stderr)
+        print(f"    okuma: {load_time:.3f} s, yazma: {write_time:.3f} s", file=sys.stderr)
+        for phase, seconds in phases.items():
+            print(f"    {phase} (çalışmaların toplamı): {seconds:.3f} s", file=sys.stderr)
+    return 1 if failures else 0
@@ -0,0 +1,445 @@
+import warnings
+import numpy as np
+
+# Türev sağlayıcı: elle türetilmiş gradient()/hessian() yerine, NumPy ile
+# yazılmış bir func için gradyan, Hessian-vektör çarpımı ve yoğun Hessian üretir.
+#     grad = make_gradient(func)          # ters mod, olmazsa karmaşık adım / merkezi fark
+#     hessp = make_hessp(grad)            # hessp(x, v) = H(x) v, iki gradyan maliyeti
+#     hessian = make_hessian(grad)        # yoğun H(x), 2d gradyan maliyeti
+#     hessian = make_sparse_hessian(grad, sparsity)  # seyrek H(x), renk sayısı + 1 gradyan maliyeti
+
+
+def _unbroadcast(g, shape):
+    """
+    Yayınlama (broadcasting) ile büyüyen gradyanı işlenenin boyutuna indirger.
+    """
+    while g.ndim > len(shape):
+        g = g.sum(axis=0)
+    for axis, size in enumerate(shape):
+        if size == 1 and g.shape[axis] != 1:
+            g = g.sum(axis=axis, keepdims=True)
+    return g
+
+
+def _value(a):
+    return a.value if isinstance(a, Var) else a
+
+
+# Tek girişli ufunc'lar: (x, y, g) -> x'e göre gradyan katkısı, y = ufunc(x)
+_UNARY = {
+    np.negative: lambda x, y, g: -g,
+    np.positive: lambda x, y, g: g,
+    np.exp: lambda x, y, g: g * y,
+    np.expm1: lambda x, y, g: g * (y + 1),
+    np.log: lambda x, y, g: g / x,
+    np.log1p: lambda x, y, g: g / (1 + x),
+    np.sqrt: lambda x, y, g: g / (2 * y),
+    np.square: lambda x, y, g: 2 * g * x,
+    np.absolute: lambda x, y, g: g * np.sign(x),
+    np.sin: lambda x, y, g: g * np.cos(x),
+    np.cos: lambda x, y, g: -g * np.sin(x),
+    np.tan: lambda x, y, g: g * (1 + y * y),
+    np.arctan: lambda x, y, g: g / (1 + x * x),
+    np.sinh: lambda x, y, g: g * np.cosh(x),
+    np.cosh: lambda x, y, g: g * np.sinh(x),
+    np.tanh: lambda x, y, g: g * (1 - y * y),
+}
+
+# İki girişli ufunc'lar: (a, b, y, g) -> (a'ya göre, b'ye göre) gradyan katkıları
+_BINARY = {
+    np.add: (lambda a, b, y, g: g, lambda a, b, y, g: g),
+    np.subtract: (lambda a, b, y, g: g, lambda a, b, y, g: -g),
+    np.multiply: (lambda a, b, y, g: g * b, lambda a, b, y, g: g * a),
+    np.true_divide: (lambda a, b, y, g: g / b, lambda a, b, y, g: -g * a / (b * b)),
+    np.power: (lambda a, b, y, g: g * b * a ** (b - 1), lambda a, b, y, g: g * y * np.log(a)),
+    np.maximum: (lambda a, b, y, g: g * (a >= b), lambda a, b, y, g: g * (a < b)),
+    np.minimum: (lambda a, b, y, g: g * (a <= b), lambda a, b, y, g: g * (a > b)),
+}
+
+# Türevi sıfır olan (karşılaştırma vb.) ufunc'lar yalnızca değerler üzerinde çalışır
+_CONSTANT = {np.greater, np.greater_equal, np.less, np.less_equal, np.equal, np.not_equal,
+             np.sign, np.floor, np.ceil, np.isfinite}
+
+
+def _matmul_vjp(a, b, g):
+    """
+    a @ b için (a'ya göre, b'ye göre) gradyanlar; 1 ve 2 boyutlu işlenenler.
+    """
+    if a.ndim == 1 and b.ndim == 1:
+        return g * b, g * a
+    if a.ndim == 1:
+        return b @ g, np.outer(a, g)
+    if b.ndim == 1:
+        return np.outer(g, b), a.T @ g
+    return g @ b.T, a.T @ g
+
+
+class Var:
+    """
+    Ters mod otomatik türev için kayıt (tape) düğümü.
+
+    Bir NumPy dizisini sarar; aritmetik işlemler, indeksleme, ufunc'lar ve
+    np.sum/np.mean/np.dot/np.where çağrıları yeni düğümler üretir. Skaler bir
+    sonuç üzerinde backward() çağrıldığında tüm girişlerin grad alanı dolar.
+
+    Parametreler:
+    value: Düğümün değeri.
+    parents: (üst düğüm, vjp) ikilileri; vjp, çıkış gradyanını üst düğümün
+        gradyan katkısına dönüştürür.
+    """
+
+    __array_priority__ = 1000
+
+    def __init__(self, value, parents=()):
+        self.value = np.asarray(value, dtype=float)
+        self.parents = parents
+        self.grad = None
+
+    shape = property(lambda self: self.value.shape)
+    ndim = property(lambda self: self.value.ndim)
+    size = property(lambda self: self.value.size)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __repr__(self):
+        return f"Var({self.value!r})"
+
+    def __getitem__(self, index):
+        basic = all(isinstance(i, (int, slice)) or i is None or i is Ellipsis
+                    for i in (index if isinstance(index, tuple) else (index,)))
+
+        def vjp(g):
+            out = np.zeros_like(self.value)
+            if basic:
+                # Temel indeksleme tekrar eden eleman içermez, doğrudan atanabilir
+                out[index] = g
+            else:
+                np.add.at(out, index, g)
+            return out
+        return Var(self.value[index], ((self, vjp),))
+
+    @property
+    def T(self):
+        return Var(self.value.T, ((self, lambda g: g.T),))
+
+    def sum(self, axis=None):
+        def vjp(g):
+            if axis is not None:
+                g = np.expand_dims(g, axis)
+            return np.broadcast_to(g, self.value.shape)
+        return Var(self.value.sum(axis=axis), ((self, vjp),))
+
+    def mean(self, axis=None):
+        count = self.value.size if axis is None else self.value.shape[axis]
+        return self.sum(axis) / count
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in _CONSTANT:
+            return ufunc(*(_value(a) for a in inputs))
+        if ufunc is np.matmul:
+            a, b = inputs
+            av, bv = _value(a), _value(b)
+            parents = []
+            if isinstance(a, Var):
+                parents.append((a, lambda g: _matmul_vjp(av, bv, g)[0]))
+            if isinstance(b, Var):
+                parents.append((b, lambda g: _matmul_vjp(av, bv, g)[1]))
+            return Var(av @ bv, tuple(parents))
+        if len(inputs) == 1 and ufunc in _UNARY:
+            xv = inputs[0].value
+            y = ufunc(xv)
+            rule = _UNARY[ufunc]
+            return Var(y, ((inputs[0], lambda g: rule(xv, y, g)),))
+        if len(inputs) == 2 and ufunc in _BINARY:
+            a, b = inputs
+            av, bv = _value(a), _value(b)
+            y = ufunc(av, bv)
+            rule_a, rule_b = _BINARY[ufunc]
+            parents = []
+            if isinstance(a, Var):
+                parents.append((a, lambda g: _unbroadcast(rule_a(av, bv, y, g), av.shape)))
+            if isinstance(b, Var):
+                parents.append((b, lambda g: _unbroadcast(rule_b(av, bv, y, g), bv.shape)))
+            return Var(y, tuple(parents))
+        return NotImplemented
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func is np.sum or func is np.mean:
+            return getattr(args[0], func.__name__)(*args[1:], **kwargs)
+        if func is np.dot:
+            return np.matmul(*args)
+        if func is np.where:
+            condition, a, b = args
+            condition = np.asarray(_value(condition), dtype=bool)
+            av, bv = _value(a), _value(b)
+            parents = []
+            if isinstance(a, Var):
+                parents.append((a, lambda g: _unbroadcast(np.where(condition, g, 0.0), np.shape(av))))
+            if isinstance(b, Var):
+                parents.append((b, lambda g: _unbroadcast(np.where(condition, 0.0, g), np.shape(bv))))
+            return Var(np.where(condition, av, bv), tuple(parents))
+        return NotImplemented
+
+    __add__ = lambda self, other: np.add(self, other)
+    __radd__ = lambda self, other: np.add(other, self)
+    __sub__ = lambda self, other: np.subtract(self, other)
+    __rsub__ = lambda self, other: np.subtract(other, self)
+    __mul__ = lambda self, other: np.multiply(self, other)
+    __rmul__ = lambda self, other: np.multiply(other, self)
+    __truediv__ = lambda self, other: np.true_divide(self, other)
+    __rtruediv__ = lambda self, other: np.true_divide(other, self)
+    __pow__ = lambda self, other: np.power(self, other)
+    __rpow__ = lambda self, other: np.power(other, self)
+    __matmul__ = lambda self, other: np.matmul(self, other)
+    __rmatmul__ = lambda self, other: np.matmul(other, self)
+    __neg__ = lambda self: np.negative(self)
+    __pos__ = lambda self: self
+    __abs__ = lambda self: np.absolute(self)
+    __lt__ = lambda self, other: np.less(self, other)
+    __le__ = lambda self, other: np.less_equal(self, other)
+    __gt__ = lambda self, other: np.greater(self, other)
+    __ge__ = lambda self, other: np.greater_equal(self, other)
+
+    def backward(self):
+        """
+        Skaler düğümden geriye doğru gradyanları yayar.
+        """
+        if self.value.size != 1:
+            raise ValueError("Geri yayılım yalnızca skaler bir çıkıştan başlatılabilir.")
+
+        # Yinelemeli derinlik öncelikli arama ile topolojik sıra
+        order, visited, stack = [], set(), [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            stack.append((node, True))
+            for parent, _ in node.parents:
+                if id(parent) not in visited:
+                    stack.append((parent, False))
+
+        for node in order:
+            node.grad = None
+        self.grad = np.ones_like(self.value)
+        for node in reversed(order):
+            for parent, vjp in node.parents:
+                contribution = vjp(node.grad)
+                parent.grad = contribution if parent.grad is None else parent.grad + contribution
+
+
+def reverse_gradient(func, x):
+    """
+    Ters mod (tape) ile gradyan; maliyeti fonksiyon değerlendirmesinin sabit katıdır.
+    Fonksiyon kaydı bozan bir işlem kullanırsa (ör. float(), math.*) TypeError verir.
+    """
+    x = np.asarray(x, dtype=float)
+    v = Var(x)
+    y = func(v)
+    if not isinstance(y, Var):
+        raise TypeError("Fonksiyon çıkışı bir tape düğümü değil; ters mod türev kullanılamaz.")
+    y.backward()
+    return np.zeros_like(x) if v.grad is None else np.asarray(v.grad, dtype=float)
+
+
+def _evaluate_columns(func, X):
+    """
+    func'u (d, k) boyutlu X'in her sütununda değerlendirir. Fonksiyon bileşen
+    öncelikli vektörleştirilmişse (utils.function gibi) tek çağrı yeterlidir.
+    """
+    try:
+        with np.errstate(all="ignore"):
+            values = np.asarray(func(X))
+        if values.shape == (X.shape[1],):
+            return values
+    except (ValueError, IndexError, TypeError):
+        pass
+    return np.array([func(X[:, k]) for k in range(X.shape[1])])
+
+
+def complex_step_gradient(func, x, h=1e-20):
+    """
+    Karmaşık adım türevi: df/dx_i = Im f(x + i h e_i) / h. Sıfırlama hatası
+    olmadığından h çok küçük seçilebilir; func analitik olmalıdır (abs, max gibi
+    işlemler karmaşık sayılarda doğru sonuç vermez). Sanal kısım atılırsa
+    (ComplexWarning ya da gerçel çıkış, ör. np.linalg.norm, math.*) TypeError verir.
+    """
+    x = np.asarray(x, dtype=float)
+    d = x.shape[0]
+    X = x[:, None] + 1j * h * np.eye(d)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", np.exceptions.ComplexWarning)
+        try:
+            values = _evaluate_columns(func, X)
+        except np.exceptions.ComplexWarning as e:
+            raise TypeError("Fonksiyon karmaşık girişin sanal kısmını atıyor.") from e
+    if not np.iscomplexobj(values):
+        raise TypeError("Fonksiyon karmaşık giriş için gerçel değer döndürdü.")
+    return values.imag / h
+
+
+def central_difference_gradient(func, x, h=None):
+    """
+    Merkezi sonlu farklar, 2d fonksiyon değerlendirmesi (vektörleştirilmişse iki çağrı).
+    """
+    x = np.asarray(x, dtype=float)
+    d = x.shape[0]
+    if h is None:
+        h = np.cbrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+    E = np.diag(np.broadcast_to(h, (d,)).astype(float))
+    forward = _evaluate_columns(func, x[:, None] + E)
+    backward = _evaluate_columns(func, x[:, None] - E)
+    return (forward - backward) / (2 * np.diag(E))
+
+
+GRADIENT_METHODS = {
+    "reverse": reverse_gradient,
+    "complex": complex_step_gradient,
+    "central": central_difference_gradient,
+}
+
+
+def make_gradient(func, method="auto"):
+    """
+    func için grad(x) fonksiyonu üretir.
+
+    Parametreler:
+    func: NumPy ile yazılmış amaç fonksiyonu.
+    method: "reverse", "complex", "central" veya "auto". "auto" ilk çağrıda
+        sırasıyla ters mod, karmaşık adım ve merkezi farkı dener; sonucu merkezi
+        farkla uyuşan ilk yöntem sonraki çağrılarda da kullanılır.
+    """
+    if method != "auto":
+        if method not in GRADIENT_METHODS:
+            raise ValueError(f"Bilinmeyen türev yöntemi: {method}")
+        gradient_method = GRADIENT_METHODS[method]
+        return lambda x: gradient_method(func, x)
+
+    chosen = []
+
+    def grad(x):
+        if chosen:
+            return chosen[0](func, x)
+        # Tape'i veya sanal kısmı sessizce bozan fonksiyonları yakalamak için
+        # ilk gradyan bir kez merkezi farkla karşılaştırılır
+        reference = central_difference_gradient(func, x)
+        tolerance = 1e-4 * max(1.0, np.linalg.norm(reference))
+        for name in ("reverse", "complex"):
+            try:
+                g = GRADIENT_METHODS[name](func, x)
+            except (TypeError, ValueError, AttributeError):
+                continue
+            if np.all(np.isfinite(g)) and np.linalg.norm(g - reference) <= tolerance:
+                chosen.append(GRADIENT_METHODS[name])
+                return g
+        chosen.append(central_difference_gradient)
+        return reference
+
+    return grad
+
+
+def make_hessp(grad):
+    """
+    Gradyanın merkezi farkı ile Hessian-vektör çarpımı hessp(x, v) üretir.
+    """
+    def hessp(x, v):
+        x = np.asarray(x, dtype=float)
+        v_norm = np.linalg.norm(v)
+        if v_norm == 0:
+            return np.zeros_like(x)
+        eps = np.cbrt(np.finfo(float).eps) * (1 + np.linalg.norm(x)) / v_norm
+        return (grad(x + eps * v) - grad(x - eps * v)) / (2 * eps)
+    return hessp
+
+
+def make_hessian(grad):
+    """
+    Gradyanın merkezi farkları ile simetrik yoğun Hessian hessian(x) üretir.
+    """
+    def hessian(x):
+        x = np.asarray(x, dtype=float)
+        d = x.shape[0]
+        steps = np.cbrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+        h = np.empty((d, d))
+        for i in range(d):
+            e = np.zeros(d)
+            e[i] = steps[i]
+            h[:, i] = (grad(x + e) - grad(x - e)) / (2 * steps[i])
+        return 0.5 * (h + h.T)
+    return hessian
+
+
+def column_coloring(sparsity):
+    """
+    Seyreklik deseninin sütunlarını, aynı renkteki hiçbir iki sütunun ortak
+    sıfırdan farklı satırı olmayacak şekilde açgözlü olarak renklendirir
+    (Curtis-Powell-Reid).
+
+    Parametreler:
+    sparsity: (d, d) seyrek matris veya mantıksal dizi; sıfırdan farklı
+        elemanlar Hessian'ın olası sıfırdan farklı konumlarıdır.
+
+    Döndürür:
+    (d,) renk dizisi ve renk sayısı.
+    """
+    import scipy.sparse as sp
+
+    pattern = sp.csc_matrix(sparsity, dtype=bool)
+    pattern.eliminate_zeros()
+    # İki sütun, ortak bir satırları varsa çakışır: çakışma grafiği P^T P
+    conflicts = (pattern.T @ pattern).tocsr()
+    d = pattern.shape[1]
+    colors = np.full(d, -1, dtype=np.int64)
+    used = np.full(d + 1, -1, dtype=np.int64)
+    for j in range(d):
+        neighbours = conflicts.indices[conflicts.indptr[j]:conflicts.indptr[j + 1]]
+        used[colors[neighbours]] = j
+        color = 0
+        while used[color] == j:
+            color += 1
+        colors[j] = color
+    return colors, int(colors.max()) + 1 if d else 0
+
+
+def make_sparse_hessian(grad, sparsity):
+    """
+    Sütun renklendirmesi ve gradyanın ileri farkları ile seyrek Hessian
+    hessian(x) üretir. Her renk için tek bir gradyan değerlendirmesi yapılır;
+    bant genişliği b olan bir Hessian'da renk sayısı d'den bağımsız olarak
+    yaklaşık 2b+1'dir.
+
+    Döndürür:
+    scipy.sparse CSC matrisi döndüren hessian(x) fonksiyonu. hessian.colors
+    ve hessian.n_colors renklendirmeyi verir.
+    """
+    import scipy.sparse as sp
+
+    pattern = sp.csc_matrix(sparsity, dtype=bool)
+    pattern.eliminate_zeros()
+    pattern.sort_indices()
+    colors, n_colors = column_coloring(pattern)
+    rows = pattern.indices
+    cols = np.repeat(np.arange(pattern.shape[1]), np.diff(pattern.indptr))
+
+    def hessian(x):
+        x = np.asarray(x, dtype=float)
+        steps = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+        # Adımı kayan noktada tam temsil edilebilir yap
+        steps = (x + steps) - x
+        g0 = grad(x)
+        differences = np.empty((n_colors, x.shape[0]))
+        for color in range(n_colors):
+            differences[color] = grad(x + np.where(colors == color, steps, 0.0)) - g0
+        data = differences[colors[cols], rows] / steps[cols]
+        h = sp.csc_matrix((data, rows, pattern.indptr), shape=pattern.shape)
+        return (0.5 * (h + h.T)).tocsc()
+
+    hessian.colors = colors
+    hessian.n_colors = n_colors
+    return hessian
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+import numpy as np
+
+
+class EvaluationCache:
+    """
+    Amaç fonksiyonunu saran, sınırlı boyutlu ve LRU (en uzun süre kullanılmayan)
+    atma politikalı değerlendirme önbelleği.
+
+    Aynı noktadaki tekrar eden çağrılar fonksiyonu yeniden çalıştırmaz. Aynı
+    önbellek birden fazla yöntem arasında paylaşılabilir.
+
+    Parametreler:
+    func: Önbelleğe alınacak fonksiyon.
+    maxsize: Saklanacak en fazla nokta sayısı.
+    """
+
+    def __init__(self, func, maxsize=128):
+        if maxsize <= 0:
+            raise ValueError("Önbellek boyutu pozitif olmalıdır.")
+        self.func = func
+        self.maxsize = maxsize
+        self._values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(x):
+        if np.ndim(x) == 0:
+            return float(x)
+        x = np.asarray(x, dtype=float)
+        return x.shape, x.tobytes()
+
+    def __call__(self, x):
+        key = self._key(x)
+        try:
+            value = self._values[key]
+        except KeyError:
+            self.misses += 1
+            value = self.func(x)
+            self._values[key] = value
+            if len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+            return value
+
+        self.hits += 1
+        self._values.move_to_end(key)
+        return value
+
+    @property
+    def evaluations(self):
+        """
+        Gerçekte yapılan fonksiyon değerlendirmesi sayısı.
+        """
+        return self.misses
+
+    def stats(self):
+        """
+        Çağrı, isabet, ıskalama ve değerlendirme sayılarını sözlük olarak döndürür.
+        """
+        return {
+            "calls": self.hits + self.misses,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evaluations": self.evaluations,
+            "size": len(self._values),
+        }
+
+    def clear(self):
+        self._values.clear()
+        self.hits = 0
+        self.misses = 0
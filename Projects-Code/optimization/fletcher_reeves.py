@@ -0,0 +1,293 @@
+import numpy as np
+from .iteration_trace import IterationTrace
+from .line_search import fixed_step
+from .objective import Objective
+
+BETA_METHODS = ("fr", "pr+", "hs", "dy", "hybrid")
+
+
+def conjugate_beta(method, g_new, g, d):
+    """
+    Eşlenik gradyan yönü güncellemesindeki beta katsayısını hesaplar.
+
+    Son eksen vektör ekseni kabul edilir; (N, d) dizilerde satır başına beta döndürülür.
+
+    Parametreler:
+    method: "fr" (Fletcher-Reeves), "pr+" (negatif değerleri sıfırlanan
+        Polak-Ribière), "hs" (Hestenes-Stiefel), "dy" (Dai-Yuan) veya
+        "hybrid" (max(0, min(HS, DY))).
+    g_new, g: Yeni ve önceki gradyan.
+    d: Önceki arama yönü.
+
+    Döndürür:
+    beta; d.y <= 0 olduğunda HS, DY ve hybrid için 0 (en dik inişe dönüş).
+    """
+    gg_new = np.sum(g_new * g_new, axis=-1)
+    if method == "fr":
+        return gg_new / np.sum(g * g, axis=-1)
+    y = g_new - g
+    if method == "pr+":
+        return np.maximum(np.sum(g_new * y, axis=-1) / np.sum(g * g, axis=-1), 0.0)
+    if method not in BETA_METHODS:
+        raise ValueError(f"Bilinmeyen beta formülü: {method}")
+    dy = np.sum(d * y, axis=-1)
+    valid = dy > 0
+    safe_dy = np.where(valid, dy, 1.0)
+    hs = np.sum(g_new * y, axis=-1) / safe_dy
+    dai_yuan = gg_new / safe_dy
+    if method == "hs":
+        beta = hs
+    elif method == "dy":
+        beta = dai_yuan
+    else:
+        beta = np.maximum(0.0, np.minimum(hs, dai_yuan))
+    return np.where(valid, beta, 0.0)
+
+
+def powell_restart(g_new, g, threshold=0.2):
+    """
+    Powell yeniden başlatma testi: ardışık gradyanlar diklikten uzaklaştığında
+    (|g_new.g| >= threshold ||g_new||^2) True döndürür.
+    """
+    return np.abs(np.sum(g_new * g, axis=-1)) >= threshold * np.sum(g_new * g_new, axis=-1)
+
+
+def fletcher_reeves_method(func, grad, x0, tol=1e-5, max_iter=100, console_output=None, restart_interval=None,
+                           line_search=None, trace=None, fun_and_grad=None, beta="fr", powell_threshold=0.2):
+    """
+    Fletcher-Reeves eşlenik gradyan yöntemi.
+
+    beta, yön güncellemesindeki formülü seçer (bkz. conjugate_beta; örn. "pr+"
+    doğrusal olmayan fonksiyonlarda FR'nin küçük adımlara takılmasını önler).
+    Yön, son yeniden başlatmadan beri restart_interval iterasyon geçtiğinde
+    (varsayılan: problem boyutu) veya Powell testi (|g_new.g| >=
+    powell_threshold ||g_new||^2; None ile kapatılır) sağlandığında en dik
+    inişe döndürülür.
+
+    line_search, line_search.py'deki arayüze uyan bir doğrusal arama
+    fonksiyonudur (örn. partial(strong_wolfe, c2=0.1)). Verilmezse birim
+    Hessian varsayan kapalı form adım (fixed_step) kullanılır.
+
+    İterasyonlar trace (IterationTrace) üzerine kaydedilir; console_output
+    verilmişse metin satırları yalnızca çalışmanın sonunda bir kez üretilir.
+    Döndürülen history, kayıtlı noktaların (k, d) dizisidir. grad None ise
+    gradyan derivatives.make_gradient ile func'tan üretilir; fun_and_grad
+    verilirse f ve g tek geçişte hesaplanır (bkz. objective.py). Değerlendirme
+    sayıları trace.nfev ve trace.ngev alanlarına yazılır.
+    """
+    objective = Objective(func, grad, fun_and_grad)
+    func, grad = objective.func, objective.grad
+    if trace is None:
+        trace = IterationTrace()
+    trace.start()
+
+    if beta not in BETA_METHODS:
+        raise ValueError(f"Bilinmeyen beta formülü: {beta}")
+    if restart_interval is None:
+        restart_interval = np.size(x0)
+
+    x = x0
+    g = grad(x)
+    d = -g
+    prev_fval = func(x)
+    since_restart = 0
+    g_norm = np.linalg.norm(g)
+    trace.record(0, x, prev_fval, g_norm, force=True)
+    at_minimum = g_norm < tol
+    if at_minimum:
+        trace.event(0, "Başlangıç noktasının gradyanı çok küçük, doğrudan çözüm kabul edildi.")
+
+    iterations = 0
+    for i in range(0 if at_minimum else max_iter):
+        if np.linalg.norm(d) < 1e-15:
+            trace.event(i, f"{i+1}. iterasyonda d vektörü ~ 0, algoritma durduruldu.")
+            break
+        iterations = i + 1
+        if line_search is None:
+            alpha, fval, g_new = fixed_step(func, grad, x, d, prev_fval, g)
+        else:
+            if np.dot(g, d) >= 0:
+                # Arama yönü iniş yönü değilse en dik inişe dönülür
+                d = -g
+            alpha, fval, g_new = line_search(func, grad, x, d, prev_fval, g)
+        x_new = x + alpha * d
+        g_norm = np.linalg.norm(g_new)
+
+        if g_norm < tol:
+            trace.record(i + 1, x_new, fval, g_norm, alpha, force=True)
+            trace.event(i + 1, f"{i+1}. iterasyonda gradyan normu ile yakınsama sağlandı.")
+            x = x_new
+            break
+        if abs(fval - prev_fval) < tol or np.linalg.norm(x_new - x) < tol:
+            trace.record(i + 1, x_new, fval, g_norm, alpha, force=True)
+            trace.event(i + 1, f"{i+1}. iterasyonda yakınsama sağlandı.")
+            x = x_new
+            break
+
+        since_restart += 1
+        if since_restart >= restart_interval or (powell_threshold is not None
+                                                 and powell_restart(g_new, g, powell_threshold)):
+            beta_k = 0.0
+            d = -g_new
+            since_restart = 0
+            trace.event(i + 1, f"{i+1}. iterasyonda yeniden başlatma yapıldı.")
+        else:
+            beta_k = conjugate_beta(beta, g_new, g, d)
+            d = -g_new + beta_k * d
+        g = g_new
+
+        prev_fval = fval
+        x = x_new
+        trace.record(i + 1, x, fval, g_norm, alpha, beta_k)
+    else:
+        trace.flush()
+
+    objective.report(trace, iterations)
+    if console_output is not None:
+        console_output.extend(trace.render())
+
+    return x, trace.positions
+
+
+# Toplu (batch) modda yakınsama nedenleri
+REASON_MAX_ITER = 0
+REASON_GRADIENT = 1
+REASON_FUNCTION = 2
+REASON_STEP = 3
+REASON_NAMES = ("maksimum iterasyon", "gradyan normu", "fonksiyon değeri değişimi", "vektör değişimi")
+BATCH_LINE_SEARCHES = ("fixed", "armijo")
+
+
+def _batch_armijo(func, x, d, f0, g0, alpha0=1.0, c1=1e-4, rho=0.5, max_iter=50):
+    """
+    backtracking_armijo'nun satır başına sürümü: (N, d) noktalar ve yönler için
+    Armijo koşulunu sağlamayan satırların adımı rho ile küçültülür; her denemede
+    func yalnızca bekleyen satırlar için bir kez (toplu) çağrılır.
+
+    Döndürür:
+    (N,) adım büyüklükleri ve bu adımlardaki (N,) fonksiyon değerleri.
+    """
+    slope = np.einsum("ij,ij->i", g0, d)
+    alpha = np.full(x.shape[0], alpha0)
+    f_new = np.empty(x.shape[0])
+    pending = np.arange(x.shape[0])
+    for k in range(max_iter):
+        if k:
+            # Adım yalnızca yeniden değerlendirilecekse küçültülür; böylece
+            # alpha ve f_new her satırda uyumlu kalır
+            alpha[pending] *= rho
+        trial = x[pending] + alpha[pending, None] * d[pending]
+        f_trial = np.asarray(func(trial.T), dtype=float)
+        f_new[pending] = f_trial
+        pending = pending[f_trial > f0[pending] + c1 * alpha[pending] * slope[pending]]
+        if pending.size == 0:
+            break
+    return alpha, f_new
+
+
+def fletcher_reeves_batch(func, grad, X0, tol=1e-5, max_iter=100, restart_interval=None, beta="fr",
+                          powell_threshold=0.2, line_search="fixed"):
+    """
+    Fletcher-Reeves yöntemini çok sayıda başlangıç noktası için aynı anda çalıştırır.
+
+    func ve grad, plot_optimization'daki gibi bileşen öncelikli (d, N) diziler
+    kabul etmelidir: func(X.T) -> (N,), grad(X.T) -> (d, N).
+    Yakınsayan satırlar maskelenir ve sonraki iterasyonlarda hesaplanmaz.
+
+    Parametreler:
+    func: Minimize edilecek (vektörleştirilmiş) fonksiyon.
+    grad: Fonksiyonun (vektörleştirilmiş) gradyanı.
+    X0: (N, d) boyutunda başlangıç noktaları.
+    tol: Yakınsama toleransı.
+    max_iter: Maksimum iterasyon sayısı.
+    restart_interval: Yeniden başlatma aralığı (varsayılan: problem boyutu).
+    beta: Beta formülü (bkz. conjugate_beta).
+    powell_threshold: Powell yeniden başlatma eşiği; None ise yalnızca aralık kullanılır.
+    line_search: "fixed" (tekil sürümdeki fixed_step) veya "armijo" (satır başına
+        geri izlemeli Armijo; tekil sürümde line_search=backtracking_armijo ile aynı
+        adımlar). Birim Hessian varsayımı tutmayan fonksiyonlarda "fixed" ıraksayabilir.
+
+    Döndürür:
+    (N, d) çözümler, (N,) iterasyon sayıları ve (N,) yakınsama nedenleri (REASON_NAMES indeksleri).
+    """
+    if beta not in BETA_METHODS:
+        raise ValueError(f"Bilinmeyen beta formülü: {beta}")
+    if line_search not in BATCH_LINE_SEARCHES:
+        raise ValueError(f"Bilinmeyen doğrusal arama: {line_search}")
+    X = np.array(X0, dtype=float, ndmin=2)
+    n_points = X.shape[0]
+    if restart_interval is None:
+        restart_interval = X.shape[1]
+    iterations = np.full(n_points, max_iter, dtype=int)
+    reasons = np.full(n_points, REASON_MAX_ITER, dtype=int)
+
+    G = np.asarray(grad(X.T), dtype=float).T
+    D = -G
+    prev_fval = np.asarray(func(X.T), dtype=float)
+    since_restart = np.zeros(n_points, dtype=int)
+
+    # Başlangıçta gradyanı zaten küçük olan noktalar doğrudan çözüm kabul edilir
+    at_start = np.linalg.norm(G, axis=1) < tol
+    iterations[at_start] = 0
+    reasons[at_start] = REASON_GRADIENT
+    active = np.flatnonzero(~at_start)
+
+    for i in range(max_iter):
+        if active.size == 0:
+            break
+
+        x = X[active]
+        g = G[active]
+        d = D[active]
+
+        # Adım büyüklüğü (her satır için ayrı)
+        if line_search == "fixed":
+            alpha = -np.einsum("ij,ij->i", g, d) / np.einsum("ij,ij->i", d, d)
+            fval = None
+        else:
+            # Arama yönü iniş yönü değilse en dik inişe dönülür
+            ascent = np.einsum("ij,ij->i", g, d) >= 0
+            d[ascent] = -g[ascent]
+            alpha, fval = _batch_armijo(func, x, d, prev_fval[active], g)
+        step = alpha[:, None] * d
+        x_new = x + step
+
+        if fval is None:
+            fval = np.asarray(func(x_new.T), dtype=float)
+        g_new = np.asarray(grad(x_new.T), dtype=float).T
+
+        # Yakınsama kontrolleri (sıra tekil sürümle aynıdır)
+        done_grad = np.linalg.norm(g_new, axis=1) < tol
+        done_func = ~done_grad & (np.abs(fval - prev_fval[active]) < tol)
+        done_step = ~done_grad & ~done_func & (np.linalg.norm(step, axis=1) < tol)
+        done = done_grad | done_func | done_step
+
+        finished = active[done]
+        X[finished] = x_new[done]
+        iterations[finished] = i + 1
+        reasons[active[done_grad]] = REASON_GRADIENT
+        reasons[active[done_func]] = REASON_FUNCTION
+        reasons[active[done_step]] = REASON_STEP
+
+        keep = ~done
+        active = active[keep]
+        x_new = x_new[keep]
+        g = g[keep]
+        g_new = g_new[keep]
+        d = d[keep]
+
+        # Yeniden başlatma veya beta güncellemesi (satır başına)
+        restarts = since_restart[active] + 1
+        restart = restarts >= restart_interval
+        if powell_threshold is not None:
+            restart |= powell_restart(g_new, g, powell_threshold)
+        beta_k = np.where(restart, 0.0, conjugate_beta(beta, g_new, g, d))
+        d = -g_new + beta_k[:, None] * d
+        since_restart[active] = np.where(restart, 0, restarts)
+
+        X[active] = x_new
+        G[active] = g_new
+        D[active] = d
+        prev_fval[active] = fval[keep]
+
+    return X, iterations, reasons
@@ -0,0 +1,244 @@
+import queue
+import threading
+import numpy as np
+from .fletcher_reeves import fletcher_reeves_method
+from .iteration_trace import IterationTrace, OptimizationCancelled
+from .lbfgs import lbfgs_method
+from .newtons_method import newtons_method, trust_region_newton_method
+from .problems import function, gradient, hessian
+from .viz import draw_contour
+
+POLL_INTERVAL_MS = 50       # kayıtların kontrol edilme aralığı
+MAX_ROWS_PER_POLL = 200     # bir kontrolde biçimlendirilecek en fazla kayıt
+MAX_CONSOLE_LINES = 5000    # konsolda tutulacak en fazla satır
+
+
+class QueueTrace(IterationTrace):
+    """
+    Çalışma sürerken kayıtları ana iş parçacığına aktaran kayıtçı.
+
+    Çözücü iş parçacığı yalnızca sayısal kayıtları yazar; satırlar kuyruğa
+    konmaz. Ana iş parçacığı drain() ile son çağrıdan beri eklenen kayıtları
+    alır ve yalnızca gösterilecek satırları biçimlendirir. Arayüz geride
+    kalırsa ara kayıtlar atlanır, böylece bir kontrolün maliyeti sınırlı kalır.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._shown = 0
+        self._events_shown = 0
+        self._drawn = 0
+
+    def start(self):
+        super().start()
+        self._shown = self._events_shown = self._drawn = 0
+
+    def drain(self, max_rows=MAX_ROWS_PER_POLL, final=False):
+        """
+        Yeni kayıtları ve olayları metne dönüştürür.
+
+        Parametreler:
+        max_rows: Biçimlendirilecek en fazla kayıt; daha eskileri atlanır.
+        final: True ise kalan tüm olaylar da döndürülür (çalışma bittiğinde).
+
+        Döndürür:
+        Satır listesi ve yeni noktaların ilk iki koordinatı, (k, 2) dizi.
+        """
+        # Kayıt satırı ve x noktası _size artırılmadan önce yazılır
+        size = self._size
+        lines = []
+        start = self._shown
+        if size - start > max_rows:
+            lines.append(f"... {size - max_rows - start} kayıt atlandı")
+            start = size - max_rows
+        iterations = self._values[:size, 0]
+        events = self.events
+        e = self._events_shown
+        for k in range(start, size):
+            lines.append(self.format_row(k))
+            while e < len(events) and events[e][0] <= iterations[k]:
+                lines.append(events[e][1])
+                e += 1
+        if final:
+            lines.extend(message for _, message in events[e:])
+            e = len(events)
+        self._shown = size
+        self._events_shown = e
+
+        if self.history is None:
+            return lines, np.empty((0, 2))
+        positions = self.history.positions
+        stop = min(size, len(positions))
+        points = positions[self._drawn:stop, :2]
+        self._drawn = stop
+        return lines, points
+
+
+def create_tabbed_interface():
+    # Tk ve matplotlib arka ucu yalnızca arayüz açılırken yüklenir
+    import tkinter as tk
+    from tkinter import ttk, scrolledtext
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    def append_console(lines, textbox):
+        textbox.configure(state='normal')
+        textbox.insert(tk.END, "\n".join(lines) + "\n")
+        # Konsol sınırsız büyümesin diye en eski satırlar silinir
+        excess = int(textbox.index('end-1c').split('.')[0]) - MAX_CONSOLE_LINES
+        if excess > 0:
+            textbox.delete(1.0, f"{excess + 1}.0")
+        textbox.configure(state='disabled')
+        textbox.see(tk.END)
+
+    def clear_console(textbox):
+        textbox.configure(state='normal')
+        textbox.delete(1.0, tk.END)
+        textbox.configure(state='disabled')
+
+    def add_method_tab(title, run_method):
+        """
+        Bir yöntem için giriş alanları, çalıştırma/iptal düğmeleri, konsol ve
+        gömülü grafik olan sekme ekler.
+        run_method(x0, tol, max_iter, trace) -> (x, history)
+
+        Çözücü ayrı bir iş parçacığında çalışır; yeni kayıtlar root.after ile
+        düzenli aralıklarla QueueTrace.drain() üzerinden okunur.
+        """
+        state = {"trace": None, "messages": None, "path": np.empty((256, 2)), "path_size": 0}
+
+        def worker(x0, tol, max_iter, trace, messages):
+            try:
+                run_method(x0, tol, max_iter, trace)
+            except OptimizationCancelled as e:
+                messages.put(str(e))
+            except Exception as e:
+                messages.put(f"Hata: {e}")
+            messages.put(None)
+
+        def extend_path(points):
+            # Yol, dolunca iki katına büyüyen bir dizide tutulur; her kontrolde yeniden kurulmaz
+            size = state["path_size"]
+            if size + len(points) > len(state["path"]):
+                grown = np.empty((max(2 * len(state["path"]), size + len(points)), 2))
+                grown[:size] = state["path"][:size]
+                state["path"] = grown
+            state["path"][size:size + len(points)] = points
+            size += len(points)
+            state["path_size"] = size
+            path_line.set_data(state["path"][:size, 0], state["path"][:size, 1])
+
+        def poll():
+            # Kuyrukta yalnızca çalışmanın sonunu bildiren birkaç mesaj bulunur
+            status = []
+            done = False
+            while True:
+                try:
+                    message = state["messages"].get_nowait()
+                except queue.Empty:
+                    break
+                if message is None:
+                    done = True
+                else:
+                    status.append(message)
+
+            lines, points = state["trace"].drain(final=done)
+            lines.extend(status)
+            if lines:
+                append_console(lines, console_textbox)
+            if len(points):
+                extend_path(points)
+                canvas.draw_idle()
+
+            if done:
+                state["trace"] = None
+                run_button.configure(state='normal')
+                cancel_button.configure(state='disabled')
+            else:
+                root.after(POLL_INTERVAL_MS, poll)
+
+        def execute():
+            try:
+                x0 = np.array([float(x) for x in x0_entry.get().split(",")])
+                tol = float(tol_entry.get())
+                max_iter = int(max_iter_entry.get())
+            except ValueError as e:
+                append_console([f"Hata: {e}"], console_textbox)
+                return
+
+            clear_console(console_textbox)
+            state["path_size"] = 0
+            path_line.set_data([], [])
+            canvas.draw_idle()
+
+            messages = queue.Queue()
+            trace = QueueTrace()
+            state["trace"], state["messages"] = trace, messages
+            run_button.configure(state='disabled')
+            cancel_button.configure(state='normal')
+            threading.Thread(target=worker, args=(x0, tol, max_iter, trace, messages), daemon=True).start()
+            root.after(POLL_INTERVAL_MS, poll)
+
+        def cancel():
+            if state["trace"] is not None:
+                state["trace"].cancel()
+
+        tab = ttk.Frame(notebook)
+        notebook.add(tab, text=title)
+        tk.Label(tab, text="Başlangıç Noktası (virgülle ayrılmış):").grid(row=0, column=0, sticky="w")
+        x0_entry = tk.Entry(tab, width=30)
+        x0_entry.grid(row=0, column=1)
+        x0_entry.insert(0, "0.0, 0.0")
+        tk.Label(tab, text="Tolerans (örn. 1e-5):").grid(row=1, column=0, sticky="w")
+        tol_entry = tk.Entry(tab, width=30)
+        tol_entry.grid(row=1, column=1)
+        tol_entry.insert(0, "1e-5")
+        tk.Label(tab, text="Maksimum İterasyon:").grid(row=2, column=0, sticky="w")
+        max_iter_entry = tk.Entry(tab, width=30)
+        max_iter_entry.grid(row=2, column=1)
+        max_iter_entry.insert(0, "100")
+        buttons = tk.Frame(tab)
+        buttons.grid(row=3, column=0, columnspan=2)
+        run_button = tk.Button(buttons, text="Çalıştır", command=execute)
+        run_button.pack(side="left")
+        cancel_button = tk.Button(buttons, text="İptal", command=cancel, state='disabled')
+        cancel_button.pack(side="left")
+        tk.Label(tab, text="Konsol Çıktıları:").grid(row=4, column=0, sticky="nw")
+        console_textbox = scrolledtext.ScrolledText(tab, wrap=tk.WORD, width=80, height=20, state='disabled')
+        console_textbox.grid(row=4, column=1)
+
+        # Kontur bir kez çizilir; çalışma sırasında yalnızca yol güncellenir
+        figure = Figure(figsize=(5, 4))
+        ax = figure.add_subplot()
+        draw_contour(ax, function)
+        path_line, = ax.plot([], [], 'ro-', markersize=5)
+        canvas = FigureCanvasTkAgg(figure, master=tab)
+        canvas.get_tk_widget().grid(row=0, column=2, rowspan=5, sticky="nsew")
+        canvas.draw()
+
+    root = tk.Tk()
+    root.title("Optimizasyon Yöntemleri")
+    notebook = ttk.Notebook(root)
+    notebook.pack(expand=True, fill="both")
+
+    # Fletcher-Reeves Sekmesi
+    add_method_tab("Fletcher-Reeves", lambda x0, tol, max_iter, trace:
+                   fletcher_reeves_method(function, gradient, x0, tol, max_iter, trace=trace))
+
+    # Newton Sekmesi
+    add_method_tab("Newton", lambda x0, tol, max_iter, trace:
+                   newtons_method(function, gradient, hessian, x0, tol, max_iter, trace=trace))
+
+    # Güven Bölgesi Newton Sekmesi
+    add_method_tab("Güven Bölgesi", lambda x0, tol, max_iter, trace:
+                   trust_region_newton_method(function, gradient, x0, hessian, tol=tol, max_iter=max_iter,
+                                              trace=trace))
+
+    # L-BFGS Sekmesi
+    add_method_tab("L-BFGS", lambda x0, tol, max_iter, trace:
+                   lbfgs_method(function, gradient, x0, tol, max_iter, trace=trace))
+
+    root.mainloop()
+
+if __name__ == "__main__":
+    create_tabbed_interface()
@@ -0,0 +1,221 @@
+"""
+IterationTrace için x noktası (yörünge) depoları.
+
+    trace = IterationTrace()                                  # tümü bellekte
+    trace = IterationTrace(sample_every=10)                   # her 10. iterasyon
+    trace = IterationTrace(history=RingHistory(100))          # son 100 nokta
+    trace = IterationTrace(history=MemmapHistory("x.npy"))    # diske akış
+
+MemmapHistory ile yazılan dosya sıradan bir .npy dosyasıdır;
+np.load(path, mmap_mode="r") veya open_history(path) ile kopyalanmadan açılır.
+RingHistory ve MemmapHistory'nin bellek kullanımı iterasyon sayısından bağımsızdır.
+"""
+import os
+import struct
+import numpy as np
+
+
+class MemoryHistory:
+    """
+    Noktaları, dolunca iki katına büyüyen bellek içi bir dizide saklar.
+    """
+
+    def __init__(self, capacity=128):
+        self._capacity = capacity
+        self._x = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def reset(self):
+        self._size = 0
+
+    def append(self, x):
+        if self._x is None:
+            # Büyük boyutlarda başlangıç ayırması ~8 MiB ile sınırlanır
+            rows = max(1, min(self._capacity, (8 << 20) // (8 * max(x.shape[0], 1))))
+            self._x = np.empty((rows, x.shape[0]))
+        elif self._size == self._x.shape[0]:
+            grown = np.empty((2 * self._x.shape[0], self._x.shape[1]))
+            grown[:self._size] = self._x[:self._size]
+            self._x = grown
+        self._x[self._size] = x
+        self._size += 1
+
+    def get(self, k):
+        return self._x[k]
+
+    @property
+    def positions(self):
+        if self._x is None:
+            return np.empty((0, 0))
+        return self._x[:self._size]
+
+    def close(self):
+        pass
+
+
+class RingHistory:
+    """
+    Yalnızca son m noktayı sabit boyutlu bir halka tamponda saklar.
+
+    positions en eski noktadan en yeniye sıralı (m, d) bir kopya döndürür;
+    get(k), k. kayıt artık tamponda değilse None döndürür.
+    """
+
+    def __init__(self, m):
+        if m < 1:
+            raise ValueError("Halka tampon boyutu en az 1 olmalıdır.")
+        self.m = m
+        self._x = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def reset(self):
+        self._size = 0
+
+    def append(self, x):
+        if self._x is None:
+            self._x = np.empty((self.m, x.shape[0]))
+        self._x[self._size % self.m] = x
+        self._size += 1
+
+    def get(self, k):
+        if k < self._size - self.m or k >= self._size:
+            return None
+        return self._x[k % self.m]
+
+    @property
+    def positions(self):
+        if self._x is None:
+            return np.empty((0, 0))
+        if self._size <= self.m:
+            return self._x[:self._size]
+        start = self._size % self.m
+        return np.concatenate((self._x[start:], self._x[:start]))
+
+    def close(self):
+        pass
+
+
+# .npy başlığı sabit uzunlukta tutulur; satır sayısı arttıkça yalnızca başlık yeniden yazılır
+_HEADER_SIZE = 128
+
+
+def _npy_header(rows, d):
+    header = "{'descr': '<f8', 'fortran_order': False, 'shape': (%d, %d), }" % (rows, d)
+    # 10 baytlık sihirli önek/uzunluk alanı ve sondaki satır sonu başlığa dahildir
+    if len(header) > _HEADER_SIZE - 10 - 1:
+        raise ValueError(f"({rows}, {d}) boyutu {_HEADER_SIZE} baytlık .npy başlığına sığmıyor.")
+    header = header.ljust(_HEADER_SIZE - 10 - 1) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+class MemmapHistory:
+    """
+    Noktaları chunk satırlık parçalar halinde bir .npy dosyasına yazar.
+
+    Bellekte en fazla bir parça (chunk, d) tutulur. positions tamponu diske
+    boşaltıp dosyayı salt okunur bellek eşlemesiyle (np.memmap) döndürür;
+    veri kopyalanmaz. Dosya, çalışma bittikten sonra open_history(path) ile
+    yeniden açılabilir.
+
+    Her çalışma (ilk append veya reset sonrası) aynı dizinde yeni bir dosyaya
+    yazılır ve bu dosya path'in yerine atomik olarak taşınır. Önceki bir
+    çalışmadan kalan positions eşlemeleri eski dosyayı göstermeye devam eder;
+    dosya kesilmediğinden bu eşlemelere erişim güvenlidir.
+
+    Parametreler:
+    path: .npy dosya yolu (varsa üzerine yazılır).
+    chunk: Diske bir seferde yazılan satır sayısı.
+    """
+
+    def __init__(self, path, chunk=256):
+        if chunk < 1:
+            raise ValueError("Parça boyutu en az 1 olmalıdır.")
+        self.path = os.fspath(path)
+        self.chunk = chunk
+        self._file = None
+        self._buffer = None
+        self._buffered = 0
+        self._size = 0
+        self._d = None
+        self._mapped = None
+
+    def __len__(self):
+        return self._size
+
+    def reset(self):
+        self.close()
+        self._size = 0
+        self._buffered = 0
+        self._d = None
+        self._mapped = None
+
+    def append(self, x):
+        if self._file is None:
+            self._d = x.shape[0]
+            self._buffer = np.empty((self.chunk, self._d))
+            temp = f"{self.path}.{os.getpid()}-{id(self)}.tmp"
+            self._file = open(temp, "w+b")
+            self._file.write(_npy_header(0, self._d))
+            os.replace(temp, self.path)
+        self._buffer[self._buffered] = x
+        self._buffered += 1
+        self._size += 1
+        if self._buffered == self.chunk:
+            self._write_buffer()
+
+    def _write_buffer(self):
+        if self._buffered:
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(self._buffer[:self._buffered].astype("<f8", copy=False).tobytes())
+            self._buffered = 0
+
+    def flush(self):
+        """
+        Tampondaki satırları yazar ve başlıktaki satır sayısını günceller.
+        """
+        if self._file is None:
+            return
+        self._write_buffer()
+        self._file.seek(0)
+        self._file.write(_npy_header(self._size, self._d))
+        self._file.flush()
+
+    def get(self, k):
+        if k >= self._size:
+            return None
+        written = self._size - self._buffered
+        if k >= written:
+            return self._buffer[k - written]
+        return self.positions[k]
+
+    @property
+    def positions(self):
+        if self._size == 0:
+            return np.empty((0, 0))
+        if self._mapped is None or self._mapped.shape[0] != self._size:
+            self.flush()
+            self._mapped = np.load(self.path, mmap_mode="r")
+        return self._mapped
+
+    def close(self):
+        """
+        Kalan satırları yazar ve dosyayı kapatır; dosya geçerli bir .npy olarak kalır.
+        """
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+            self._buffer = None
+
+
+def open_history(path):
+    """
+    MemmapHistory ile yazılmış bir yörüngeyi kopyalamadan (salt okunur) açar.
+    """
+    return np.load(path, mmap_mode="r")
@@ -0,0 +1,184 @@
+import time
+import numpy as np
+from .history import MemoryHistory
+
+
+class OptimizationCancelled(Exception):
+    """
+    Çalışma cancel() ile durdurulduğunda bir sonraki record() çağrısında fırlatılır.
+    """
+
+
+class IterationTrace:
+    """
+    Optimizasyon iterasyonlarını önceden ayrılmış NumPy dizilerinde saklayan kayıtçı.
+
+    Her kayıt iterasyon numarası, f, ||g||, adım büyüklüğü, beta ve geçen
+    süreyi içerir; istenirse x noktaları da saklanır (history yerine).
+    İnsan tarafından okunabilir metin yalnızca render() çağrıldığında üretilir.
+    Çözücüler fonksiyon ve gradyan değerlendirme sayılarını nfev ve ngev
+    alanlarına yazar. cancel() başka bir iş parçacığından çağrılarak çalışma
+    bir sonraki iterasyonda durdurulabilir (OptimizationCancelled).
+
+    Parametreler:
+    capacity: Başlangıç kapasitesi (dolunca iki katına çıkarılır).
+    sample_every: Yalnızca her sample_every. iterasyonu kaydet (ilk ve son kayıt her zaman tutulur).
+    store_x: x noktalarını saklamak için.
+    history: x noktalarının yazılacağı depo (bkz. history.py: RingHistory ile
+        son m nokta, MemmapHistory ile diske akış). Verilmezse ve store_x
+        True ise noktalar bellekte büyüyen bir dizide tutulur.
+    """
+
+    FIELDS = ("iteration", "f", "grad_norm", "step", "beta", "time")
+
+    def __init__(self, capacity=128, sample_every=1, store_x=True, history=None):
+        if sample_every < 1:
+            raise ValueError("Örnekleme aralığı en az 1 olmalıdır.")
+        self.sample_every = sample_every
+        if history is None and store_x:
+            history = MemoryHistory(capacity)
+        self.history = history
+        self.store_x = history is not None
+        self._values = np.full((capacity, len(self.FIELDS)), np.nan)
+        self._size = 0
+        self._last = None
+        self.events = []
+        self.nfev = 0
+        self.ngev = 0
+        self._cancelled = False
+        self._start = time.perf_counter()
+
+    def __len__(self):
+        return self._size
+
+    def start(self):
+        """
+        Zaman sayacını sıfırlar ve önceki kayıtları siler.
+        """
+        self._size = 0
+        self._last = None
+        self.events = []
+        self.nfev = 0
+        self.ngev = 0
+        if self.history is not None:
+            self.history.reset()
+        self._start = time.perf_counter()
+
+    def cancel(self):
+        """
+        Çalışmanın bir sonraki kayıtta durdurulmasını ister.
+        """
+        self._cancelled = True
+
+    def _grow(self):
+        capacity = 2 * self._values.shape[0]
+        values = np.full((capacity, len(self.FIELDS)), np.nan)
+        values[:self._size] = self._values[:self._size]
+        self._values = values
+
+    def record(self, iteration, x=None, f=np.nan, grad_norm=np.nan, step=np.nan, beta=np.nan, force=False):
+        """
+        Bir iterasyonu kaydeder. Örnekleme dışında kalan iterasyonlar yalnızca
+        son kayıt olarak hatırlanır, böylece flush() ile eklenebilir.
+        """
+        if self._cancelled:
+            raise OptimizationCancelled(f"{iteration}. iterasyonda çalışma iptal edildi.")
+        elapsed = time.perf_counter() - self._start
+        if not force and iteration % self.sample_every != 0:
+            # x kopyalanmaz; çözücüler her iterasyonda yeni bir x dizisi üretir
+            self._last = (iteration, x, f, grad_norm, step, beta, elapsed)
+            return
+        self._append(iteration, x, f, grad_norm, step, beta, elapsed)
+
+    def _append(self, iteration, x, f, grad_norm, step, beta, elapsed):
+        self._last = None
+        if self._size == self._values.shape[0]:
+            self._grow()
+        self._values[self._size] = (iteration, f, grad_norm, step, beta, elapsed)
+        if self.history is not None and x is not None:
+            self.history.append(np.ravel(x))
+        self._size += 1
+
+    def flush(self):
+        """
+        Örnekleme nedeniyle atlanan son iterasyonu kayda ekler.
+        """
+        if self._last is not None:
+            self._append(*self._last)
+
+    def event(self, iteration, message):
+        """
+        Yakınsama, yeniden başlatma gibi seyrek olayları kaydeder.
+        """
+        self.events.append((iteration, message))
+
+    def column(self, name):
+        """
+        Verilen alanın kayıtlı değerlerini dizi olarak döndürür.
+        """
+        return self._values[:self._size, self.FIELDS.index(name)]
+
+    @property
+    def positions(self):
+        """
+        Kayıtlı x noktaları, (kayıt sayısı, d) boyutunda dizi (RingHistory
+        ile son m kayıt, MemmapHistory ile diskteki dosyanın bellek eşlemesi).
+        """
+        if self.history is None:
+            return np.empty((0, 0))
+        return self.history.positions
+
+    def close(self):
+        """
+        x deposunu kapatır (MemmapHistory'de kalan satırlar diske yazılır).
+        """
+        if self.history is not None:
+            self.history.close()
+
+    def format_row(self, k):
+        """
+        k. kaydı tek satırlık metne dönüştürür.
+        """
+        iteration, f, grad_norm, step, beta, elapsed = self._values[k]
+        items = []
+        x = self.history.get(k) if self.history is not None and k < len(self.history) else None
+        if x is not None:
+            items.append(f"x = {x}")
+        if not np.isnan(f):
+            items.append(f"f(x) = {f}")
+        if not np.isnan(grad_norm):
+            items.append(f"||g|| = {grad_norm:.6e}")
+        if not np.isnan(step):
+            items.append(f"adım = {step:.6e}")
+        if not np.isnan(beta):
+            items.append(f"beta = {beta:.6e}")
+        items.append(f"süre = {elapsed * 1e3:.3f} ms")
+        return f"Iterasyon {int(iteration)}: " + ", ".join(items)
+
+    def render(self, start=0):
+        """
+        Kayıtları ve olayları satır satır metne dönüştürür.
+
+        Parametreler:
+        start: Bu kayıt indeksinden itibaren üretilecek satırlar.
+
+        Döndürür:
+        Satır listesi.
+        """
+        events = sorted(self.events, key=lambda e: e[0])
+        iterations = self.column("iteration")
+        lines = []
+        e = 0
+        if start > 0:
+            while e < len(events) and events[e][0] <= iterations[start - 1]:
+                e += 1
+        for k in range(start, self._size):
+            lines.append(self.format_row(k))
+            while e < len(events) and events[e][0] <= iterations[k]:
+                lines.append(events[e][1])
+                e += 1
+        lines.extend(message for _, message in events[e:])
+        return lines
+
+    def to_text(self):
+        return "\n".join(self.render())
@@ -0,0 +1,112 @@
+from functools import partial
+import numpy as np
+from .iteration_trace import IterationTrace
+from .line_search import strong_wolfe
+from .objective import Objective
+
+def lbfgs_method(func, grad, x0, tol=1e-5, max_iter=100, console_output=None, m=10, line_search=None,
+                 trace=None, fun_and_grad=None):
+    """
+    Sınırlı bellekli BFGS (L-BFGS) yöntemi.
+
+    Hessian oluşturulmaz; son m adımın s = x_{k+1} - x_k ve y = g_{k+1} - g_k
+    vektörleri halka tamponlarda tutulur ve arama yönü iki döngülü özyineleme
+    ile hesaplanır. Bellek O(m d), iterasyon maliyeti O(m d)'dir.
+
+    Parametreler:
+        func: Minimize edilecek fonksiyon.
+        grad: Fonksiyonun gradyanı.
+        x0: Başlangıç noktası (numpy array).
+        tol: Gradyan normu ve adım için durma toleransı.
+        max_iter: Maksimum iterasyon sayısı.
+        console_output: Konsol çıktıları için bir liste (arayüze aktarmak için).
+        m: Saklanacak (s, y) çifti sayısı.
+        line_search: Doğrusal arama (varsayılan: güçlü Wolfe, c2=0.9).
+        trace: İterasyon kayıtçısı (IterationTrace).
+        fun_and_grad: (f, g) döndüren birleşik fonksiyon (func ve grad yerine).
+
+    Dönüş:
+        x_opt: Optimum çözüm.
+        history: Kayıtlı noktaların (k, d) dizisi.
+    """
+    if m < 1:
+        raise ValueError("Geçmiş boyutu m en az 1 olmalıdır.")
+    if line_search is None:
+        line_search = partial(strong_wolfe, c2=0.9)
+    objective = Objective(func, grad, fun_and_grad)
+    func, grad = objective.func, objective.grad
+    if trace is None:
+        trace = IterationTrace()
+    trace.start()
+
+    x = np.array(x0, dtype=float)
+    n = x.shape[0]
+    S = np.zeros((m, n))
+    Y = np.zeros((m, n))
+    rho = np.zeros(m)
+    a = np.zeros(m)
+    count = 0   # saklanan çift sayısı
+    head = 0    # bir sonraki yazılacak halka indeksi
+
+    fval = func(x)
+    g = grad(x)
+    g_norm = np.linalg.norm(g)
+    trace.record(0, x, fval, g_norm, force=True)
+
+    iterations = 0
+    for i in range(max_iter):
+        iterations = i + 1
+        if g_norm < tol:
+            trace.event(i, f"{i+1}. iterasyonda gradyan normu ile yakınsama sağlandı.")
+            break
+
+        # İki döngülü özyineleme: d = -H_k g
+        q = g.copy()
+        for j in range(count):
+            k = (head - 1 - j) % m
+            a[k] = rho[k] * np.dot(S[k], q)
+            q -= a[k] * Y[k]
+        if count > 0:
+            k = (head - 1) % m
+            q *= np.dot(S[k], Y[k]) / np.dot(Y[k], Y[k])
+        for j in range(count - 1, -1, -1):
+            k = (head - 1 - j) % m
+            b = rho[k] * np.dot(Y[k], q)
+            q += (a[k] - b) * S[k]
+        d = -q
+
+        if np.dot(g, d) >= 0:
+            # Yön iniş yönü değilse geçmiş silinir ve en dik inişe dönülür
+            count = 0
+            d = -g
+
+        alpha, f_new, g_new = line_search(func, grad, x, d, fval, g)
+        s = alpha * d
+        y = g_new - g
+        x_new = x + s
+
+        # Eğrilik koşulu sağlanıyorsa çift halka tampona yazılır
+        sy = np.dot(s, y)
+        if sy > 1e-10 * np.linalg.norm(s) * np.linalg.norm(y):
+            S[head] = s
+            Y[head] = y
+            rho[head] = 1.0 / sy
+            head = (head + 1) % m
+            count = min(count + 1, m)
+
+        step_norm = np.linalg.norm(s)
+        x, fval, g = x_new, f_new, g_new
+        g_norm = np.linalg.norm(g)
+        if step_norm < tol:
+            trace.record(i + 1, x, fval, g_norm, alpha, force=True)
+            trace.event(i + 1, f"{i+1}. iterasyonda vektör değişimi ile yakınsama sağlandı.")
+            break
+        trace.record(i + 1, x, fval, g_norm, alpha)
+    else:
+        trace.flush()
+
+    objective.report(trace, iterations)
+    if console_output is not None:
+        console_output.extend(trace.render())
+
+    return x, trace.positions
@@ -0,0 +1,156 @@
+import numpy as np
+
+# Tüm doğrusal arama fonksiyonları aynı arayüzü paylaşır:
+#     alpha, f_new, g_new = line_search(func, grad, x, d, f0, g0)
+# f0 ve g0, x noktasındaki fonksiyon değeri ve gradyandır; f_new ve g_new ise
+# x + alpha*d noktasındaki değerlerdir, böylece çağıran taraf bunları yeniden
+# hesaplamaz. Ek parametreler functools.partial ile verilebilir, örn.
+#     partial(strong_wolfe, c2=0.1)
+
+
+def fixed_step(func, grad, x, d, f0, g0):
+    """
+    Birim Hessian varsayımıyla kapalı formdaki adım: alpha = -g.d / d.d
+    d sıfır vektörse adım atılmaz (alpha = 0, f0 ve g0 döndürülür).
+    """
+    dd = np.dot(d, d)
+    if dd == 0:
+        return 0.0, f0, g0
+    alpha = -np.dot(g0, d) / dd
+    x_new = x + alpha * d
+    return alpha, func(x_new), grad(x_new)
+
+
+def exact_quadratic(func, grad, x, d, f0, g0, hessp=None):
+    """
+    Kuadratik fonksiyonlar için kesin doğrusal arama: alpha = -g.d / d.Hd
+
+    Parametreler:
+    hessp: Hessian-vektör çarpımı, hessp(x, v) = H(x) v.
+    """
+    if hessp is None:
+        raise ValueError("Kesin doğrusal arama için Hessian-vektör çarpımı (hessp) gereklidir.")
+    curvature = np.dot(d, hessp(x, d))
+    if curvature <= 0:
+        raise ValueError("Arama yönünde eğrilik pozitif değil, kesin adım tanımsız.")
+    alpha = -np.dot(g0, d) / curvature
+    x_new = x + alpha * d
+    return alpha, func(x_new), grad(x_new)
+
+
+def backtracking_armijo(func, grad, x, d, f0, g0, alpha0=1.0, c1=1e-4, rho=0.5, max_iter=50):
+    """
+    Armijo (yeterli azalma) koşulu sağlanana kadar adımı rho ile küçülten geri izleme.
+
+    Parametreler:
+    alpha0: Başlangıç adım büyüklüğü.
+    c1: Yeterli azalma sabiti.
+    rho: Küçültme oranı (0 < rho < 1).
+    max_iter: En fazla deneme sayısı.
+    """
+    slope = np.dot(g0, d)
+    if slope >= 0:
+        raise ValueError("Arama yönü bir iniş yönü değil.")
+
+    # alpha son değerlendirilen adımdır; deneme sayısı tükenirse de f_new ve g_new ile uyumlu kalır
+    trial = alpha0
+    for _ in range(max_iter):
+        alpha = trial
+        x_new = x + alpha * d
+        f_new = func(x_new)
+        if f_new <= f0 + c1 * alpha * slope:
+            break
+        trial *= rho
+    return alpha, f_new, grad(x_new)
+
+
+def _interpolate_step(a, fa, da, b, fb, db):
+    """
+    [a, b] aralığında kübik (olmazsa kuadratik, o da olmazsa ikiye bölme)
+    interpolasyon ile yeni deneme adımı; adım uçlara fazla yaklaşmaz.
+    """
+    lo, hi = min(a, b), max(a, b)
+    margin = 0.1 * (hi - lo)
+
+    # f ve f' değerlerini kullanan kübik adım
+    d1 = da + db - 3 * (fa - fb) / (a - b)
+    radicand = d1 * d1 - da * db
+    if radicand >= 0:
+        d2 = np.copysign(np.sqrt(radicand), b - a)
+        denominator = db - da + 2 * d2
+        if denominator != 0:
+            alpha = b - (b - a) * (db + d2 - d1) / denominator
+            if lo + margin <= alpha <= hi - margin:
+                return alpha
+
+    # f(a), f'(a) ve f(b) değerlerini kullanan kuadratik adım
+    denominator = 2 * (fb - fa - da * (b - a))
+    if denominator > 0:
+        alpha = a - da * (b - a) ** 2 / denominator
+        if lo + margin <= alpha <= hi - margin:
+            return alpha
+
+    return 0.5 * (a + b)
+
+
+def strong_wolfe(func, grad, x, d, f0, g0, alpha0=1.0, c1=1e-4, c2=0.9, alpha_max=1e10, max_iter=20):
+    """
+    Güçlü Wolfe koşullarını sağlayan adımı bulan doğrusal arama
+    (Nocedal & Wright, Algoritma 3.5 ve 3.6). Aralık daraltma (zoom) adımları
+    kübik/kuadratik interpolasyon ile seçilir.
+
+    Parametreler:
+    alpha0: Başlangıç adım büyüklüğü.
+    c1: Yeterli azalma sabiti.
+    c2: Eğrilik sabiti (c1 < c2 < 1; eşlenik gradyan için 0.1, quasi-Newton için 0.9).
+    alpha_max: En büyük adım büyüklüğü.
+    max_iter: Genişletme ve daraltma aşamalarının her biri için en fazla deneme sayısı.
+    """
+    slope0 = np.dot(g0, d)
+    if slope0 >= 0:
+        raise ValueError("Arama yönü bir iniş yönü değil.")
+
+    def evaluate(alpha):
+        x_new = x + alpha * d
+        f_new = func(x_new)
+        g_new = grad(x_new)
+        return f_new, g_new, np.dot(g_new, d)
+
+    def zoom(lo, hi):
+        # lo ve hi: (alpha, f, g, eğim) demetleri; lo her zaman en iyi noktadır
+        for _ in range(max_iter):
+            alpha = _interpolate_step(lo[0], lo[1], lo[3], hi[0], hi[1], hi[3])
+            f_new, g_new, slope = evaluate(alpha)
+            trial = (alpha, f_new, g_new, slope)
+            if f_new > f0 + c1 * alpha * slope0 or f_new >= lo[1]:
+                hi = trial
+            else:
+                if abs(slope) <= -c2 * slope0:
+                    return trial
+                if slope * (hi[0] - lo[0]) >= 0:
+                    hi = lo
+                lo = trial
+        return lo
+
+    prev = (0.0, f0, g0, slope0)
+    alpha = alpha0
+    for i in range(max_iter):
+        f_new, g_new, slope = evaluate(alpha)
+        trial = (alpha, f_new, g_new, slope)
+
+        if f_new > f0 + c1 * alpha * slope0 or (i > 0 and f_new >= prev[1]):
+            result = zoom(prev, trial)
+            break
+        if abs(slope) <= -c2 * slope0:
+            result = trial
+            break
+        if slope >= 0:
+            result = zoom(trial, prev)
+            break
+
+        prev = trial
+        alpha = min(2 * alpha, alpha_max)
+    else:
+        result = trial
+
+    return result[0], result[1], result[2]
@@ -0,0 +1,539 @@
+import sys
+import numpy as np
+from .derivatives import make_hessian, make_sparse_hessian
+from .iteration_trace import IterationTrace
+from .objective import Objective
+
+
+def modified_cholesky(h, beta=1e-3, max_tries=60):
+    """
+    Cholesky ayrışımı; matris pozitif tanımlı değilse köşegene tau I eklenir
+    ve tau, ayrışım başarılı olana kadar ikiye katlanır
+    (Nocedal & Wright, Algoritma 3.3).
+
+    Parametreler:
+        h: Simetrik matris.
+        beta: İlk kaydırmanın ölçeği (en büyük köşegen elemanına göre).
+        max_tries: En fazla deneme sayısı.
+
+    Dönüş:
+        factor: scipy.linalg.cho_solve ile kullanılacak (c, lower) ikilisi.
+        tau: Eklenen köşegen kaydırma (pozitif tanımlıysa 0).
+    """
+    from scipy.linalg import cho_factor
+
+    diag_min = np.min(np.diag(h))
+    scale = beta * max(np.max(np.abs(np.diag(h))), 1.0)
+    tau = 0.0 if diag_min > 0 else scale - diag_min
+    identity = np.eye(h.shape[0])
+    for _ in range(max_tries):
+        try:
+            return cho_factor(h + tau * identity if tau > 0 else h), tau
+        except np.linalg.LinAlgError:
+            tau = max(2 * tau, scale)
+    raise np.linalg.LinAlgError("Değiştirilmiş Cholesky ayrışımı başarısız oldu.")
+
+
+def sparse_modified_cholesky(h, beta=1e-3, max_tries=60):
+    """
+    modified_cholesky'nin scipy.sparse matrisler için karşılığı; yoğun matris
+    oluşturulmaz. Bant genişliği b küçükse (bant depolama sıfırdan farklı
+    eleman sayısının en fazla iki katıysa) LAPACK bantlı Cholesky ile O(d b^2)
+    sürede, değilse köşegen pivotlu simetrik SuperLU ile (L D L^T; tüm pivotlar
+    pozitifse matris pozitif tanımlıdır) ayrıştırılır.
+
+    Dönüş:
+        solve: b -> (h + tau I)^-1 b fonksiyonu.
+        tau: Eklenen köşegen kaydırma (pozitif tanımlıysa 0).
+    """
+    import scipy.sparse as sp
+
+    h = sp.csc_matrix(h, dtype=float)
+    n = h.shape[0]
+    diag = h.diagonal()
+    scale = beta * max(np.max(np.abs(diag)), 1.0)
+    tau = 0.0 if np.min(diag) > 0 else scale - np.min(diag)
+    coo = h.tocoo()
+    bandwidth = int(np.max(np.abs(coo.row - coo.col))) if coo.nnz else 0
+
+    if (bandwidth + 1) * n <= 2 * coo.nnz:
+        from scipy.linalg import cho_solve_banded, cholesky_banded
+        # Üst bant biçimi: ab[b - k, k:] = k. üst köşegen
+        ab = np.zeros((bandwidth + 1, n))
+        for k in range(bandwidth + 1):
+            ab[bandwidth - k, k:] = h.diagonal(k)
+        for _ in range(max_tries):
+            shifted = ab.copy()
+            shifted[bandwidth] += tau
+            try:
+                factor = cholesky_banded(shifted)
+                return lambda b: cho_solve_banded((factor, False), b), tau
+            except np.linalg.LinAlgError:
+                tau = max(2 * tau, scale)
+    else:
+        from scipy.sparse.linalg import splu
+        identity = sp.identity(n, format="csc")
+        for _ in range(max_tries):
+            try:
+                factor = splu(h + tau * identity if tau > 0 else h, permc_spec="MMD_AT_PLUS_A",
+                              diag_pivot_thresh=0.0, options={"SymmetricMode": True})
+                if np.array_equal(factor.perm_r, factor.perm_c) and np.all(factor.U.diagonal() > 0):
+                    return factor.solve, tau
+            except RuntimeError:
+                pass
+            tau = max(2 * tau, scale)
+    raise np.linalg.LinAlgError("Değiştirilmiş Cholesky ayrışımı başarısız oldu.")
+
+
+def _is_sparse(h):
+    # scipy.sparse yalnızca bir seyrek matris zaten oluşturulmuşsa yüklüdür
+    sparse = sys.modules.get("scipy.sparse")
+    return sparse is not None and sparse.issparse(h)
+
+
+def _factorize(h):
+    """
+    Hessian'ı (yoğun veya seyrek) değiştirilmiş Cholesky ile ayrıştırır; (solve, tau) döndürür.
+    """
+    if _is_sparse(h):
+        return sparse_modified_cholesky(h)
+    from scipy.linalg import cho_solve
+    factor, tau = modified_cholesky(np.asarray(h, dtype=float))
+    return lambda b: cho_solve(factor, b), tau
+
+
+def _solve(h, g):
+    """
+    H x = g sistemini tek seferlik çözer: yoğun matrislerde np.linalg.solve,
+    seyrek matrislerde seyrek LU (splu).
+    """
+    if _is_sparse(h):
+        from scipy.sparse.linalg import splu
+        try:
+            return splu(h.tocsc()).solve(g)
+        except RuntimeError as e:
+            raise np.linalg.LinAlgError(str(e)) from None
+    return np.linalg.solve(h, g)
+
+
+def newtons_method(func, grad, hessian, x0, tol=1e-5, max_iter=100, console_output=None, line_search=None,
+                   trace=None, refactor_every=None, refactor_ratio=0.5, fun_and_grad=None, hessian_sparsity=None):
+    """
+    Newton'un yönteminin uygulanması.
+
+    line_search verilirse (bkz. line_search.py) Newton yönü boyunca adım
+    büyüklüğü doğrusal arama ile seçilir; verilmezse tam Newton adımı atılır.
+    İterasyonlar trace (IterationTrace) üzerine kaydedilir; console_output
+    verilmişse metin satırları yalnızca çalışmanın sonunda üretilir.
+
+    refactor_every verilirse Hessian her iterasyonda np.linalg.solve ile
+    çözülmez: Cholesky çarpanı saklanır ve yalnızca her refactor_every
+    iterasyonda bir ya da gradyan normu refactor_ratio oranında azalmadığında
+    yeniden hesaplanır (Shamanskii / tembel Hessian). Hessian pozitif tanımlı
+    değilse köşegen kaydırmalı Cholesky kullanılır (bkz. modified_cholesky).
+    Sabit Hessian için refactor_every=max_iter ve refactor_ratio=None yeterlidir.
+
+    hessian(x) bir scipy.sparse matris döndürebilir; bu durumda sistem seyrek
+    LU ile, refactor_every verildiğinde seyrek değiştirilmiş Cholesky ile
+    (bkz. sparse_modified_cholesky) çözülür ve yoğun matris hiç oluşturulmaz.
+
+    grad veya hessian None ise türevler derivatives.py ile func'tan üretilir
+    (ters mod gradyan, gradyanın merkezi farklarıyla Hessian). hessian None
+    ve hessian_sparsity (Hessian'ın seyreklik deseni) verilmişse Hessian,
+    sütun renklendirmesiyle renk sayısı + 1 gradyan değerlendirmesinden
+    seyrek olarak üretilir (bkz. derivatives.make_sparse_hessian). fun_and_grad
+    verilirse f ve g tek geçişte hesaplanır; değerlendirme sayıları
+    trace.nfev ve trace.ngev alanlarına yazılır.
+    """
+    objective = Objective(func, grad, fun_and_grad)
+    func, grad = objective.func, objective.grad
+    if hessian is None:
+        hessian = make_hessian(grad) if hessian_sparsity is None else make_sparse_hessian(grad, hessian_sparsity)
+    if refactor_every is not None and refactor_every < 1:
+        raise ValueError("Yeniden ayrıştırma aralığı en az 1 olmalıdır.")
+    if trace is None:
+        trace = IterationTrace()
+    trace.start()
+
+    solve = None
+    factor_age = 0
+    factorizations = 0
+    g_norm_prev = np.inf
+
+    x = x0
+    fval = func(x)
+    g = grad(x)
+    g_norm = np.linalg.norm(g)
+    trace.record(0, x, fval, g_norm, force=True)
+
+    iterations = 0
+    for i in range(max_iter):
+        iterations = i + 1
+        if g_norm < tol:
+            trace.event(i, f"{i+1}. iterasyonda gradyan normu ile yakınsama sağlandı.")
+            break
+
+        if refactor_every is None:
+            try:
+                delta_x = -_solve(hessian(x), g)
+            except np.linalg.LinAlgError:
+                trace.event(i, "Hessian matrisi tekil, çözüm başarısız oldu.")
+                break
+        else:
+            stalled = refactor_ratio is not None and g_norm > refactor_ratio * g_norm_prev
+            if solve is None or factor_age >= refactor_every or stalled:
+                solve, tau = _factorize(hessian(x))
+                factor_age = 0
+                factorizations += 1
+                if tau > 0:
+                    trace.event(i, f"{i+1}. iterasyonda Hessian pozitif tanımlı değil, köşegen kaydırma: {tau:.3e}")
+            factor_age += 1
+            delta_x = -solve(g)
+        g_norm_prev = g_norm
+
+        alpha = 1.0
+        if line_search is not None:
+            if np.dot(g, delta_x) >= 0:
+                # Hessian pozitif tanımlı değilse Newton yönü iniş yönü olmayabilir
+                delta_x = -g
+            alpha, fval, g = line_search(func, grad, x, delta_x, fval, g)
+            delta_x = alpha * delta_x
+            x = x + delta_x
+        else:
+            x = x + delta_x
+            fval, g = func(x), grad(x)
+        # Kayıttaki gradyan normu kaydedilen x noktasına aittir
+        g_norm = np.linalg.norm(g)
+        step_norm = np.linalg.norm(delta_x)
+
+        if step_norm < tol:
+            trace.record(i + 1, x, fval, g_norm, alpha, force=True)
+            trace.event(i + 1, f"{i+1}. iterasyonda vektör değişimi ile yakınsama sağlandı.")
+            break
+        trace.record(i + 1, x, fval, g_norm, alpha)
+    else:
+        trace.flush()
+
+    if refactor_every is not None:
+        trace.event(iterations, f"Toplam Cholesky ayrışımı: {factorizations}")
+    objective.report(trace, iterations)
+    if console_output is not None:
+        console_output.extend(trace.render())
+
+    return x, trace.positions
+
+
+def finite_difference_hessp(grad, x, g, v):
+    """
+    Gradyanın ileri farkı ile Hessian-vektör çarpımı: H v ~ (grad(x + e v) - g) / e
+    """
+    v_norm = np.linalg.norm(v)
+    if v_norm == 0:
+        return np.zeros_like(v)
+    eps = np.sqrt(np.finfo(float).eps) * (1 + np.linalg.norm(x)) / v_norm
+    return (grad(x + eps * v) - g) / eps
+
+
+def _newton_cg_direction(matvec, g, tol, max_iter=None):
+    """
+    Newton sistemi H p = -g'yi Conjugate-Gradient-Project-3'teki cg_solve ile
+    sıfırdan başlayarak kesik olarak çözer: göreli artık ||g + H p|| / ||g||
+    tol'un altına düşünce veya negatif eğrilik bulununca (p.Hp <= 0) durulur.
+
+    Dönüş:
+        p: Yaklaşık Newton yönü.
+        hp: H p (ek Hessian çarpımı yapılmadan iterasyonlar boyunca güncellenir).
+        info: cg_solve'un iterasyon bilgileri.
+    """
+    from scipy.sparse.linalg import LinearOperator
+    from .sweep import _load_module
+
+    cg_solve = _load_module("Conjugate-Gradient-Project-3", "conjugate_gradient_laplace.py",
+                            "conjugate_gradient_laplace").cg_solve
+    n = g.shape[0]
+    p, info = cg_solve(LinearOperator((n, n), matvec=matvec, dtype=float), -g, tol=tol, maxiter=max_iter,
+                       return_ax=True)
+    return p, info.pop("Ax"), info
+
+
+def newton_cg_method(func, grad, x0, hessp=None, tol=1e-5, max_iter=100, console_output=None, line_search=None,
+                     trace=None, eta_max=0.01, max_inner_iter=None, fun_and_grad=None):
+    """
+    Kesik Newton (Newton-CG) yöntemi.
+
+    Newton sistemi H p = -g, Hessian oluşturulmadan iç CG iterasyonları ile
+    (Conjugate-Gradient-Project-3'teki cg_solve) yaklaşık olarak çözülür. İç döngü,
+    göreli artık Eisenstat-Walker zorlama terimi eta_k'nin altına düşünce
+    durur; negatif eğrilik bulunursa o ana kadarki yön (ilk adımda -g) kullanılır.
+
+    Parametreler:
+        func: Minimize edilecek fonksiyon.
+        grad: Fonksiyonun gradyanı.
+        x0: Başlangıç noktası (numpy array).
+        hessp: Hessian-vektör çarpımı hessp(x, v); verilmezse gradyanın
+            sonlu farklarıyla hesaplanır.
+        tol: Gradyan normu ve adım için durma toleransı.
+        max_iter: Maksimum (dış) iterasyon sayısı.
+        console_output: Konsol çıktıları için bir liste (arayüze aktarmak için).
+        line_search: Doğrusal arama (varsayılan: geri izlemeli Armijo).
+        trace: İterasyon kayıtçısı (IterationTrace).
+        eta_max: Zorlama teriminin üst sınırı. Büyük değerler iç CG
+            iterasyonlarını kısaltır ama dış iterasyonları artırır (2 boyutlu
+            Rosenbrock'ta 0.9 ile 68, 0.01 ile 21 iterasyon).
+        max_inner_iter: İç CG iterasyonu sınırı (varsayılan: boyut).
+        fun_and_grad: (f, g) döndüren birleşik fonksiyon (func ve grad yerine).
+
+    Dönüş:
+        x_opt: Optimum çözüm.
+        history: Kayıtlı noktaların (k, d) dizisi.
+    """
+    from .line_search import backtracking_armijo
+
+    objective = Objective(func, grad, fun_and_grad)
+    func, grad = objective.func, objective.grad
+    if line_search is None:
+        line_search = backtracking_armijo
+    if trace is None:
+        trace = IterationTrace()
+    trace.start()
+
+    x = np.array(x0, dtype=float)
+    fval = func(x)
+    g = grad(x)
+    g_norm = np.linalg.norm(g)
+    trace.record(0, x, fval, g_norm, force=True)
+
+    eta = min(0.5, eta_max)
+    golden = (1 + np.sqrt(5)) / 2
+    inner_total = 0
+
+    iterations = 0
+    for i in range(max_iter):
+        iterations = i + 1
+        if g_norm < tol:
+            trace.event(i, f"{i+1}. iterasyonda gradyan normu ile yakınsama sağlandı.")
+            break
+
+        if hessp is None:
+            def matvec(v, x=x, g=g):
+                return finite_difference_hessp(grad, x, g, v)
+        else:
+            def matvec(v, x=x):
+                return hessp(x, v)
+
+        p, hp, info = _newton_cg_direction(matvec, g, eta, max_inner_iter)
+        inner_total += info["iterations"]
+        if np.dot(g, p) >= 0:
+            # İlk adımda negatif eğrilik (p = 0) veya iniş yönü değil: en dik iniş
+            # yönü kullanılır; H p yalnızca bu durumda ayrıca hesaplanır
+            p = -g
+            hp = matvec(p)
+
+        alpha, f_new, g_new = line_search(func, grad, x, p, fval, g)
+        s = alpha * p
+        # Doğrusal modelin sonraki noktadaki gradyan normu: ||g + H s|| = ||g + alpha H p||
+        model_norm = np.linalg.norm(g + alpha * hp)
+        x = x + s
+        fval = f_new
+        g_norm_prev, g = g_norm, g_new
+        g_norm = np.linalg.norm(g)
+
+        # Eisenstat-Walker zorlama terimi (seçim 1): model ile gerçek
+        # gradyan uyumluysa iç çözüm sıkılaştırılır
+        eta_new = abs(g_norm - model_norm) / g_norm_prev
+        safeguard = eta ** golden
+        if safeguard > 0.1:
+            eta_new = max(eta_new, safeguard)
+        eta = min(eta_new, eta_max)
+
+        if np.linalg.norm(s) < tol:
+            trace.record(i + 1, x, fval, g_norm, alpha, force=True)
+            trace.event(i + 1, f"{i+1}. iterasyonda vektör değişimi ile yakınsama sağlandı.")
+            break
+        trace.record(i + 1, x, fval, g_norm, alpha)
+    else:
+        trace.flush()
+
+    trace.event(iterations, f"Toplam iç CG iterasyonu: {inner_total}")
+    objective.report(trace, iterations)
+    if console_output is not None:
+        console_output.extend(trace.render())
+
+    return x, trace.positions
+
+
+def _boundary_step(z, d, radius):
+    """
+    ||z + tau d|| = radius denkleminin pozitif kökü tau.
+    """
+    dd = np.dot(d, d)
+    zd = np.dot(z, d)
+    zz = np.dot(z, z)
+    return (-zd + np.sqrt(max(zd * zd - dd * (zz - radius * radius), 0.0))) / dd
+
+
+def steihaug_cg(hessp, g, radius, tol, max_iter=None):
+    """
+    Güven bölgesi alt problemini min g.p + p.Hp/2, ||p|| <= radius,
+    Steihaug-Toint kesik CG yöntemi ile yaklaşık çözer (Nocedal & Wright,
+    Algoritma 7.2). Negatif eğrilik bulunduğunda veya iterasyon bölge
+    dışına çıktığında adım o yön boyunca sınıra uzatılır.
+
+    Parametreler:
+        hessp: v -> H v fonksiyonu.
+        g: Modelin gradyanı.
+        radius: Güven bölgesi yarıçapı.
+        tol: Model gradyanı ||g + H p|| için durma toleransı.
+        max_iter: İç iterasyon sınırı (varsayılan: boyut).
+
+    Dönüş:
+        p: Adım.
+        model: Modeldeki değişim g.p + p.Hp/2 (ek Hessian çarpımı yapılmadan).
+        info: iterations, boundary (adım sınırda) ve negative_curvature alanlarını içeren sözlük.
+    """
+    n = g.shape[0]
+    if max_iter is None:
+        max_iter = n
+    z = np.zeros(n)
+    r = g.copy()
+    d = -r
+    rr = np.dot(r, r)
+    info = {"iterations": 0, "boundary": False, "negative_curvature": False}
+
+    for j in range(max_iter):
+        if np.sqrt(rr) < tol:
+            break
+        info["iterations"] = j + 1
+        hd = hessp(d)
+        curvature = np.dot(d, hd)
+        if curvature <= 0:
+            tau = _boundary_step(z, d, radius)
+            z += tau * d
+            r += tau * hd
+            info["boundary"] = info["negative_curvature"] = True
+            break
+        alpha = rr / curvature
+        if np.linalg.norm(z + alpha * d) >= radius:
+            tau = _boundary_step(z, d, radius)
+            z += tau * d
+            r += tau * hd
+            info["boundary"] = True
+            break
+        z += alpha * d
+        r += alpha * hd
+        rr_new = np.dot(r, r)
+        d = -r + (rr_new / rr) * d
+        rr = rr_new
+
+    # r = g + H z olduğundan model değişimi g.z + z.Hz/2 = z.(g + r)/2
+    return z, 0.5 * np.dot(z, g + r), info
+
+
+def trust_region_newton_method(func, grad, x0, hessian=None, hessp=None, tol=1e-5, max_iter=100, console_output=None,
+                               trace=None, radius=1.0, max_radius=1e3, accept_ratio=0.1, max_inner_iter=None,
+                               fun_and_grad=None):
+    """
+    Steihaug-Toint CG alt problem çözücülü güven bölgesi Newton yöntemi.
+
+    Her iterasyonda ikinci dereceden model, ||p|| <= radius bölgesinde
+    steihaug_cg ile çözülür; gerçek ve öngörülen azalmanın oranı rho'ya göre
+    adım kabul edilir (rho > accept_ratio) ve yarıçap güncellenir (rho < 1/4
+    ise dörtte birine küçülür, rho > 3/4 ve adım sınırdaysa iki katına
+    çıkar). Hessian pozitif tanımlı olmasa da adım her zaman modeli azaltır;
+    tekil Hessian durmaya yol açmaz.
+
+    Parametreler:
+        func: Minimize edilecek fonksiyon.
+        grad: Fonksiyonun gradyanı.
+        x0: Başlangıç noktası (numpy array).
+        hessian: Yoğun veya scipy.sparse Hessian döndüren hessian(x).
+        hessp: Hessian-vektör çarpımı hessp(x, v); hessian yerine kullanılabilir.
+            İkisi de verilmezse gradyanın sonlu farklarıyla hesaplanır.
+        tol: Gradyan normu ve adım için durma toleransı.
+        max_iter: Maksimum (dış) iterasyon sayısı.
+        console_output: Konsol çıktıları için bir liste (arayüze aktarmak için).
+        trace: İterasyon kayıtçısı (IterationTrace).
+        radius: Başlangıç güven bölgesi yarıçapı.
+        max_radius: Yarıçapın üst sınırı.
+        accept_ratio: Adımın kabulü için gereken en küçük rho.
+        max_inner_iter: İç CG iterasyonu sınırı (varsayılan: boyut).
+        fun_and_grad: (f, g) döndüren birleşik fonksiyon (func ve grad yerine).
+
+    Dönüş:
+        x_opt: Optimum çözüm.
+        history: Kayıtlı noktaların (k, d) dizisi.
+    """
+    objective = Objective(func, grad, fun_and_grad)
+    func, grad = objective.func, objective.grad
+    if trace is None:
+        trace = IterationTrace()
+    trace.start()
+
+    x = np.array(x0, dtype=float)
+    fval = func(x)
+    g = grad(x)
+    g_norm = np.linalg.norm(g)
+    trace.record(0, x, fval, g_norm, force=True)
+
+    inner_total = 0
+    rejected = 0
+    negative_curvature = 0
+
+    iterations = 0
+    for i in range(max_iter):
+        iterations = i + 1
+        if g_norm < tol:
+            trace.event(i, f"{i+1}. iterasyonda gradyan normu ile yakınsama sağlandı.")
+            break
+
+        if hessp is not None:
+            def matvec(v, x=x):
+                return hessp(x, v)
+        elif hessian is not None:
+            h = hessian(x)
+            def matvec(v, h=h):
+                return h @ v
+        else:
+            def matvec(v, x=x, g=g):
+                return finite_difference_hessp(grad, x, g, v)
+
+        # Zorlama terimi min(1/2, sqrt||g||) süper-lineer yakınsama sağlar
+        p, model, info = steihaug_cg(matvec, g, radius, min(0.5, np.sqrt(g_norm)) * g_norm, max_inner_iter)
+        inner_total += info["iterations"]
+        negative_curvature += info["negative_curvature"]
+
+        f_new = func(x + p)
+        rho = (fval - f_new) / -model if model < 0 and np.isfinite(f_new) else -np.inf
+        p_norm = np.linalg.norm(p)
+        if rho < 0.25:
+            radius *= 0.25
+        elif rho > 0.75 and info["boundary"]:
+            radius = min(2 * radius, max_radius)
+
+        if rho > accept_ratio:
+            x = x + p
+            fval = f_new
+            g = grad(x)
+            g_norm = np.linalg.norm(g)
+            if p_norm < tol:
+                trace.record(i + 1, x, fval, g_norm, 1.0, force=True)
+                trace.event(i + 1, f"{i+1}. iterasyonda vektör değişimi ile yakınsama sağlandı.")
+                break
+        else:
+            rejected += 1
+            if radius < np.finfo(float).eps * max(1.0, np.linalg.norm(x)):
+                trace.event(i + 1, f"{i+1}. iterasyonda güven bölgesi yarıçapı çok küçüldü, durduruldu.")
+                break
+        # Adım sütunu diğer yöntemlerdeki alpha ile aynı anlamdadır: kabul
+        # edilen model adımı için 1, reddedilen adım için 0
+        trace.record(i + 1, x, fval, g_norm, 1.0 if rho > accept_ratio else 0.0)
+    else:
+        trace.flush()
+
+    trace.event(iterations, f"Toplam iç CG iterasyonu: {inner_total}, reddedilen adım: {rejected}, "
+                            f"negatif eğrilik: {negative_curvature}")
+    objective.report(trace, iterations)
+    if console_output is not None:
+        console_output.extend(trace.render())
+
+    return x, trace.positions
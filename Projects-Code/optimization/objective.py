@@ -0,0 +1,97 @@
+import numpy as np
+from .derivatives import make_gradient
+
+
+def fuse(func, grad):
+    """
+    Ayrı func ve grad fonksiyonlarından fun_and_grad(x) -> (f, g) üretir.
+    """
+    def fun_and_grad(x):
+        return func(x), grad(x)
+    return fun_and_grad
+
+
+def split(fun_and_grad):
+    """
+    fun_and_grad(x) -> (f, g) fonksiyonunu, son noktayı paylaşan ayrı func ve
+    grad fonksiyonlarına ayırır; aynı noktada func ve grad çağrıları tek
+    değerlendirmeye karşılık gelir.
+    """
+    objective = Objective(fun_and_grad=fun_and_grad)
+    return objective.func, objective.grad
+
+
+class Objective:
+    """
+    Amaç fonksiyonu ve gradyanı için değerlendirme sayan, son noktayı
+    hatırlayan sarmalayıcı.
+
+    fun_and_grad verilirse f ve g tek geçişte hesaplanır ve aynı noktadaki
+    func/grad çağrılarından yalnızca ilki değerlendirme yapar. Ayrı func ve
+    grad verilirse her biri kendi son noktasını hatırlar; grad None ise
+    derivatives.make_gradient ile üretilir.
+
+    Parametreler:
+    func: Amaç fonksiyonu.
+    grad: Gradyan fonksiyonu.
+    fun_and_grad: (f, g) döndüren birleşik fonksiyon.
+    """
+
+    def __init__(self, func=None, grad=None, fun_and_grad=None):
+        if fun_and_grad is None:
+            if func is None:
+                raise ValueError("func veya fun_and_grad verilmelidir.")
+            if grad is None:
+                grad = make_gradient(func)
+        self._func = func
+        self._grad = grad
+        self._fun_and_grad = fun_and_grad
+        self.nfev = 0
+        self.ngev = 0
+        self._f_x = None
+        self._f = None
+        self._g_x = None
+        self._g = None
+
+    @staticmethod
+    def _same(a, b):
+        return a is not None and a.shape == b.shape and np.array_equal(a, b)
+
+    def _evaluate(self, x):
+        f, g = self._fun_and_grad(x)
+        self.nfev += 1
+        self.ngev += 1
+        self._f_x = self._g_x = np.array(x, dtype=float)
+        self._f, self._g = f, np.asarray(g, dtype=float)
+
+    def func(self, x):
+        x = np.asarray(x)
+        if not self._same(self._f_x, x):
+            if self._fun_and_grad is not None:
+                self._evaluate(x)
+            else:
+                self._f = self._func(x)
+                self._f_x = np.array(x, dtype=float)
+                self.nfev += 1
+        return self._f
+
+    def grad(self, x):
+        x = np.asarray(x)
+        if not self._same(self._g_x, x):
+            if self._fun_and_grad is not None:
+                self._evaluate(x)
+            else:
+                self._g = np.asarray(self._grad(x), dtype=float)
+                self._g_x = np.array(x, dtype=float)
+                self.ngev += 1
+        return self._g
+
+    def fun_and_grad(self, x):
+        return self.func(x), self.grad(x)
+
+    def report(self, trace, iteration):
+        """
+        Değerlendirme sayılarını trace üzerine yazar ve olay olarak ekler.
+        """
+        trace.nfev, trace.ngev = self.nfev, self.ngev
+        trace.event(iteration, f"Fonksiyon değerlendirmesi: {self.nfev}, gradyan değerlendirmesi: {self.ngev}")
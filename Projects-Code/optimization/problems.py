@@ -0,0 +1,183 @@
+import numpy as np
+
+def function(x):
+    """
+    Amaç fonksiyonu f(x1, x2) = x1^2 - x1*x2 + x2^2 + x1 + x2.
+    """
+    x1, x2 = x
+    return x1**2 - x1*x2 + x2**2 + x1 + x2
+
+def gradient(x):
+    """
+    Fonksiyonun gradyanı (türev vektörü).
+    """
+    x1, x2 = x
+    return np.array([2*x1 - x2 + 1, 2*x2 - x1 + 1])
+
+def hessian(_x):
+    """
+    Hessian matrisi hesaplanır.
+    """
+    return np.array([[2, -1], [-1, 2]])
+
+def rosenbrock(x):
+    """
+    Zincirli Rosenbrock fonksiyonu: sum(100 (x[i+1] - x[i]^2)^2 + (1 - x[i])^2).
+    """
+    x = np.asarray(x)
+    return np.sum(100 * (x[1:] - x[:-1]**2)**2 + (1 - x[:-1])**2, axis=0)
+
+def rosenbrock_gradient(x):
+    """
+    Rosenbrock fonksiyonunun gradyanı.
+    """
+    x = np.asarray(x, dtype=float)
+    t = x[1:] - x[:-1]**2
+    g = np.zeros_like(x)
+    g[:-1] = -400 * x[:-1] * t - 2 * (1 - x[:-1])
+    g[1:] += 200 * t
+    return g
+
+def rosenbrock_hessian(x):
+    """
+    Rosenbrock fonksiyonunun (üç köşegenli) Hessian matrisi.
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.shape[0]
+    h = np.zeros((n, n))
+    i = np.arange(n - 1)
+    h[i, i] = 1200 * x[:-1]**2 - 400 * x[1:] + 2
+    h[i + 1, i + 1] += 200
+    h[i, i + 1] = h[i + 1, i] = -400 * x[:-1]
+    return h
+
+def rosenbrock_hessian_sparse(x):
+    """
+    Rosenbrock Hessian'ının scipy.sparse (CSC) üç köşegenli biçimi.
+    """
+    import scipy.sparse as sp
+
+    x = np.asarray(x, dtype=float)
+    main = np.zeros_like(x)
+    main[:-1] = 1200 * x[:-1]**2 - 400 * x[1:] + 2
+    main[1:] += 200
+    off = -400 * x[:-1]
+    return sp.diags([off, main, off], [-1, 0, 1], format="csc")
+
+def extended_rosenbrock(x):
+    """
+    Genişletilmiş Rosenbrock fonksiyonu: ardışık (x[2i], x[2i+1]) çiftleri
+    üzerinde birbirinden bağımsız 2 boyutlu Rosenbrock terimlerinin toplamı.
+    """
+    x = np.asarray(x)
+    odd, even = x[0::2], x[1::2]
+    return np.sum(100 * (even - odd**2)**2 + (1 - odd)**2, axis=0)
+
+def extended_rosenbrock_gradient(x):
+    """
+    Genişletilmiş Rosenbrock fonksiyonunun gradyanı.
+    """
+    x = np.asarray(x, dtype=float)
+    odd, even = x[0::2], x[1::2]
+    t = even - odd**2
+    g = np.empty_like(x)
+    g[0::2] = -400 * odd * t - 2 * (1 - odd)
+    g[1::2] = 200 * t
+    return g
+
+def extended_rosenbrock_hessian(x):
+    """
+    Genişletilmiş Rosenbrock fonksiyonunun (2x2 bloklu) Hessian matrisi.
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.shape[0]
+    odd, even = x[0::2], x[1::2]
+    h = np.zeros((n, n))
+    i = np.arange(0, n, 2)
+    h[i, i] = 1200 * odd**2 - 400 * even + 2
+    h[i + 1, i + 1] = 200
+    h[i, i + 1] = h[i + 1, i] = -400 * odd
+    return h
+
+def rastrigin(x, a=10.0):
+    """
+    Rastrigin fonksiyonu: a n + sum(x^2 - a cos(2 pi x)); çok sayıda yerel minimumu vardır.
+    """
+    x = np.asarray(x)
+    return a * x.shape[0] + np.sum(x**2 - a * np.cos(2 * np.pi * x), axis=0)
+
+def rastrigin_gradient(x, a=10.0):
+    """
+    Rastrigin fonksiyonunun gradyanı.
+    """
+    x = np.asarray(x, dtype=float)
+    return 2 * x + 2 * np.pi * a * np.sin(2 * np.pi * x)
+
+def rastrigin_hessian(x, a=10.0):
+    """
+    Rastrigin fonksiyonunun (köşegen) Hessian matrisi.
+    """
+    x = np.asarray(x, dtype=float)
+    return np.diag(2 + 4 * np.pi**2 * a * np.cos(2 * np.pi * x))
+
+_BEALE_C = np.array([1.5, 2.25, 2.625])
+
+def beale(x):
+    """
+    Beale fonksiyonu: sum((c_k - x1 (1 - x2^k))^2), minimumu (3, 0.5).
+    """
+    x1, x2 = x
+    k = np.arange(1, 4)
+    return np.sum((_BEALE_C - x1 * (1 - x2**k))**2)
+
+def beale_gradient(x):
+    """
+    Beale fonksiyonunun gradyanı.
+    """
+    x1, x2 = x
+    k = np.arange(1, 4)
+    r = _BEALE_C - x1 * (1 - x2**k)
+    return np.array([np.sum(-2 * r * (1 - x2**k)), np.sum(2 * r * x1 * k * x2**(k - 1))])
+
+def beale_hessian(x):
+    """
+    Beale fonksiyonunun Hessian matrisi.
+    """
+    x1, x2 = x
+    k = np.arange(1, 4)
+    r = _BEALE_C - x1 * (1 - x2**k)
+    dr1 = -(1 - x2**k)
+    dr2 = x1 * k * x2**(k - 1)
+    h12 = np.sum(2 * dr1 * dr2 + 2 * r * k * x2**(k - 1))
+    h22 = np.sum(2 * dr2**2 + 2 * r * x1 * k * (k - 1) * x2**np.maximum(k - 2, 0))
+    return np.array([[np.sum(2 * dr1**2), h12], [h12, h22]])
+
+def ill_conditioned_quadratic(d, condition=1e4):
+    """
+    Köşegen Hessian'ı logaritmik aralıklı özdeğerlere sahip, koşul sayısı
+    condition olan f(x) = 0.5 sum(lambda_i x_i^2) - sum(x_i) fonksiyonunu üretir.
+
+    Döndürür:
+    (func, grad, hessian) üçlüsü.
+    """
+    eigenvalues = np.logspace(0, np.log10(condition), d)
+
+    def func(x):
+        return 0.5 * np.sum(eigenvalues * x**2) - np.sum(x)
+
+    def grad(x):
+        return eigenvalues * x - 1
+
+    def hessian(_x):
+        return np.diag(eigenvalues)
+
+    return func, grad, hessian
+
+# Ada göre seçilebilen test problemleri: (func, grad, hessian)
+PROBLEMS = {
+    "quadratic": (function, gradient, hessian),
+    "rosenbrock": (rosenbrock, rosenbrock_gradient, rosenbrock_hessian),
+    "extended_rosenbrock": (extended_rosenbrock, extended_rosenbrock_gradient, extended_rosenbrock_hessian),
+    "rastrigin": (rastrigin, rastrigin_gradient, rastrigin_hessian),
+    "beale": (beale, beale_gradient, beale_hessian),
+}
@@ -0,0 +1,267 @@
+import importlib.util
+import inspect
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .iteration_trace import IterationTrace
+
+# Her çalışma için işçi süreçten dönen kayıt; history listeleri yerine
+# yalnızca bu sabit boyutlu alanlar aktarılır
+RESULT_DTYPE = np.dtype([
+    ("run", np.int64),
+    ("iterations", np.int64),
+    ("nfev", np.int64),
+    ("f", np.float64),
+    ("time", np.float64),
+    ("failed", np.bool_),
+])
+
+METHODS = ("fletcher_reeves", "newton", "newton_cg", "trust_region", "lbfgs", "bracketing", "quadratic", "cubic")
+
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir)
+_ONE_DIMENSIONAL = {
+    "bracketing": ("Golden-Search-Bracketing-algorithm-Project-1", "braketing.py", "braketing", "bracketing_method"),
+    "quadratic": ("Quadratic-Cubic-Interpolation-Project-2", "quadratic-cubic.py", "quadratic_cubic",
+                  "quadratic_interpolation"),
+    "cubic": ("Quadratic-Cubic-Interpolation-Project-2", "quadratic-cubic.py", "quadratic_cubic",
+              "cubic_interpolation"),
+}
+
+
+def _load_module(directory, filename, name):
+    """
+    Proje klasöründeki bir betiği modül olarak yükler ve sys.modules'e ekler;
+    böylece içindeki fonksiyonlar işçi süreçlere adıyla aktarılabilir.
+    """
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(_ROOT, directory, filename))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+def _init_worker():
+    for directory, filename, name, _ in _ONE_DIMENSIONAL.values():
+        _load_module(directory, filename, name)
+
+
+def resolve_method(name):
+    """
+    Yöntem adını (çözücü fonksiyonu, tek boyutlu mu) ikilisine çevirir.
+    """
+    if name == "fletcher_reeves":
+        from .fletcher_reeves import fletcher_reeves_method
+        return fletcher_reeves_method, False
+    if name == "newton":
+        from .newtons_method import newtons_method
+        return newtons_method, False
+    if name == "newton_cg":
+        from .newtons_method import newton_cg_method
+        return newton_cg_method, False
+    if name == "trust_region":
+        from .newtons_method import trust_region_newton_method
+        return trust_region_newton_method, False
+    if name == "lbfgs":
+        from .lbfgs import lbfgs_method
+        return lbfgs_method, False
+    if name in _ONE_DIMENSIONAL:
+        directory, filename, module_name, function_name = _ONE_DIMENSIONAL[name]
+        return getattr(_load_module(directory, filename, module_name), function_name), True
+    raise ValueError(f"Bilinmeyen yöntem: {name}")
+
+
+def default_objective(method):
+    """
+    Yöntem için varsayılan amaç fonksiyonu: çok boyutlu yöntemlerde problems.function,
+    tek boyutlu yöntemlerde braketing.f.
+    """
+    if resolve_method(method)[1]:
+        return _load_module(*_ONE_DIMENSIONAL["bracketing"][:3]).f, None, None
+    from .problems import function, gradient, hessian
+    return function, gradient, hessian
+
+
+class _CountingFunction:
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.func(x)
+
+
+def _run_chunk(method, func, grad, hessian, chunk):
+    """
+    İşçi süreçte bir grup çalışmayı yapar ve RESULT_DTYPE kayıtları döndürür.
+    Bir çalışmada oluşan her hata o çalışmayı failed=True olarak işaretler;
+    taramanın geri kalanı sürer.
+    """
+    solver, one_dimensional = resolve_method(method)
+    records = np.zeros(len(chunk), dtype=RESULT_DTYPE)
+    for k, (run, params) in enumerate(chunk):
+        trace = IterationTrace(capacity=16, store_x=False)
+        counted = _CountingFunction(func)
+        start = time.perf_counter()
+        failed = False
+        try:
+            if one_dimensional:
+                result = solver(counted, verbose=False, trace=trace, **params)
+                x = result[0] if isinstance(result, tuple) else result
+                failed = x is None
+                f_final = np.nan if failed else float(func(x))
+                nfev = counted.calls
+            else:
+                extra = {"hessian": hessian} if method in ("newton", "trust_region") else {}
+                x, _ = solver(func, grad, trace=trace, **extra, **params)
+                f_final = float(func(x))
+                nfev = trace.nfev
+        except Exception:
+            failed, f_final, nfev = True, np.nan, counted.calls
+        elapsed = time.perf_counter() - start
+        iterations = int(trace.column("iteration")[-1]) if len(trace) else 0
+        records[k] = (run, iterations, nfev, f_final, elapsed, failed)
+    return records
+
+
+def parameter_grid(grid):
+    """
+    {parametre: değer listesi} sözlüğünden tüm kombinasyonların listesini üretir.
+    """
+    keys = list(grid)
+    for key in keys:
+        if not isinstance(key, str) or not key.isidentifier():
+            raise ValueError(f"Geçersiz parametre adı: {key!r}")
+        if isinstance(grid[key], (str, bytes)) or not hasattr(grid[key], "__len__") or len(grid[key]) == 0:
+            raise ValueError(f"'{key}' parametresi için boş olmayan bir değer listesi verilmelidir.")
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+
+def sweep(method, grid, func=None, grad=None, hessian=None, jobs=None, chunks_per_job=4):
+    """
+    Parametre ızgarasındaki tüm çalışmaları süreç havuzunda paralel yürütür.
+
+    Parametreler:
+    method: METHODS içindeki yöntem adı.
+    grid: {parametre: değer listesi}; anahtarlar çözücünün anahtar kelime
+        argümanlarıdır (örn. x0, tol, max_iter, restart_interval veya a, b).
+    func, grad, hessian: Amaç fonksiyonu ve türevleri; modül düzeyinde
+        tanımlı (pickle edilebilir) olmalıdır. Verilmezse default_objective.
+    jobs: İşçi süreç sayısı (varsayılan: tüm çekirdekler, 1 ise havuz kullanılmaz).
+    chunks_per_job: İşçi başına görev sayısı (yük dengesi için).
+
+    Döndürür:
+    Çalışma parametreleri listesi ve RESULT_DTYPE kayıt dizisi. Izgara
+    çalıştırmadan önce denetlenir (geçersizse ValueError); çalışma sırasında
+    oluşan hatalar yalnızca ilgili kaydı failed=True yapar.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
+    if func is None:
+        func, default_grad, default_hessian = default_objective(method)
+        grad = default_grad if grad is None else grad
+        hessian = default_hessian if hessian is None else hessian
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    solver, _ = resolve_method(method)
+    parameters = inspect.signature(solver).parameters
+    if not any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        unknown = [key for key in grid if key not in parameters]
+        if unknown:
+            raise ValueError(f"{method} yöntemi şu parametreleri kabul etmiyor: {', '.join(map(str, unknown))}")
+    runs = parameter_grid(grid)
+    indexed = list(enumerate(runs))
+    if jobs == 1:
+        return runs, _run_chunk(method, func, grad, hessian, indexed)
+
+    n_chunks = min(len(indexed), jobs * chunks_per_job)
+    chunks = [indexed[k::n_chunks] for k in range(n_chunks)]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+        futures = [executor.submit(_run_chunk, method, func, grad, hessian, chunk) for chunk in chunks]
+        records = np.concatenate([future.result() for future in futures])
+    return runs, np.sort(records, order="run")
+
+
+def save_results(path, runs, records):
+    """
+    Sonuçları sütun biçiminde .npz dosyasına yazar: her parametre ve her kayıt
+    alanı ayrı bir dizi olarak saklanır (x0 gibi vektörler (çalışma, d) boyutunda).
+    """
+    columns = {name: records[name] for name in RESULT_DTYPE.names}
+    for key in runs[0]:
+        column = np.array([run[key] for run in runs])
+        if column.dtype == object:
+            # Fonksiyon gibi sayısal olmayan parametreler metin olarak saklanır
+            column = np.array([str(run[key]) for run in runs])
+        columns["param_" + key] = column
+    np.savez(path, **columns)
+
+
+def summarize(runs, records):
+    """
+    Parametre değerlerine göre ortalama iterasyon, değerlendirme ve süre yazdırır.
+    """
+    ok = ~records["failed"]
+    print(f"Çalışma sayısı: {len(records)}, başarısız: {np.count_nonzero(~ok)}")
+    for key in runs[0]:
+        values = [run[key] for run in runs]
+        if not np.isscalar(values[0]):
+            continue
+        for value in sorted(set(values)):
+            mask = ok & np.array([v == value for v in values])
+            if np.any(mask):
+                print(f"    {key} = {value}: iterasyon {records['iterations'][mask].mean():.1f}, "
+                      f"f değer. {records['nfev'][mask].mean():.1f}, süre {records['time'][mask].mean() * 1e3:.3f} ms")
+
+
+def measure_scaling(method, grid, max_jobs=None, **kwargs):
+    """
+    Aynı taramayı 1'den max_jobs'a kadar işçi sayısıyla çalıştırıp hızlanmayı raporlar.
+    """
+    if max_jobs is None:
+        max_jobs = os.cpu_count() or 1
+    n_runs = len(parameter_grid(grid))
+    baseline = None
+    print(f"{'işçi':>6}{'süre (s)':>12}{'çalışma/s':>12}{'hızlanma':>10}")
+    for jobs in range(1, max_jobs + 1):
+        start = time.perf_counter()
+        sweep(method, grid, jobs=jobs, **kwargs)
+        elapsed = time.perf_counter() - start
+        baseline = elapsed if baseline is None else baseline
+        print(f"{jobs:>6}{elapsed:>12.3f}{n_runs / elapsed:>12.0f}{baseline / elapsed:>10.2f}")
+
+
+def main():
+    """
+    Örnek tarama: Fletcher-Reeves ve altın oran araması, ardından ölçekleme ölçümü.
+    """
+    from functools import partial
+    from .line_search import strong_wolfe
+
+    rng = np.random.default_rng(0)
+    grid = {
+        "line_search": [partial(strong_wolfe, c2=0.1)],
+        "x0": list(rng.uniform(-10, 10, size=(50, 2))),
+        "tol": [1e-4, 1e-6],
+        "max_iter": [50, 200],
+        "restart_interval": [2, 10],
+    }
+    runs, records = sweep("fletcher_reeves", grid)
+    summarize(runs, records)
+    save_results("sweep_fletcher_reeves.npz", runs, records)
+
+    runs, records = sweep("bracketing", {"a": [-2.0, -1.0], "b": [1.0, 2.0], "tol": [1e-4, 1e-8, 1e-12]})
+    summarize(runs, records)
+
+    print("\nİşçi sayısına göre ölçekleme:")
+    grid["x0"] = list(rng.uniform(-10, 10, size=(1000, 2)))
+    measure_scaling("fletcher_reeves", grid, max_jobs=max(2, os.cpu_count() or 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+from functools import lru_cache
+import numpy as np
+
+# matplotlib yalnızca çizim fonksiyonları çağrıldığında içe aktarılır; çözücü
+# çekirdeği ve toplu işler görüntü arka ucu olmadan çalışabilir.
+
+# Kontur arka planları (fonksiyon, sınırlar) anahtarıyla saklanır; aynı
+# arka plan için yalnızca optimizasyon yolu yeniden çizilir
+_figure_cache = {}
+
+@lru_cache(maxsize=8)
+def contour_grid(func, bounds=(-10, 10, -10, 10), resolution=400):
+    """
+    Kontur için değerlendirilmiş ızgarayı (X1, X2, Z) döndürür; sonuçlar önbelleğe alınır.
+    """
+    x1_vals = np.linspace(bounds[0], bounds[1], resolution)
+    x2_vals = np.linspace(bounds[2], bounds[3], resolution)
+    X1, X2 = np.meshgrid(x1_vals, x2_vals)
+    Z = func([X1, X2])
+    return X1, X2, Z
+
+def path_bounds(history, margin=0.2, min_span=1.0):
+    """
+    Yolun sınırlayıcı kutusunu kenar payıyla genişletip yuvarlar; birbirine
+    yakın yollar aynı sınırları (ve aynı önbellek girdisini) paylaşır.
+    """
+    lower = history[:, :2].min(axis=0)
+    upper = history[:, :2].max(axis=0)
+    span = max(np.max(upper - lower) * (1 + 2 * margin), min_span)
+    quantum = 2.0 ** np.ceil(np.log2(span / 4))
+    lower = np.floor((lower - margin * span) / quantum) * quantum
+    upper = np.ceil((upper + margin * span) / quantum) * quantum
+    return (float(lower[0]), float(upper[0]), float(lower[1]), float(upper[1]))
+
+def downsample_path(history, max_points=2000):
+    """
+    Çok uzun yolları ilk ve son nokta korunarak eşit aralıklı max_points noktaya indirir.
+    """
+    if len(history) <= max_points:
+        return history
+    index = np.unique(np.linspace(0, len(history) - 1, max_points).astype(int))
+    return history[index]
+
+def axes_resolution(ax, pixels_per_sample=2, min_resolution=50, max_resolution=400):
+    """
+    Eksenin piksel boyutundan ızgara çözünürlüğünü seçer: uzun kenarda her
+    pixels_per_sample piksele bir nokta, [min_resolution, max_resolution] aralığında.
+    """
+    fig = ax.get_figure()
+    box = ax.get_position()
+    width, height = fig.get_size_inches() * fig.dpi * (box.width, box.height)
+    return int(np.clip(max(width, height) / pixels_per_sample, min_resolution, max_resolution))
+
+def contour_levels(Z, n_levels=20, dynamic_range=1e4):
+    """
+    Izgaranın değer aralığından kontur seviyeleri: Z - Z.min() üzerinde
+    logaritmik aralıklı n_levels seviye (minimumu negatif olan fonksiyonlarda
+    da minimum çevresi çizilir). Aralık tanımsızsa seviye sayısı döndürülür.
+    """
+    finite = Z[np.isfinite(Z)]
+    if finite.size == 0:
+        return n_levels
+    z_min = finite.min()
+    span = finite.max() - z_min
+    if not span > 0:
+        return n_levels
+    return z_min + np.geomspace(span / dynamic_range, span, n_levels)
+
+def draw_contour(ax, func, bounds=(-10, 10, -10, 10), resolution=None):
+    """
+    Amaç fonksiyonunun kontur grafiğini verilen eksene çizer. resolution
+    verilmezse eksenin piksel boyutundan seçilir (bkz. axes_resolution).
+    """
+    if resolution is None:
+        resolution = axes_resolution(ax)
+    X1, X2, Z = contour_grid(func, tuple(bounds), resolution)
+
+    ax.contour(X1, X2, Z, levels=contour_levels(Z), cmap='viridis')
+    ax.set_title('Optimization Path')
+    ax.set_xlabel('x1')
+    ax.set_ylabel('x2')
+
+def plot_optimization(func, history, bounds=None, resolution=None, max_points=2000):
+    """
+    Optimizasyon sürecini görselleştirir.
+
+    Sınırlar verilmezse yolun kutusuna göre, ızgara çözünürlüğü verilmezse
+    figürün piksel boyutuna göre seçilir. Aynı fonksiyon ve
+    sınırlar için değerlendirilmiş ızgara ve (figür açık kaldığı sürece)
+    kontur çizgileri yeniden kullanılır; yalnızca yol güncellenir.
+    """
+    history = downsample_path(np.asarray(history, dtype=float), max_points)
+    if bounds is None:
+        bounds = path_bounds(history)
+    key = (func, tuple(bounds), resolution)
+
+    import matplotlib.pyplot as plt
+
+    for cached_key in [k for k, (fig, _) in _figure_cache.items() if not plt.fignum_exists(fig.number)]:
+        del _figure_cache[cached_key]
+    if key not in _figure_cache:
+        fig = plt.figure()
+        ax = fig.gca()
+        draw_contour(ax, func, bounds, resolution)
+        path_line, = ax.plot([], [], 'ro-', markersize=5)
+        _figure_cache[key] = (fig, path_line)
+
+    fig, path_line = _figure_cache[key]
+    path_line.set_data(history[:, 0], history[:, 1])
+    plt.figure(fig.number)
+    plt.show()
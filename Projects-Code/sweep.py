@@ -0,0 +1,6 @@
+# Bu modül optimization paketine taşındı; eski içe aktarmalar için korunur.
+from optimization.sweep import *  # noqa: F401,F403
+from optimization.sweep import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import math
+import numpy as np
+import pytest
+from optimization import make_gradient
+from optimization.derivatives import complex_step_gradient, reverse_gradient
+
+X = np.array([0.5, -3.0])
+
+
+@pytest.mark.parametrize("func, expected", [
+    (lambda x: np.linalg.norm(x - 1) ** 2, 2 * (X - 1)),
+    (lambda x: math.exp(x[0]) + x[1] ** 2, np.array([math.exp(0.5), -6.0])),
+])
+def test_auto_rejects_methods_that_drop_derivative(func, expected):
+    np.testing.assert_allclose(make_gradient(func)(X), expected, rtol=1e-6)
+
+
+def test_reverse_requires_tape_output():
+    with pytest.raises(TypeError):
+        reverse_gradient(lambda x: float(x.value @ x.value), X)
+
+
+def test_complex_step_requires_complex_output():
+    with pytest.raises(TypeError):
+        complex_step_gradient(lambda x: np.linalg.norm(x) ** 2, X)
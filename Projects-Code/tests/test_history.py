@@ -0,0 +1,18 @@
+import numpy as np
+from optimization import IterationTrace, MemmapHistory, open_history
+
+
+def test_memmap_rerun_keeps_earlier_views_valid(tmp_path):
+    path = tmp_path / "trajectory.npy"
+    trace = IterationTrace(history=MemmapHistory(path, chunk=4))
+    trace.start()
+    for i in range(10):
+        trace.record(i, np.full(3, float(i)))
+    earlier = trace.positions
+
+    trace.start()
+    trace.record(0, np.full(3, -1.0))
+    trace.close()
+
+    np.testing.assert_array_equal(earlier[:, 0], np.arange(10.0))
+    np.testing.assert_array_equal(open_history(path), [[-1.0, -1.0, -1.0]])
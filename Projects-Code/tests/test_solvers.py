@@ -0,0 +1,138 @@
+from functools import partial
+import numpy as np
+import pytest
+from optimization import (IterationTrace, conjugate_beta, fletcher_reeves_method, lbfgs_method, newton_cg_method,
+                          newtons_method, problems, trust_region_newton_method)
+from optimization.cli import run_spec
+from optimization.fletcher_reeves import REASON_GRADIENT, REASON_MAX_ITER, fletcher_reeves_batch
+from optimization.line_search import backtracking_armijo, strong_wolfe
+from optimization.newtons_method import steihaug_cg
+
+X0 = np.array([-1.2, 1.0])
+
+
+@pytest.mark.parametrize("solve", [
+    lambda trace: fletcher_reeves_method(problems.rosenbrock, problems.rosenbrock_gradient, X0, max_iter=0,
+                                         trace=trace),
+    lambda trace: lbfgs_method(problems.rosenbrock, problems.rosenbrock_gradient, X0, max_iter=0, trace=trace),
+    lambda trace: newtons_method(problems.rosenbrock, problems.rosenbrock_gradient, problems.rosenbrock_hessian, X0,
+                                 max_iter=0, trace=trace),
+    lambda trace: newtons_method(problems.rosenbrock, problems.rosenbrock_gradient, problems.rosenbrock_hessian, X0,
+                                 max_iter=0, trace=trace, refactor_every=2),
+    lambda trace: newton_cg_method(problems.rosenbrock, problems.rosenbrock_gradient, X0, max_iter=0, trace=trace),
+    lambda trace: trust_region_newton_method(problems.rosenbrock, problems.rosenbrock_gradient, X0,
+                                             hessian=problems.rosenbrock_hessian, max_iter=0, trace=trace),
+])
+def test_max_iter_zero_returns_start(solve):
+    trace = IterationTrace()
+    x, positions = solve(trace)
+    np.testing.assert_array_equal(x, X0)
+    assert len(positions) == 1
+
+
+@pytest.mark.parametrize("method", ["fletcher_reeves", "lbfgs", "newton", "newton_cg", "trust_region"])
+def test_cli_max_iter_zero(method):
+    result = run_spec({"method": method, "problem": "rosenbrock", "x0": [-1.2, 1.0], "options": {"max_iter": 0}})
+    assert result["status"] == "ok", result.get("message")
+    assert result["iterations"] == 0
+
+
+def test_backtracking_returns_evaluated_step():
+    x, d = np.array([1.0]), np.array([-1.0])
+    alpha, f_new, g_new = backtracking_armijo(lambda z: float(z[0] ** 2), lambda z: 2 * z, x, d, 1.0,
+                                              np.array([2.0]), alpha0=100.0, max_iter=3)
+    assert f_new == (x + alpha * d)[0] ** 2
+    np.testing.assert_array_equal(g_new, 2 * (x + alpha * d))
+
+
+def test_cli_reports_invalid_spec_and_unexpected_errors(monkeypatch):
+    result = run_spec({"method": "lbfgs", "problem": "yok", "x0": [0.0, 0.0]})
+    assert result["status"] == "error" and "traceback" not in result
+
+    def broken(x):
+        raise RuntimeError("hata")
+
+    monkeypatch.setitem(problems.PROBLEMS, "broken", (broken, broken, None))
+    result = run_spec({"method": "lbfgs", "problem": "broken", "x0": [0.0, 0.0]})
+    assert result["status"] == "error"
+    assert "RuntimeError" in result["traceback"]
+
+
+@pytest.mark.parametrize("hessp", [None, lambda x, v: problems.rosenbrock_hessian(x) @ v])
+def test_newton_cg_converges_on_rosenbrock(hessp):
+    trace = IterationTrace()
+    x, _ = newton_cg_method(problems.rosenbrock, problems.rosenbrock_gradient, X0, hessp=hessp, tol=1e-8,
+                            trace=trace)
+    np.testing.assert_allclose(x, [1.0, 1.0], atol=1e-6)
+    assert trace.column("iteration")[-1] < 40
+
+
+def test_fletcher_reeves_batch_masks_converged_rows():
+    X0 = np.array([[-1.0, -1.0], [5.0, 3.0], [-7.0, 2.0]])
+    X, iterations, reasons = fletcher_reeves_batch(problems.function, problems.gradient, X0, line_search="armijo")
+    # (-1, -1) minimum noktasıdır: gradyan testiyle hiç iterasyon yapılmadan kabul edilir
+    assert iterations[0] == 0 and reasons[0] == REASON_GRADIENT
+    assert np.all(iterations[1:] < 100) and np.all(reasons[1:] != REASON_MAX_ITER)
+    for x0, x_batch in zip(X0[1:], X[1:]):
+        x, _ = fletcher_reeves_method(problems.function, problems.gradient, x0, line_search=backtracking_armijo)
+        np.testing.assert_allclose(x_batch, x)
+
+    _, iterations, reasons = fletcher_reeves_batch(problems.function, problems.gradient, X0[1:], max_iter=5)
+    np.testing.assert_array_equal(iterations, 5)
+    np.testing.assert_array_equal(reasons, REASON_MAX_ITER)
+
+
+@pytest.mark.parametrize("line_search", [None, backtracking_armijo])
+def test_newton_trace_rows_describe_recorded_point(line_search):
+    trace = IterationTrace()
+    _, positions = newtons_method(problems.rosenbrock, problems.rosenbrock_gradient, problems.rosenbrock_hessian, X0,
+                                  line_search=line_search, trace=trace)
+    np.testing.assert_allclose(trace.column("f"), [problems.rosenbrock(x) for x in positions])
+    np.testing.assert_allclose(trace.column("grad_norm"),
+                               [np.linalg.norm(problems.rosenbrock_gradient(x)) for x in positions])
+
+
+@pytest.mark.parametrize("method, expected", [
+    ("fr", [1.25, 1.25]), ("pr+", [0.75, 0.75]), ("hs", [1.5, 0.0]), ("dy", [2.5, 0.0]), ("hybrid", [1.5, 0.0]),
+])
+def test_conjugate_beta_formulas(method, expected):
+    # İkinci satırda d.y < 0: HS, DY ve hybrid en dik inişe döner
+    g = np.array([[1.0, 0.0], [1.0, 0.0]])
+    g_new = np.array([[0.5, 1.0], [0.5, 1.0]])
+    d = np.array([[-1.0, 0.0], [1.0, 0.0]])
+    np.testing.assert_allclose(conjugate_beta(method, g_new, g, d), expected)
+
+
+@pytest.mark.parametrize("beta", ["fr", "pr+", "hs", "dy", "hybrid"])
+def test_fletcher_reeves_beta_variants_converge(beta):
+    x, _ = fletcher_reeves_method(problems.rosenbrock, problems.rosenbrock_gradient, X0, tol=1e-6, max_iter=200,
+                                  line_search=partial(strong_wolfe, c2=0.1), beta=beta)
+    np.testing.assert_allclose(x, [1.0, 1.0], atol=1e-4)
+
+
+def test_fletcher_reeves_rejects_unknown_beta():
+    with pytest.raises(ValueError):
+        fletcher_reeves_method(problems.rosenbrock, problems.rosenbrock_gradient, X0, beta="xx")
+
+
+def test_steihaug_cg_respects_radius():
+    h = np.array([[2.0, 0.0], [0.0, 1.0]])
+    g = np.array([-2.0, -1.0])
+    # Newton adımı (1, 1) bölgenin içindeyse aynen döndürülür
+    p, model, info = steihaug_cg(lambda v: h @ v, g, radius=10.0, tol=1e-12)
+    np.testing.assert_allclose(p, [1.0, 1.0])
+    np.testing.assert_allclose(model, g @ p + 0.5 * p @ h @ p)
+    assert not info["boundary"]
+    # Dışındaysa sınırda durulur
+    p, _, info = steihaug_cg(lambda v: h @ v, g, radius=0.5, tol=1e-12)
+    assert info["boundary"] and np.isclose(np.linalg.norm(p), 0.5)
+    # Negatif eğrilikte adım sınıra uzatılır ve modeli azaltır
+    p, model, info = steihaug_cg(lambda v: -h @ v, g, radius=2.0, tol=1e-12)
+    assert info["negative_curvature"] and np.isclose(np.linalg.norm(p), 2.0) and model < 0
+
+
+@pytest.mark.parametrize("radius", [1e-3, 1.0, 100.0])
+def test_trust_region_converges_from_any_initial_radius(radius):
+    x, _ = trust_region_newton_method(problems.rosenbrock, problems.rosenbrock_gradient, X0,
+                                      hessp=lambda x, v: problems.rosenbrock_hessian(x) @ v, radius=radius, tol=1e-8)
+    np.testing.assert_allclose(x, [1.0, 1.0], atol=1e-6)
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from optimization import problems
+from optimization.line_search import backtracking_armijo
+from optimization.sweep import sweep
+
+
+def _fails_far_away(x):
+    if x[1] > 50:
+        raise RuntimeError("hata")
+    return problems.function(x)
+
+
+def test_sweep_marks_failing_runs_and_continues():
+    grid = {"x0": [np.array([-2.0, 1.0]), np.array([0.0, 100.0])], "line_search": [backtracking_armijo]}
+    runs, records = sweep("fletcher_reeves", grid, func=_fails_far_away, grad=problems.gradient, jobs=1)
+    assert len(runs) == 2
+    np.testing.assert_array_equal(records["failed"], [False, True])
+    assert np.isfinite(records["f"][0]) and np.isnan(records["f"][1])
+
+
+@pytest.mark.parametrize("grid", [{"x0": []}, {"tol": 1e-5}, {"step_size": [0.1]}])
+def test_sweep_rejects_invalid_grid(grid):
+    with pytest.raises(ValueError):
+        sweep("fletcher_reeves", grid, jobs=1)
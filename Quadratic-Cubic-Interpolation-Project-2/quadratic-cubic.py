@@ -1,9 +1,12 @@
+import math
 import numpy as np
 
 
 EPSILON = 1e-10
+SQRT_EPSILON = math.sqrt(np.finfo(float).eps)
+GOLDEN_SECTION = (3 - math.sqrt(5)) / 2  # Altın oran adım kesri (~0.381966)
 
-def quadratic_interpolation(f, x0, x1, x2, tolerance=1e-5, max_iter=100):
+def quadratic_interpolation(f, x0, x1, x2, tolerance=1e-5, max_iter=100, verbose=True, trace=None):
     """
     Quadratic Interpolation yöntemi ile unimodal bir fonksiyonun minimumunu bulur.
 
@@ -12,17 +15,22 @@ def quadratic_interpolation(f, x0, x1, x2, tolerance=1e-5, max_iter=100):
     x0, x1, x2: Başlangıç noktaları (farklı olmalıdır ve aralığı kapsamalıdır).
     tolerance: Yakınsama kriteri, minimum x ve f değerleri için fark.
     max_iter: Maksimum iterasyon sayısı.
+    verbose: İterasyon detaylarını yazdırmak için.
+    trace: İterasyonları kaydetmek için isteğe bağlı kayıtçı (örn. IterationTrace).
 
     Döndürür:
     Minimum nokta tahmini (float).
     """
-    print("==== Quadratic Interpolation Başladı ====")
-    print(f"Başlangıç noktaları: x0={x0}, x1={x1}, x2={x2}\n")
+    if verbose:
+        print("==== Quadratic Interpolation Başladı ====")
+        print(f"Başlangıç noktaları: x0={x0}, x1={x1}, x2={x2}\n")
+
+    # Fonksiyon değerleri bir kez hesaplanır, sonraki iterasyonlara taşınır
+    f0, f1, f2 = f(x0), f(x1), f(x2)
 
     for iteration in range(max_iter):
-        # Verilen noktalardaki fonksiyon değerlerini hesapla
-        f0, f1, f2 = f(x0), f(x1), f(x2)
-        print(f"Iterasyon {iteration + 1}: f(x0)={f0:.6f}, f(x1)={f1:.6f}, f(x2)={f2:.6f}")
+        if verbose:
+            print(f"Iterasyon {iteration + 1}: f(x0)={f0:.6f}, f(x1)={f1:.6f}, f(x2)={f2:.6f}")
 
         # Parabolün katsayılarını hesapla
         try:
@@ -35,36 +43,190 @@ def quadratic_interpolation(f, x0, x1, x2, tolerance=1e-5, max_iter=100):
             # Minimum tahmini x değerini hesapla
             x_min = 0.5 * (numerator / denominator)
             f_min = f(x_min)
-            print(f"Tahmini minimum: x_min={x_min:.6f}, f(x_min)={f_min:.6f}")
+            if verbose:
+                print(f"Tahmini minimum: x_min={x_min:.6f}, f(x_min)={f_min:.6f}")
+            if trace is not None:
+                trace.record(iteration + 1, x_min, f_min, step=abs(x2 - x0))
         except ZeroDivisionError:
-            print("Sayısal problem nedeniyle sıfıra bölme hatası oluştu, iterasyon durduruluyor.")
+            if verbose:
+                print("Sayısal problem nedeniyle sıfıra bölme hatası oluştu, iterasyon durduruluyor.")
             return None
 
         # Yakınsama kontrolü
         if abs(x_min - x1) < tolerance and abs(f_min - f1) < tolerance:
-            print(f"{iteration + 1}. iterasyonda {x_min:.6f} değerine yakınsandı.\n")
+            if verbose:
+                print(f"{iteration + 1}. iterasyonda {x_min:.6f} değerine yakınsandı.\n")
             return x_min
 
         # Aralığı daraltarak yeni noktaları güncelle
         if x_min < x1:
             if f_min < f1:
                 x2, x1 = x1, x_min
+                f2, f1 = f1, f_min
             else:
-                x0 = x_min
+                x0, f0 = x_min, f_min
         else:
             if f_min < f1:
                 x0, x1 = x1, x_min
+                f0, f1 = f1, f_min
             else:
-                x2 = x_min
+                x2, f2 = x_min, f_min
 
         # Aralık ve noktaların güncellenmesi hakkında detaylı bilgi yazdır
-        print(f"Yeni noktalar: x0={x0}, x1={x1}, x2={x2}")
-        print(f"Aralık boyutları: |x2 - x0| = {abs(x2 - x0):.6f}\n")
+        if verbose:
+            print(f"Yeni noktalar: x0={x0}, x1={x1}, x2={x2}")
+            print(f"Aralık boyutları: |x2 - x0| = {abs(x2 - x0):.6f}\n")
 
-    print("Maksimum iterasyon sayısına ulaşıldı, yakınsama sağlanamadı.\n")
+    if verbose:
+        print("Maksimum iterasyon sayısına ulaşıldı, yakınsama sağlanamadı.\n")
     return x1
 
-def cubic_interpolation(f, x0, x1, x2, x3, tolerance=1e-5, max_iter=100):
+def cubic_minimizer(x0, x1, x2, x3, f0, f1, f2, f3):
+    """
+    Dört noktadan geçen kübik polinomun yerel minimumunu bölünmüş farklar ile
+    kapalı biçimde hesaplar (yalnızca float aritmetiği, matris çözümü yok).
+
+    Döndürür:
+    Kübiğin yerel minimum noktası; minimum yoksa None.
+    """
+    # Newton bölünmüş farkları
+    d01 = (f1 - f0) / (x1 - x0)
+    d12 = (f2 - f1) / (x2 - x1)
+    d23 = (f3 - f2) / (x3 - x2)
+    d012 = (d12 - d01) / (x2 - x0)
+    d123 = (d23 - d12) / (x3 - x1)
+    d0123 = (d123 - d012) / (x3 - x0)
+
+    # p'(x1 + t) = A t^2 + B t + C
+    h0, h2 = x1 - x0, x2 - x1
+    A = 3 * d0123
+    B = 2 * d012 + 2 * d0123 * (h0 - h2)
+    C = d01 + d012 * h0 - d0123 * h0 * h2
+
+    # p''(t) = 2At + B > 0 olan kök: t = (-B + sqrt(D)) / 2A = -2C / (B + sqrt(D))
+    discriminant = B * B - 4 * A * C
+    if discriminant < 0:
+        return None
+    root = math.sqrt(discriminant)
+    if B > 0:
+        t = -2 * C / (B + root)
+    elif A != 0:
+        t = (root - B) / (2 * A)
+    else:
+        return None
+    return x1 + t
+
+def hermite_cubic_step(a, fa, dfa, b, fb, dfb):
+    """
+    İki uçtaki f ve f' değerlerini kullanan Hermite kübiğinin minimum noktası
+    (Moré-Thuente tipi doğrusal aramalardaki kübik adım).
+
+    Döndürür:
+    Kübiğin yerel minimum noktası; minimum yoksa None.
+    """
+    d1 = dfa + dfb - 3 * (fa - fb) / (a - b)
+    radicand = d1 * d1 - dfa * dfb
+    if radicand < 0:
+        return None
+    d2 = math.copysign(math.sqrt(radicand), b - a)
+    denominator = dfb - dfa + 2 * d2
+    if denominator == 0:
+        return None
+    return b - (b - a) * (dfb + d2 - d1) / denominator
+
+def hermite_cubic_search(f, df, a, b, tolerance=1e-5, max_iter=100, verbose=True, trace=None):
+    """
+    İki noktalı Hermite kübik interpolasyonu ile minimum arar.
+
+    Aralık uçlarında türevin işareti farklı olmalıdır (f'(a) < 0 < f'(b)).
+    Kübik adım aralığın dışına düşerse veya uçlara çok yaklaşırsa ikiye
+    bölme adımı kullanılır.
+
+    Parametreler:
+    f: Minimumu bulunacak hedef fonksiyon.
+    df: Hedef fonksiyonun türevi.
+    a, b: Aralığın uçları.
+    tolerance: Yakınsama kriteri, aralık genişliği ve türev için.
+    max_iter: Maksimum iterasyon sayısı.
+    verbose: İterasyon detaylarını yazdırmak için.
+    trace: İterasyonları kaydetmek için isteğe bağlı kayıtçı (örn. IterationTrace).
+
+    Döndürür:
+    Minimum nokta tahmini (float).
+    """
+    fa, dfa = f(a), df(a)
+    fb, dfb = f(b), df(b)
+    if dfa * dfb > 0:
+        raise ValueError("Aralık uçlarında türevin işareti farklı olmalıdır.")
+
+    if verbose:
+        print("==== Hermite Cubic Search Başladı ====")
+        print(f"Başlangıç aralığı: a={a}, b={b}\n")
+
+    x = a if fa <= fb else b
+    for iteration in range(max_iter):
+        u = hermite_cubic_step(a, fa, dfa, b, fb, dfb)
+        margin = 0.1 * abs(b - a)
+        if u is None or not min(a, b) + margin <= u <= max(a, b) - margin:
+            u = 0.5 * (a + b)
+        fu, dfu = f(u), df(u)
+        x = u
+
+        if verbose:
+            print(f"Iterasyon {iteration + 1}: u={u:.6f}, f(u)={fu:.6f}, f'(u)={dfu:.6f}")
+        if trace is not None:
+            trace.record(iteration + 1, u, fu, abs(dfu), abs(b - a))
+
+        # Türevin işaret değiştirdiği aralık korunur
+        if dfu * dfa > 0:
+            a, fa, dfa = u, fu, dfu
+        else:
+            b, fb, dfb = u, fu, dfu
+
+        if abs(dfu) < tolerance or abs(b - a) < tolerance:
+            if verbose:
+                print(f"{iteration + 1}. iterasyonda {x:.6f} değerine yakınsandı.\n")
+            return x
+
+    if verbose:
+        print("Maksimum iterasyon sayısına ulaşıldı, yakınsama sağlanamadı.\n")
+    return x
+
+def _vandermonde_minimum(f, x0, x1, x2, x3, f0, f1, f2, f3):
+    """
+    Kübik katsayıları 4x4 Vandermonde sistemi ile çözer ve aralıktaki kritik
+    noktalardan en küçük f değerine sahip olanı döndürür.
+    """
+    # Katsayı matrisi ve sonucu oluştur
+    A = np.array([
+        [x0**3, x0**2, x0, 1],
+        [x1**3, x1**2, x1, 1],
+        [x2**3, x2**2, x2, 1],
+        [x3**3, x3**2, x3, 1]
+    ])
+    b = np.array([f0, f1, f2, f3])
+
+    # Katsayıları çöz
+    coeffs = np.linalg.solve(A, b)
+
+    # Polinomun türevinin kökleri
+    a, b, c, d = coeffs
+    critical_points = np.roots([3 * a, 2 * b, c])
+
+    # Kritik noktaları değerlendir
+    x_min = None
+    min_value = float('inf')
+    for root in critical_points:
+        if np.isreal(root) and x0 < root < x3:
+            real_root = np.real(root)
+            f_root = f(real_root)
+            if f_root < min_value:
+                x_min = real_root
+                min_value = f_root
+    return x_min, min_value
+
+def cubic_interpolation(f, x0, x1, x2, x3, tolerance=1e-5, max_iter=100, verbose=True, method="vandermonde",
+                        trace=None):
     """
     Cubic Interpolation yöntemi ile unimodal bir fonksiyonun minimumunu bulur.
 
@@ -73,90 +235,384 @@ def cubic_interpolation(f, x0, x1, x2, x3, tolerance=1e-5, max_iter=100):
     x0, x1, x2, x3: Başlangıç noktaları (farklı ve aralığı kapsayan).
     tolerance: Yakınsama kriteri, minimum x ve f değerleri için fark.
     max_iter: Maksimum iterasyon sayısı.
+    verbose: İterasyon detaylarını yazdırmak için.
+    method: "vandermonde" (4x4 sistem çözümü ve np.roots) veya
+        "divided_differences" (kapalı biçimli minimum, bkz. cubic_minimizer).
+    trace: İterasyonları kaydetmek için isteğe bağlı kayıtçı (örn. IterationTrace).
 
     Döndürür:
     Minimum nokta tahmini (float).
     """
-    print("==== Cubic Interpolation Başladı ====")
-    print(f"Başlangıç noktaları: x0={x0}, x1={x1}, x2={x2}, x3={x3}\n")
+    if verbose:
+        print("==== Cubic Interpolation Başladı ====")
+        print(f"Başlangıç noktaları: x0={x0}, x1={x1}, x2={x2}, x3={x3}\n")
 
-    for iteration in range(max_iter):
-        # Verilen noktalardaki fonksiyon değerlerini hesapla
-        f0, f1, f2, f3 = f(x0), f(x1), f(x2), f(x3)
-        print(f"Iterasyon {iteration + 1}: f(x0)={f0:.6f}, f(x1)={f1:.6f}, f(x2)={f2:.6f}, f(x3)={f3:.6f}")
-
-        # Katsayı matrisi ve sonucu oluştur
-        A = np.array([
-            [x0**3, x0**2, x0, 1],
-            [x1**3, x1**2, x1, 1],
-            [x2**3, x2**2, x2, 1],
-            [x3**3, x3**2, x3, 1]
-        ])
-        b = np.array([f0, f1, f2, f3])
+    if method not in ("vandermonde", "divided_differences"):
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
 
-        try:
-            # Katsayıları çöz
-            coeffs = np.linalg.solve(A, b)
-        except np.linalg.LinAlgError:
-            print("Üçüncü dereceden katsayılar çözülürken tekil matrisle karşılaşıldı. Tekrar deneyin veya başlangıç noktalarını değiştirin.")
-            return None
+    # Fonksiyon değerleri bir kez hesaplanır, sonraki iterasyonlara taşınır
+    f0, f1, f2, f3 = f(x0), f(x1), f(x2), f(x3)
+
+    for iteration in range(max_iter):
+        if verbose:
+            print(f"Iterasyon {iteration + 1}: f(x0)={f0:.6f}, f(x1)={f1:.6f}, f(x2)={f2:.6f}, f(x3)={f3:.6f}")
 
-        # Polinomun türevini al
-        a, b, c, d = coeffs
-        derivative = lambda x: 3 * a * x**2 + 2 * b * x + c
-        critical_points = np.roots([3 * a, 2 * b, c])
-
-        # Kritik noktaları değerlendir
-        x_min = None
-        min_value = float('inf')
-        for root in critical_points:
-            if np.isreal(root) and x0 < root < x3:
-                real_root = np.real(root)
-                f_root = f(real_root)
-                if f_root < min_value:
-                    x_min = real_root
-                    min_value = f_root
+        if method == "divided_differences":
+            x_min = cubic_minimizer(x0, x1, x2, x3, f0, f1, f2, f3)
+            if x_min is not None and x0 < x_min < x3:
+                min_value = f(x_min)
+            else:
+                x_min = None
+        else:
+            try:
+                x_min, min_value = _vandermonde_minimum(f, x0, x1, x2, x3, f0, f1, f2, f3)
+            except np.linalg.LinAlgError:
+                if verbose:
+                    print("Üçüncü dereceden katsayılar çözülürken tekil matrisle karşılaşıldı. Tekrar deneyin veya başlangıç noktalarını değiştirin.")
+                return None
 
         if x_min is None:
-            print("Geçerli bir minimum bulunamadı.\n")
+            if verbose:
+                print("Geçerli bir minimum bulunamadı.\n")
             return None
 
-        print(f"Tahmini minimum: x_min={x_min:.6f}, f(x_min)={min_value:.6f}")
+        if verbose:
+            print(f"Tahmini minimum: x_min={x_min:.6f}, f(x_min)={min_value:.6f}")
+        if trace is not None:
+            trace.record(iteration + 1, x_min, min_value, step=abs(x3 - x0))
 
         # Yakınsama kontrolü
         if abs(x_min - x1) < tolerance and abs(min_value - f1) < tolerance:
-            print(f"{iteration + 1}. iterasyonda {x_min:.6f} değerine yakınsandı.\n")
+            if verbose:
+                print(f"{iteration + 1}. iterasyonda {x_min:.6f} değerine yakınsandı.\n")
             return x_min
 
         # Aralık güncelle
         if x_min < x1:
             if min_value < f1:
                 x3, x2, x1 = x2, x1, x_min
+                f3, f2, f1 = f2, f1, min_value
             else:
-                x0 = x_min
+                x0, f0 = x_min, min_value
         else:
             if min_value < f1:
-                x0, x1, x2 = x1, x_min, x2
+                x0, x1 = x1, x_min
+                f0, f1 = f1, min_value
             else:
-                x3 = x_min
+                x3, f3 = x_min, min_value
 
         # Aralık ve noktaların güncellenmesi hakkında detaylı bilgi yazdır
-        print(f"Yeni noktalar: x0={x0}, x1={x1}, x2={x2}, x3={x3}")
-        print(f"Aralık boyutları: |x3 - x0| = {abs(x3 - x0):.6f}\n")
+        if verbose:
+            print(f"Yeni noktalar: x0={x0}, x1={x1}, x2={x2}, x3={x3}")
+            print(f"Aralık boyutları: |x3 - x0| = {abs(x3 - x0):.6f}\n")
 
-    print("Maksimum iterasyon sayısına ulaşıldı, yakınsama sağlanamadı.\n")
+    if verbose:
+        print("Maksimum iterasyon sayısına ulaşıldı, yakınsama sağlanamadı.\n")
     return x1
 
+def brent_minimize(f, x0, x1, x2, tolerance=1e-5, max_iter=100, verbose=True, trace=None):
+    """
+    Brent yöntemi ile unimodal bir fonksiyonun minimumunu bulur.
+
+    Parabolik interpolasyon adımları, yalnızca güvenli olduklarında (aralık
+    içinde kalan ve yeterince küçülen adımlar) kullanılır; aksi halde altın oran
+    adımı atılır. Böylece en kötü durumda altın oran aramasının yakınsaması,
+    düzgün fonksiyonlarda ise süper-lineer yakınsama elde edilir.
+
+    Parametreler:
+    f: Minimumu bulunacak hedef fonksiyon.
+    x0, x1, x2: Başlangıç noktaları, x0 < x1 < x2 (x1 en iyi tahmin).
+    tolerance: Yakınsama kriteri, minimum noktası için aralık genişliği.
+    max_iter: Maksimum iterasyon sayısı.
+    verbose: İterasyon detaylarını yazdırmak için.
+    trace: İterasyonları kaydetmek için isteğe bağlı kayıtçı (örn. IterationTrace).
+
+    Döndürür:
+    Minimum nokta tahmini (float).
+    """
+    a, b = min(x0, x2), max(x0, x2)
+    if not a < x1 < b:
+        raise ValueError("Geçersiz başlangıç: x1, x0 ile x2 arasında olmalıdır.")
+
+    if verbose:
+        print("==== Brent Yöntemi Başladı ====")
+        print(f"Başlangıç noktaları: x0={x0}, x1={x1}, x2={x2}\n")
+
+    # x: en iyi nokta, w: ikinci en iyi, v: önceki w
+    x = w = v = x1
+    fx = fw = fv = f(x)
+    d = e = 0.0
+
+    for iteration in range(max_iter):
+        xm = 0.5 * (a + b)
+        tol1 = SQRT_EPSILON * abs(x) + tolerance / 2
+        tol2 = 2 * tol1
+
+        # Yakınsama kontrolü
+        if abs(x - xm) <= tol2 - 0.5 * (b - a):
+            if verbose:
+                print(f"{iteration + 1}. iterasyonda {x:.6f} değerine yakınsandı.\n")
+            return x
+
+        parabolic = False
+        if abs(e) > tol1:
+            # x, w, v noktalarından geçen parabolün minimumuna adım
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            e_prev, e = e, d
+            if abs(p) < abs(0.5 * q * e_prev) and q * (a - x) < p < q * (b - x):
+                d = p / q
+                u = x + d
+                if u - a < tol2 or b - u < tol2:
+                    d = math.copysign(tol1, xm - x)
+                parabolic = True
+
+        if not parabolic:
+            # Altın oran adımı, büyük olan alt aralığa doğru
+            e = (a - x) if x >= xm else (b - x)
+            d = GOLDEN_SECTION * e
+
+        u = x + d if abs(d) >= tol1 else x + math.copysign(tol1, d)
+        fu = f(u)
+
+        if verbose:
+            step = "parabolik" if parabolic else "altın oran"
+            print(f"Iterasyon {iteration + 1}: u={u:.6f}, f(u)={fu:.6f}, adım={step}, aralık=[{a:.6f}, {b:.6f}]")
+        if trace is not None:
+            trace.record(iteration + 1, u, fu, step=b - a)
+
+        # Aralık ve en iyi üç noktanın güncellenmesi
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+
+    if verbose:
+        print("Maksimum iterasyon sayısına ulaşıldı, yakınsama sağlanamadı.\n")
+    return x
+
+def brent_minimize_derivative(f, df, x0, x1, x2, tolerance=1e-5, max_iter=100, verbose=True, trace=None):
+    """
+    Türev bilgisini kullanan Brent yöntemi ile unimodal bir fonksiyonun minimumunu bulur.
+
+    Türevlerin sekant ekstrapolasyonu ile bulunan adımlar aralık içinde kalıp
+    yeterince küçüldüğünde kullanılır; aksi halde türevin işaretine göre aralık
+    ikiye bölünür.
+
+    Parametreler:
+    f: Minimumu bulunacak hedef fonksiyon.
+    df: Hedef fonksiyonun türevi.
+    x0, x1, x2: Başlangıç noktaları, x0 < x1 < x2 (x1 en iyi tahmin).
+    tolerance: Yakınsama kriteri, minimum noktası için aralık genişliği.
+    max_iter: Maksimum iterasyon sayısı.
+    verbose: İterasyon detaylarını yazdırmak için.
+    trace: İterasyonları kaydetmek için isteğe bağlı kayıtçı (örn. IterationTrace).
+
+    Döndürür:
+    Minimum nokta tahmini (float).
+    """
+    a, b = min(x0, x2), max(x0, x2)
+    if not a < x1 < b:
+        raise ValueError("Geçersiz başlangıç: x1, x0 ile x2 arasında olmalıdır.")
+
+    if verbose:
+        print("==== Türevli Brent Yöntemi Başladı ====")
+        print(f"Başlangıç noktaları: x0={x0}, x1={x1}, x2={x2}\n")
+
+    x = w = v = x1
+    fx = fw = fv = f(x)
+    dx = dw = dv = df(x)
+    d = e = 0.0
+
+    for iteration in range(max_iter):
+        xm = 0.5 * (a + b)
+        tol1 = SQRT_EPSILON * abs(x) + tolerance / 2
+        tol2 = 2 * tol1
+
+        # Yakınsama kontrolü
+        if abs(x - xm) <= tol2 - 0.5 * (b - a):
+            if verbose:
+                print(f"{iteration + 1}. iterasyonda {x:.6f} değerine yakınsandı.\n")
+            return x
+
+        secant = False
+        if abs(e) > tol1:
+            # w ve v noktalarındaki türevlerle iki sekant adımı
+            d1 = d2 = 2 * (b - a)
+            if dw != dx:
+                d1 = (w - x) * dx / (dx - dw)
+            if dv != dx:
+                d2 = (v - x) * dx / (dx - dv)
+            ok1 = a < x + d1 < b and dx * d1 <= 0
+            ok2 = a < x + d2 < b and dx * d2 <= 0
+            e_prev, e = e, d
+            if ok1 or ok2:
+                if ok1 and ok2:
+                    d = d1 if abs(d1) < abs(d2) else d2
+                else:
+                    d = d1 if ok1 else d2
+                if abs(d) <= abs(0.5 * e_prev):
+                    u = x + d
+                    if u - a < tol2 or b - u < tol2:
+                        d = math.copysign(tol1, xm - x)
+                    secant = True
+
+        if not secant:
+            # Türevin işaretine göre ikiye bölme adımı
+            e = (a - x) if dx >= 0 else (b - x)
+            d = 0.5 * e
+
+        if abs(d) >= tol1:
+            u = x + d
+            fu = f(u)
+        else:
+            u = x + math.copysign(tol1, d)
+            fu = f(u)
+            if fu > fx:
+                # Minimum adımı bile fonksiyonu artırıyorsa x minimumdur
+                if verbose:
+                    print(f"{iteration + 1}. iterasyonda {x:.6f} değerine yakınsandı.\n")
+                return x
+        du = df(u)
+
+        if verbose:
+            step = "sekant" if secant else "ikiye bölme"
+            print(f"Iterasyon {iteration + 1}: u={u:.6f}, f(u)={fu:.6f}, f'(u)={du:.6f}, adım={step}")
+        if trace is not None:
+            trace.record(iteration + 1, u, fu, abs(du), b - a)
+
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, fv, dv = w, fw, dw
+            w, fw, dw = x, fx, dx
+            x, fx, dx = u, fu, du
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, fv, dv = w, fw, dw
+                w, fw, dw = u, fu, du
+            elif fu < fv or v == x or v == w:
+                v, fv, dv = u, fu, du
+
+    if verbose:
+        print("Maksimum iterasyon sayısına ulaşıldı, yakınsama sağlanamadı.\n")
+    return x
+
+def benchmark_evaluations(cases):
+    """
+    Verilen test durumları için yöntemlerin fonksiyon (ve türev) değerlendirme
+    sayılarını karşılaştırır.
+
+    cases: (ad, f, df, kuadratik noktalar, kübik noktalar, brent noktaları) demetleri.
+    optimization paketi içe aktarılamıyorsa karşılaştırma atlanır.
+    """
+    try:
+        from optimization import EvaluationCache
+    except ImportError:
+        print("optimization paketi bulunamadı (Projects-Code), değerlendirme karşılaştırması atlandı.")
+        return
+
+    print(f"{'Fonksiyon':<22}{'Yöntem':<22}{'x_min':>12}{'f çağrısı':>12}{'f değer.':>10}{'df değer.':>10}")
+    for name, f, df, quad_points, cubic_points, brent_points in cases:
+        runs = [
+            ("quadratic", lambda cf, cdf: quadratic_interpolation(cf, *quad_points, verbose=False)),
+            ("cubic", lambda cf, cdf: cubic_interpolation(cf, *cubic_points, verbose=False)),
+            ("brent", lambda cf, cdf: brent_minimize(cf, *brent_points, verbose=False)),
+            ("brent (türevli)", lambda cf, cdf: brent_minimize_derivative(cf, cdf, *brent_points, verbose=False)),
+        ]
+        for method, run in runs:
+            cached_f, cached_df = EvaluationCache(f), EvaluationCache(df)
+            try:
+                x_min = run(cached_f, cached_df)
+            except ValueError:
+                x_min = None
+            x_text = "başarısız" if x_min is None else f"{x_min:.6f}"
+            print(f"{name:<22}{method:<22}{x_text:>12}{cached_f.stats()['calls']:>12}"
+                  f"{cached_f.evaluations:>10}{cached_df.evaluations:>10}")
+
+def benchmark_cubic_modes(f, df, points, number=2000):
+    """
+    Kübik interpolasyonun Vandermonde, bölünmüş farklar ve Hermite
+    sürümleri için tek adım ve tam çalışma sürelerini karşılaştırır.
+
+    points: Kübik interpolasyon için dört başlangıç noktası (x0 < x1 < x2 < x3).
+    """
+    import timeit
+
+    x0, x1, x2, x3 = points
+    values = [f(x) for x in points]
+    timings = [
+        ("adım: vandermonde", lambda: _vandermonde_minimum(f, *points, *values)),
+        ("adım: bölünmüş farklar", lambda: cubic_minimizer(*points, *values)),
+        ("adım: hermite", lambda: hermite_cubic_step(x0, values[0], df(x0), x3, values[3], df(x3))),
+        ("çalışma: vandermonde", lambda: cubic_interpolation(f, *points, verbose=False)),
+        ("çalışma: bölünmüş farklar",
+         lambda: cubic_interpolation(f, *points, verbose=False, method="divided_differences")),
+        ("çalışma: hermite", lambda: hermite_cubic_search(f, df, x0, x3, verbose=False)),
+    ]
+    for name, run in timings:
+        seconds = min(timeit.repeat(run, number=number, repeat=3)) / number
+        print(f"{name:<28}{seconds * 1e6:>10.2f} µs")
+
 # Test fonksiyonu ve başlangıç noktaları
 if __name__ == "__main__":
+    # optimization paketi (Projects-Code) yoksa önbelleksiz fonksiyonlar kullanılır
+    try:
+        from optimization import EvaluationCache
+    except ImportError:
+        EvaluationCache = None
+
     def test_function(x):
         return x**2 - 4*x + 4  # Minimum noktası x=2 olan bir parabol
 
     print("Quadratic Test:")
-    quadratic_interpolation(test_function, 0, 2, 4)
+    cached_test_function = test_function if EvaluationCache is None else EvaluationCache(test_function)
+    quadratic_interpolation(cached_test_function, 0, 2, 4)
+    if EvaluationCache is not None:
+        print(f"Fonksiyon değerlendirmeleri: {cached_test_function.stats()}")
 
     print("\nCubic Test:")
     def cubic_test_function(x):
         return x**3 - 6*x**2 + 9*x + 1  # Minimum x ~ 1
 
-    cubic_interpolation(cubic_test_function, 0, 1, 2, 3)
+    cached_cubic_test_function = cubic_test_function if EvaluationCache is None else EvaluationCache(cubic_test_function)
+    cubic_interpolation(cached_cubic_test_function, 0, 1, 2, 3)
+    if EvaluationCache is not None:
+        print(f"Fonksiyon değerlendirmeleri: {cached_cubic_test_function.stats()}")
+
+    print("\nBrent Test:")
+    brent_minimize(test_function, 0, 1, 4)
+
+    print("\nFonksiyon Değerlendirme Karşılaştırması:")
+    benchmark_evaluations([
+        ("x^2 - 4x + 4", test_function, lambda x: 2*x - 4, (0, 2, 4), (0, 1, 3, 4), (0, 2, 4)),
+        ("x^2 - 4x + 4 (kaymış)", test_function, lambda x: 2*x - 4, (0, 1, 4), (0, 1, 3, 4), (0, 1, 4)),
+        ("x^3 - 6x^2 + 9x + 1", cubic_test_function, lambda x: 3*x**2 - 12*x + 9, (2, 2.5, 4), (2, 2.5, 3.5, 4), (2, 2.5, 4)),
+    ])
+
+    print("\nKübik Adım Mikro Karşılaştırması:")
+    benchmark_cubic_modes(cubic_test_function, lambda x: 3*x**2 - 12*x + 9, (2, 2.5, 3.5, 4))